@@ -0,0 +1,85 @@
+"""
+Startup benchmark for the ``dbl-operator`` entry point.
+
+Runs ``python -X importtime -c "import dbl_operator.app_cli"`` in fresh
+interpreters, reports the cumulative import cost of the CLI module and
+fails if it exceeds the budget or if modules that should only load on
+dispatch (httpx, projections, the HTTP client) were imported eagerly.
+
+Usage:
+    python benchmarks/startup_importtime.py [--budget-ms 30] [--runs 5]
+"""
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+
+TARGET = "dbl_operator.app_cli"
+DEFERRED_PREFIXES = (
+    "httpx",
+    "dbl_operator.http_gateway_client",
+    "dbl_operator.projections",
+    "dbl_operator.commands.",
+)
+
+
+def _parse_importtime(stderr: str) -> list[tuple[int, int, str]]:
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, self_us, cumulative_us, name = (part.strip() for part in line.replace("import time:", "|", 1).split("|"))
+        rows.append((int(self_us), int(cumulative_us), name))
+    return rows
+
+
+def _measure_once() -> list[tuple[int, int, str]]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {TARGET}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return _parse_importtime(proc.stderr)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget-ms", type=float, default=30.0, help="Cumulative import budget for the CLI (default: 30)")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to sample; the fastest run is reported")
+    parser.add_argument("--top", type=int, default=10, help="Number of most expensive modules to list")
+    args = parser.parse_args()
+
+    best: list[tuple[int, int, str]] | None = None
+    best_us = None
+    for _ in range(max(1, args.runs)):
+        rows = _measure_once()
+        target_us = next((cum for _, cum, name in rows if name == TARGET), None)
+        if target_us is None:
+            print(f"{TARGET} did not appear in -X importtime output", file=sys.stderr)
+            return 2
+        if best_us is None or target_us < best_us:
+            best, best_us = rows, target_us
+
+    assert best is not None and best_us is not None
+    print(f"{TARGET}: {best_us / 1000.0:.1f} ms cumulative (budget {args.budget_ms:.1f} ms, best of {args.runs})")
+    print("")
+    print(f"{'Module':<48} | {'Self ms':>8} | {'Cumul ms':>8}")
+    print("-" * 70)
+    for self_us, cum_us, name in sorted(best, key=lambda r: r[0], reverse=True)[: args.top]:
+        print(f"{name.strip():<48} | {self_us / 1000.0:8.2f} | {cum_us / 1000.0:8.2f}")
+
+    eager = sorted({name.strip() for _, _, name in best if name.strip().startswith(DEFERRED_PREFIXES)})
+    failed = False
+    if eager:
+        print(f"\nFAIL: deferred modules imported at startup: {eager}")
+        failed = True
+    if best_us / 1000.0 > args.budget_ms:
+        print(f"\nFAIL: startup import cost exceeds budget ({best_us / 1000.0:.1f} ms > {args.budget_ms:.1f} ms)")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
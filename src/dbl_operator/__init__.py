@@ -1,18 +1,24 @@
-from .context_declarer import ContextDeclarer
-from .domain_types import (
-    Anchors,
-    AuditEventViewModel,
-    ContextRef,
-    ContextSpec,
-    DecisionViewModel,
-    DomainAction,
-    GatewayAck,
-    IntentEnvelope,
-    TurnSummary,
-)
-from .gateway_client import FakeGatewayClient, GatewayClient
-from .http_gateway_client import HttpGatewayClient
-from .intent_composer import IntentComposer
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .context_declarer import ContextDeclarer
+    from .domain_types import (
+        Anchors,
+        AuditEventViewModel,
+        ContextRef,
+        ContextSpec,
+        DecisionViewModel,
+        DomainAction,
+        GatewayAck,
+        IntentEnvelope,
+        Partition,
+        TurnSummary,
+    )
+    from .gateway_client import FakeGatewayClient, GatewayClient
+    from .http_gateway_client import HttpGatewayClient
+    from .intent_composer import IntentComposer
 
 __all__ = [
     "Anchors",
@@ -28,5 +34,41 @@ __all__ = [
     "HttpGatewayClient",
     "IntentComposer",
     "IntentEnvelope",
+    "Partition",
     "TurnSummary",
 ]
+
+# Public names are resolved on first access so that importing the package
+# (and with it the CLI entry point) does not pay for httpx or dataclass setup.
+_LAZY_ATTRS = {
+    "Anchors": ".domain_types",
+    "AuditEventViewModel": ".domain_types",
+    "ContextDeclarer": ".context_declarer",
+    "ContextRef": ".domain_types",
+    "ContextSpec": ".domain_types",
+    "DecisionViewModel": ".domain_types",
+    "DomainAction": ".domain_types",
+    "FakeGatewayClient": ".gateway_client",
+    "GatewayAck": ".domain_types",
+    "GatewayClient": ".gateway_client",
+    "HttpGatewayClient": ".http_gateway_client",
+    "IntentComposer": ".intent_composer",
+    "IntentEnvelope": ".domain_types",
+    "Partition": ".domain_types",
+    "TurnSummary": ".domain_types",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,20 +1,75 @@
 from __future__ import annotations
 
 import argparse
+import importlib
 import os
-import re
 import sys
-import time
-import httpx
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from .gateway_client import GatewayClient
+
+CommandHandler = Callable[["GatewayClient", argparse.Namespace], None]
+
+# Subcommand -> "module:function". Handler modules (and their httpx,
+# presenter and projection imports) are only loaded when dispatched.
+COMMANDS: dict[str, str] = {
+    "send-intent": "dbl_operator.commands.intents:send_intent",
+    "thread-view": "dbl_operator.commands.views:thread_view",
+    "decision-view": "dbl_operator.commands.views:decision_view",
+    "audit-view": "dbl_operator.commands.views:audit_view",
+    "tail": "dbl_operator.commands.tail:tail_view",
+    "replay": "dbl_operator.commands.tail:tail_view",
+    "integrity": "dbl_operator.commands.projections:integrity_view",
+    "latency": "dbl_operator.commands.projections:latency_view",
+    "policy-map": "dbl_operator.commands.projections:policy_map_view",
+    "stats": "dbl_operator.commands.projections:stats_view",
+    "failures": "dbl_operator.commands.projections:failures_view",
+    "serve-metrics": "dbl_operator.commands.metrics:serve_metrics",
+    "top": "dbl_operator.commands.top:top_view",
+    "export": "dbl_operator.commands.export:export_ledger",
+}
+
+
+def _resolve_command(name: str) -> CommandHandler:
+    module_name, _, attr = COMMANDS[name].partition(":")
+    module = importlib.import_module(module_name)
+    return getattr(module, attr)
+
+
+def _sample_rate(value: str) -> float:
+    try:
+        rate = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid sample rate: {value!r}") from None
+    if not 0.0 < rate <= 1.0:
+        raise argparse.ArgumentTypeError(f"sample rate must be in (0, 1], got {value}")
+    return rate
+
+
+def _add_sampling_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--sample",
+        type=_sample_rate,
+        default=None,
+        metavar="RATE",
+        help="Keep a deterministic fraction (0-1] of threads; all events of a kept thread are kept",
+    )
+    parser.add_argument(
+        "--sample-by",
+        choices=["thread", "turn"],
+        default="thread",
+        help="Id hashed for --sample (default: thread)",
+    )
 
-from .ansi_colors import detect_color_mode, strip_ansi
-from .context_declarer import ContextDeclarer
-from .domain_types import Anchors, ContextRef, DomainAction
-from .gateway_client import FakeGatewayClient, GatewayClient
-from .http_gateway_client import HttpGatewayClient
-from .intent_composer import IntentComposer
-from .presenters import render_audit_view, render_decision_view, render_thread_view
-from .tail_presenter import render_tail_details, render_tail_line
+
+def _add_format_arg(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--format",
+        choices=["text", "json", "ndjson", "csv"],
+        default="text",
+        help="Output format; json/ndjson/csv stream records to stdout (default: text)",
+    )
 
 
 def _build_client() -> GatewayClient:
@@ -27,222 +82,203 @@ def _build_client() -> GatewayClient:
         timeout = 15.0
 
     if not base_url:
+        from .gateway_client import FakeGatewayClient
+
         return FakeGatewayClient()
 
-    client = HttpGatewayClient(base_url=base_url, token=token, timeout_secs=timeout)
-    # Admission Gate
-    try:
-        client.check_capabilities()
-    except Exception as exc:
-        raise RuntimeError(f"Gateway admission failed: {exc}") from exc
-    return client
-
-
-def send_intent(client: GatewayClient, args: argparse.Namespace) -> None:
-    composer = IntentComposer()
-    anchors = Anchors(thread_id=args.thread_id, turn_id=args.turn_id, parent_turn_id=args.parent_turn_id)
-    action = DomainAction(action_type=args.intent_type, payload={})
-    
-    context = None
-    if args.context_ref:
-        refs = (ContextRef(ref_type="ref", ref_id=args.context_ref, version=None),)
-        context = ContextDeclarer().declare(refs=refs, assembly_rules={})
-        
-    envelope = composer.compose(anchors=anchors, action=action, context_spec=context)
-    
-    # Mandatory correlation ID: generate if not provided
-    cid = args.correlation_id or f"op-{int(time.time())}"
-    
-    ack = client.send_intent(envelope, correlation_id=cid)
-    print(f"Accepted: correlation_id={ack.correlation_id}")
-
-
-def thread_view(client: GatewayClient, args: argparse.Namespace) -> None:
-    timeline = client.get_timeline(args.thread_id)
-    print(render_thread_view(args.thread_id, timeline))
-
-
-def decision_view(client: GatewayClient, args: argparse.Namespace) -> None:
-    view = client.get_decision(args.thread_id, args.turn_id)
-    print(render_decision_view(view))
-
-
-def audit_view(client: GatewayClient, args: argparse.Namespace) -> None:
-    events = client.get_audit(args.thread_id, turn_id=args.turn_id)
-    print(render_audit_view(events))
-
-
-def tail_view(client: GatewayClient, args: argparse.Namespace) -> None:
-    """Stream events from gateway with color-coded output and auto-reconnect."""
-    import signal
-    import threading
-    
-    mode = detect_color_mode(args.color)
-    
-    # One-time warning if colors disabled in auto mode
-    if args.color == "auto" and not mode.enabled:
-        print("[colors disabled: piped output or NO_COLOR set]", file=sys.stderr, flush=True)
-    
-    # Compile grep pattern if provided
-    grep_pattern = None
-    if args.grep:
-        try:
-            grep_pattern = re.compile(args.grep, re.IGNORECASE)
-        except re.error as e:
-            print(f"Invalid grep pattern: {e}", file=sys.stderr)
-            sys.exit(1)
-    
-    # Parse --only filter
-    only_kinds: set[str] | None = None
-    if args.only:
-        only_kinds = {k.strip().upper() for k in args.only.split(",")}
-    
-    # Parse --result filter (for DECISION events)
-    result_filter: str | None = None
-    if args.result:
-        result_filter = args.result.strip().upper()
-        if result_filter not in ("ALLOW", "DENY"):
-            print(f"Invalid --result value: {args.result}. Must be ALLOW or DENY.", file=sys.stderr)
-            sys.exit(1)
-    
-    # Graceful shutdown flag
-    stop_event = threading.Event()
-    
-    def handle_signal(signum: int, frame: object) -> None:
-        stop_event.set()
-    
-    # Register signal handlers (wrapped for embedded environments)
+    from .capabilities_cache import DEFAULT_TTL_SECS, CapabilitiesCache
+    from .http_gateway_client import DEFAULT_STALL_TIMEOUT_SECS, HttpGatewayClient
+
+    stream_id = os.getenv("DBL_GATEWAY_STREAM_ID", "").strip() or "default"
+    lane = os.getenv("DBL_GATEWAY_LANE", "").strip() or "default"
+
+    raw_ttl = os.getenv("DBL_GATEWAY_CAPABILITIES_TTL_SECS", "").strip()
     try:
-        signal.signal(signal.SIGINT, handle_signal)
-        signal.signal(signal.SIGTERM, handle_signal)
-        if hasattr(signal, 'SIGBREAK'):  # Windows-specific
-            signal.signal(signal.SIGBREAK, handle_signal)  # type: ignore[attr-defined]
-    except (ValueError, OSError):
-        # Signal handling not available in this environment
-        pass
-    
-    last_index: int | None = args.since
-    reconnect_delay = 1.0
-    max_reconnect_delay = 30.0
-    event_count = 0
-    
+        ttl = float(raw_ttl) if raw_ttl else DEFAULT_TTL_SECS
+    except ValueError:
+        ttl = DEFAULT_TTL_SECS
+
+    raw_stall = os.getenv("DBL_GATEWAY_STALL_TIMEOUT_SECS", "").strip()
     try:
-        while not stop_event.is_set():
-            try:
-                for event in client.tail(since=last_index, backlog=args.backlog):
-                    if stop_event.is_set():
-                        break
-                        
-                    # Track last seen index for reconnect
-                    event_index = event.get("index")
-                    if isinstance(event_index, int):
-                        last_index = event_index
-                    elif isinstance(event_index, str) and event_index.isdigit():
-                        last_index = int(event_index)
-                    
-                    # Apply --only filter
-                    event_kind = str(event.get("kind", "")).upper()
-                    if only_kinds and event_kind not in only_kinds:
-                        continue
-                    
-                    # Apply --result filter (only for DECISION events)
-                    if result_filter and event_kind == "DECISION":
-                        payload = event.get("payload") if isinstance(event.get("payload"), dict) else {}
-                        event_result = str(payload.get("result", payload.get("decision", ""))).upper()
-                        if event_result != result_filter:
-                            continue
-                    
-                    # Render line
-                    line = render_tail_line(event, mode)
-                    
-                    # Apply --grep filter (on uncolored text to avoid ANSI interference)
-                    if grep_pattern:
-                        plain_line = strip_ansi(line) if mode.enabled else line
-                        if not grep_pattern.search(plain_line):
-                            continue
-                    
-                    print(line, flush=True)
-                    event_count += 1
-                    if args.details:
-                        for detail_line in render_tail_details(event, mode):
-                            print(detail_line, flush=True)
-                    
-                    # Reset reconnect delay on successful event
-                    reconnect_delay = 1.0
-                    
-            except (ConnectionError, OSError, httpx.HTTPError) as e:
-                if stop_event.is_set():
-                    break
-                # Auto-reconnect with exponential backoff
-                print(f"\n[connection lost: {e}, reconnecting in {reconnect_delay:.0f}s...]", flush=True)
-                # Use wait with timeout so we can check stop_event
-                if stop_event.wait(timeout=reconnect_delay):
-                    break
-                reconnect_delay = min(reconnect_delay * 2, max_reconnect_delay)
-                continue
-                
-    except KeyboardInterrupt:
-        pass
-    
-    print(f"\n[tail stopped, {event_count} events received]", flush=True)
-
-
-from .projections.integrity import IntegrityProjection
-
-def integrity_view(client: GatewayClient, args: argparse.Namespace) -> None:
-    # Fetch as much history as reasonable for integrity check
-    # For a robust check, we might want ALL history, but snapshot limit is capped.
-    # We use 2000 as "current horizon".
-    events = client._fetch_events(limit=2000)
-    
-    projection = IntegrityProjection()
-    for event in events:
-        projection.feed(event)
-    
-    print(projection.render())   
-
-from .projections.latency import LatencyProjection
-
-def latency_view(client: GatewayClient, args: argparse.Namespace) -> None:
-    events = client._fetch_events(limit=2000)
-    projection = LatencyProjection()
-    for event in events:
-        projection.feed(event)
-    print(projection.render())
-
-from .projections.policy_map import PolicyMapProjection
-from .projections.decision_stats import DecisionStatsProjection
-
-def policy_map_view(client: GatewayClient, args: argparse.Namespace) -> None:
-    events = client._fetch_events(limit=2000)
-    projection = PolicyMapProjection()
-    for event in events:
-        projection.feed(event)
-    print(projection.render())
-
-def stats_view(client: GatewayClient, args: argparse.Namespace) -> None:
-    events = client._fetch_events(limit=2000)
-    projection = DecisionStatsProjection()
-    for event in events:
-        projection.feed(event)
-    print(projection.render())
-
-
-
-from .projections.failures import FailureTaxonomyProjection
-
-def failures_view(client: GatewayClient, args: argparse.Namespace) -> None:
-    events = client._fetch_events(limit=2000)
-    projection = FailureTaxonomyProjection()
-    for event in events:
-        projection.feed(event)
-    print(projection.render())
+        stall_timeout = float(raw_stall) if raw_stall else DEFAULT_STALL_TIMEOUT_SECS
+    except ValueError:
+        stall_timeout = DEFAULT_STALL_TIMEOUT_SECS
+
+    # Several comma-separated URLs select a fan-in client over all of them
+    base_urls = [u.strip() for u in base_url.split(",") if u.strip()]
+    cache = CapabilitiesCache(ttl_secs=ttl)
+    clients = []
+    for url in base_urls:
+        client = HttpGatewayClient(
+            base_url=url,
+            token=token,
+            timeout_secs=timeout,
+            capabilities_cache=cache,
+            stream_id=stream_id,
+            lane=lane,
+            stall_timeout_secs=stall_timeout,
+        )
+        # Admission Gate
+        try:
+            client.check_capabilities()
+        except Exception as exc:
+            prefix = f"{url}: " if len(base_urls) > 1 else ""
+            raise RuntimeError(f"Gateway admission failed: {prefix}{exc}") from exc
+        clients.append(client)
+
+    if len(clients) == 1:
+        return clients[0]
+
+    from .fanin import FanInGatewayClient
+
+    return FanInGatewayClient(clients)
+
+
+def _add_tail_args(parser: argparse.ArgumentParser, backlog: int = 20) -> None:
+    """Options of the tail pipeline, shared by ``tail`` and ``replay``."""
+    parser.add_argument("--since", type=int, default=None, help="Start from index > since")
+    parser.add_argument(
+        "--backlog",
+        type=int,
+        default=backlog,
+        help=f"Number of recent events on connect (default: {backlog})",
+    )
+    parser.add_argument("--color", choices=["auto", "always", "never"], default="auto", help="Color mode (default: auto)")
+    parser.add_argument("--details", action="store_true", help="Show additional details for DECISION events")
+    parser.add_argument("--only", type=str, default=None, help="Filter by event kind (comma-separated: INTENT,DECISION,EXECUTION)")
+    parser.add_argument("--result", type=str, default=None, help="Filter DECISION events by result (ALLOW or DENY)")
+    parser.add_argument("--grep", type=str, default=None, help="Filter output by regex pattern")
+    parser.add_argument(
+        "--ordered",
+        action="store_true",
+        help="With several gateways: merge sources in timestamp order within a bounded reorder buffer",
+    )
+    parser.add_argument(
+        "--reorder-window",
+        type=int,
+        default=256,
+        help="Maximum events held back for --ordered merging (default: 256)",
+    )
+    parser.add_argument(
+        "--no-backfill",
+        action="store_true",
+        help="Do not fetch events missing from the stream (index gaps) from /snapshot",
+    )
+    parser.add_argument(
+        "--buffer",
+        type=int,
+        default=10_000,
+        help="Events read ahead of the output (default: 10000)",
+    )
+    parser.add_argument(
+        "--on-overflow",
+        choices=["block", "drop-oldest", "summarize"],
+        default="block",
+        help="When the buffer is full: pause reading, drop the oldest event, or replace skipped events with a summary line (default: block)",
+    )
+    parser.add_argument(
+        "--aggregate",
+        metavar="auto|INTERVAL",
+        default=None,
+        help="Print one summary line per interval (e.g. 1s, 5s) instead of per-event lines; "
+        "'auto' does so only while the rate is above --aggregate-above",
+    )
+    parser.add_argument(
+        "--aggregate-above",
+        type=float,
+        default=200.0,
+        help="Events per second above which --aggregate auto switches to summaries (default: 200)",
+    )
+    parser.add_argument("--record", metavar="DIR", default=None, help="Append every streamed event as raw JSON to segment files in DIR")
+    parser.add_argument(
+        "--record-rotate-mb",
+        type=float,
+        default=64.0,
+        help="Start a new segment after this many MB of JSON (default: 64)",
+    )
+    parser.add_argument(
+        "--record-rotate-secs",
+        type=float,
+        default=3600.0,
+        help="Start a new segment after this many seconds (default: 3600, 0 = size only)",
+    )
+    parser.add_argument(
+        "--record-compress",
+        choices=["none", "gzip", "xz"],
+        default="none",
+        help="Segment compression (default: none)",
+    )
+    parser.add_argument(
+        "--record-fsync-secs",
+        type=float,
+        default=1.0,
+        help="Group-commit interval: recorded events are fsynced together at most this often (default: 1.0)",
+    )
+    parser.add_argument(
+        "--cursor-file",
+        metavar="PATH",
+        default=None,
+        help="Persist the last processed index here and resume from it on start",
+    )
+    parser.add_argument(
+        "--cursor-every",
+        type=int,
+        default=100,
+        help="Checkpoint the cursor after this many events (default: 100)",
+    )
+    parser.add_argument(
+        "--cursor-every-ms",
+        type=int,
+        default=1000,
+        help="Checkpoint the cursor at least this often while events arrive (default: 1000)",
+    )
+    parser.add_argument(
+        "--group",
+        metavar="DIR",
+        default=None,
+        help="Join the consumer group coordinated in DIR and process only this member's partitions",
+    )
+    parser.add_argument(
+        "--group-partitions",
+        type=int,
+        default=16,
+        help="Partitions (by thread id) the group splits the stream into; same for all members (default: 16)",
+    )
+    parser.add_argument("--group-member", default=None, help="Member id (default: HOST-PID)")
+    parser.add_argument(
+        "--group-lease-secs",
+        type=float,
+        default=10.0,
+        help="A member that has not renewed its lease for this long is considered dead (default: 10)",
+    )
+    _add_sampling_args(parser)
+    _add_format_arg(parser)
+
 
 def main() -> None:
     parser = argparse.ArgumentParser(
         prog="dbl-operator",
         description="Template CLI for a DBL-style Gateway operator. Requires a real GatewayClient to be useful.",
     )
+    parser.add_argument("--profile", action="store_true", help="Print a per-stage timing breakdown to stderr")
+    parser.add_argument(
+        "--profile-format",
+        choices=["text", "json"],
+        default="text",
+        help="Profile output format (default: text)",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="PATH",
+        default=None,
+        help="Read from a recording (tail --record directory or event file) instead of the gateway",
+    )
+    parser.add_argument(
+        "--replay-speed",
+        type=float,
+        default=0.0,
+        help="Tail pacing with --replay: 1 = real time, 0 = as fast as possible (default: 0)",
+    )
     sub = parser.add_subparsers(dest="command", required=True)
 
     # ... (existing parsers kept implicitly if replace works correctly on range)
@@ -256,70 +292,181 @@ def main() -> None:
     send.add_argument("--intent-type", required=True)
     send.add_argument("--context-ref", default=None)
     send.add_argument("--correlation-id", default=None)
+    send.add_argument("--stream-id", default=None, help="Target stream (default: DBL_GATEWAY_STREAM_ID or 'default')")
+    send.add_argument("--lane", default=None, help="Target lane (default: DBL_GATEWAY_LANE or 'default')")
+    _add_format_arg(send)
 
     tv = sub.add_parser("thread-view")
-    tv.add_argument("--thread-id", required=True)
+    _add_format_arg(tv)
+    tv.add_argument("--thread-id", action="append", default=None, help="Thread to show (repeatable)")
+    tv.add_argument("--ids-file", default=None, help="File with one thread id per line ('-' = stdin)")
 
     dv = sub.add_parser("decision-view")
-    dv.add_argument("--thread-id", required=True)
-    dv.add_argument("--turn-id", required=True)
+    _add_format_arg(dv)
+    dv.add_argument("--thread-id", default=None)
+    dv.add_argument("--turn-id", action="append", default=None, help="Turn of --thread-id to show (repeatable)")
+    dv.add_argument("--ids-file", default=None, help="File with 'THREAD_ID TURN_ID' per line ('-' = stdin)")
 
     av = sub.add_parser("audit-view")
+    _add_format_arg(av)
     av.add_argument("--thread-id", required=True)
     av.add_argument("--turn-id", default=None)
 
     # Integrity Projection
     integ = sub.add_parser("integrity", help="Analyze turn integrity (gaps/violations)")
+    integ.add_argument(
+        "--only-problems",
+        action="store_true",
+        help="List only GAP and VIOLATION turns (the summary still counts all turns)",
+    )
 
     # Latency Projection
     lat = sub.add_parser("latency", help="Analyze system latency profile (P50/P95)")
+    lat.add_argument(
+        "--group-by",
+        action="append",
+        choices=["intent_type", "policy", "lane"],
+        default=None,
+        help="Add a percentile breakdown per intent type, policy version or lane (repeatable)",
+    )
+    lat.add_argument("--slowest", type=int, default=5, help="Slowest turns listed overall and per group (default: 5)")
 
     # Policy Map
     pmap = sub.add_parser("policy-map", help="Timeline of effective policies")
 
     # Decision Stats
     stats = sub.add_parser("stats", help="Decision aggregate statistics")
+    stats.add_argument(
+        "--approx",
+        action="store_true",
+        help="Fixed-memory mode: Space-Saving top-K counts and HyperLogLog distinct counts with error bounds",
+    )
+    stats.add_argument("--top-k", type=int, default=64, help="Entries kept per summary with --approx (default: 64)")
 
     # Failure Taxonomy
     fail = sub.add_parser("failures", help="Categorization of system failures")
 
+    for proj in (integ, lat, pmap, stats, fail):
+        proj.add_argument(
+            "--partition",
+            action="append",
+            default=None,
+            metavar="STREAM[:LANE]",
+            help="Restrict to a stream/lane partition (repeatable; several are fetched in parallel)",
+        )
+        proj.add_argument(
+            "--by-partition",
+            action="store_true",
+            help="Report each stream/lane partition separately plus an overall rollup",
+        )
+        proj.add_argument("--limit", type=int, default=2000, help="Events to fetch from the ledger (default: 2000)")
+        proj.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Worker processes for large ledgers (0 = one per CPU; default: 1)",
+        )
+        _add_sampling_args(proj)
+        _add_format_arg(proj)
+
     # tail subcommand with production hardening
     tail = sub.add_parser("tail", help="Stream events from gateway (SSE)")
-    # ... args ...
-    tail.add_argument("--since", type=int, default=None, help="Start from index > since")
-    # ...
+    _add_tail_args(tail)
+
+    # The tail pipeline over a recording instead of the gateway
+    replay = sub.add_parser("replay", help="Play a recording (tail --record or an event file) through the tail pipeline")
+    replay.add_argument("recording", help="Recording directory or event file (.ndjson, .gz, .xz, .json)")
+    replay.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="Playback speed: 1 = real time, 10 = ten times faster, 0 = as fast as possible (default: 1)",
+    )
+    replay.add_argument("--from-index", type=int, default=None, help="Start at this ledger index")
+    replay.add_argument("--from-time", default=None, help="Start at this ISO-8601 timestamp")
+    _add_tail_args(replay, backlog=0)
+
+    # Offline export of the full ledger
+    export = sub.add_parser("export", help="Export the ledger from /snapshot into chunk files with a manifest")
+    export.add_argument("directory", help="Output directory (an interrupted export resumes here)")
+    export.add_argument(
+        "--format",
+        choices=["ndjson.gz", "csv", "parquet"],
+        default="ndjson.gz",
+        help="Chunk format; parquet needs pyarrow (default: ndjson.gz)",
+    )
+    export.add_argument("--chunk-events", type=int, default=100_000, help="Ledger indices per chunk (default: 100000)")
+    export.add_argument("--page-size", type=int, default=1000, help="Events per /snapshot request (default: 1000)")
+    export.add_argument("--workers", type=int, default=4, help="Chunks downloaded concurrently (default: 4)")
+    export.add_argument("--from-index", type=int, default=0, help="First ledger index to export (default: 0)")
+    export.add_argument("--to-index", type=int, default=None, help="Last ledger index to export (default: current t_index)")
+    export.add_argument("--stream-id", default=None, help="Export only this stream")
+    export.add_argument("--lane", default=None, help="Export only this lane")
+
+    # Prometheus exporter over the live tail
+    sm = sub.add_parser("serve-metrics", help="Expose tail-derived metrics on a local /metrics endpoint")
+    sm.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    sm.add_argument("--port", type=int, default=9464, help="Bind port (default: 9464)")
+    sm.add_argument("--since", type=int, default=None, help="Start from index > since")
+    sm.add_argument("--backlog", type=int, default=0, help="Number of recent events to count on connect (default: 0)")
+    sm.add_argument(
+        "--orphan-after",
+        type=float,
+        default=300.0,
+        help="Seconds after which an incomplete turn counts as an integrity gap (default: 300)",
+    )
 
-    tail.add_argument("--backlog", type=int, default=20, help="Number of recent events on connect (default: 20)")
-    tail.add_argument("--color", choices=["auto", "always", "never"], default="auto", help="Color mode (default: auto)")
-    tail.add_argument("--details", action="store_true", help="Show additional details for DECISION events")
-    tail.add_argument("--only", type=str, default=None, help="Filter by event kind (comma-separated: INTENT,DECISION,EXECUTION)")
-    tail.add_argument("--result", type=str, default=None, help="Filter DECISION events by result (ALLOW or DENY)")
-    tail.add_argument("--grep", type=str, default=None, help="Filter output by regex pattern")
+    # Live dashboard
+    top = sub.add_parser("top", help="Live dashboard of rates, deny rate, latencies and open turns")
+    top.add_argument("--since", type=int, default=None, help="Start from index > since")
+    top.add_argument("--backlog", type=int, default=0, help="Number of recent events to include on connect (default: 0)")
+    top.add_argument("--fps", type=float, default=2.0, help="Maximum redraws per second (default: 2)")
+    top.add_argument("--window", type=int, default=10, help="Rolling window for rates and reason codes in seconds (default: 10)")
+    top.add_argument(
+        "--orphan-after",
+        type=float,
+        default=300.0,
+        help="Seconds after which an incomplete turn counts as orphaned (default: 300)",
+    )
+    top.add_argument("--color", choices=["auto", "always", "never"], default="auto", help="Color mode (default: auto)")
 
     args = parser.parse_args()
-    client = _build_client()
-    if args.command == "send-intent":
-        send_intent(client, args)
-    elif args.command == "thread-view":
-        thread_view(client, args)
-    elif args.command == "decision-view":
-        decision_view(client, args)
-    elif args.command == "audit-view":
-        audit_view(client, args)
-    elif args.command == "tail":
-        tail_view(client, args)
-    elif args.command == "integrity":
-        integrity_view(client, args)
-    elif args.command == "latency":
-        latency_view(client, args)
-    elif args.command == "policy-map":
-        policy_map_view(client, args)
-    elif args.command == "stats":
-        stats_view(client, args)
-    elif args.command == "failures":
-        failures_view(client, args)
+    if not args.profile:
+        _dispatch(args)
+        return
+
+    from .profiler import get_profiler
+
+    profiler = get_profiler()
+    profiler.enable()
+    try:
+        _dispatch(args)
+    finally:
+        report = profiler.to_json() if args.profile_format == "json" else profiler.render()
+        print(report, file=sys.stderr)
+
+
+def _dispatch(args: argparse.Namespace) -> None:
+    handler = _resolve_command(args.command)
+    recording = getattr(args, "recording", None) or args.replay
+    client = _build_replay_client(args, recording) if recording else _build_client()
+    handler(client, args)
+
+
+def _build_replay_client(args: argparse.Namespace, path: str) -> "GatewayClient":
+    """A read-only client over a recording; no gateway is contacted."""
+    from .replay import ReplayGatewayClient
+
+    if args.command == "replay":
+        options = {"speed": args.speed, "from_index": args.from_index, "from_time": args.from_time}
+    else:
+        options = {"speed": args.replay_speed}
+    try:
+        return ReplayGatewayClient(path, **options)
+    except (FileNotFoundError, ValueError) as e:
+        print(str(e), file=sys.stderr)
+        sys.exit(1)
 
 
 if __name__ == "__main__":
     main()
-
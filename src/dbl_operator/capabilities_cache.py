@@ -0,0 +1,107 @@
+"""On-disk cache for the gateway admission check (``/capabilities``)."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+__all__ = ["CapabilitiesCache", "cache_key", "default_cache_path"]
+
+DEFAULT_TTL_SECS = 300.0
+
+
+def default_cache_path() -> Path:
+    """Resolve the cache file from ``DBL_OPERATOR_CACHE_DIR`` or the XDG cache dir."""
+    base = os.getenv("DBL_OPERATOR_CACHE_DIR", "").strip()
+    if base:
+        return Path(base) / "capabilities.json"
+    xdg = os.getenv("XDG_CACHE_HOME", "").strip()
+    root = Path(xdg) if xdg else Path.home() / ".cache"
+    return root / "dbl-operator" / "capabilities.json"
+
+
+def cache_key(base_url: str, token: str | None) -> str:
+    """
+    Key an entry by gateway and credentials without storing the token.
+
+    The token only contributes a truncated SHA-256 fingerprint, so a
+    different token never reuses another identity's admission result.
+    """
+    fingerprint = hashlib.sha256(token.encode("utf-8")).hexdigest()[:16] if token else "anonymous"
+    return f"{base_url.rstrip('/')}#{fingerprint}"
+
+
+class CapabilitiesCache:
+    """
+    JSON file mapping cache keys to the last validated ``/capabilities`` body.
+
+    Only responses that passed the admission gate are stored; readers must
+    still re-validate, so a cached entry can never bypass the interface
+    version or surface checks. A TTL of 0 disables reads and writes.
+    """
+
+    def __init__(self, path: Path | None = None, ttl_secs: float = DEFAULT_TTL_SECS) -> None:
+        self.path = path or default_cache_path()
+        self.ttl_secs = ttl_secs
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_secs > 0
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        if not self.enabled:
+            return None
+        entry = self._load().get(key)
+        if not isinstance(entry, dict):
+            return None
+        fetched_at = entry.get("fetched_at")
+        data = entry.get("capabilities")
+        if not isinstance(fetched_at, (int, float)) or not isinstance(data, dict):
+            return None
+        age = time.time() - fetched_at
+        if age < 0 or age > self.ttl_secs:
+            return None
+        return data
+
+    def put(self, key: str, data: dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+        entries = self._load()
+        entries[key] = {"fetched_at": time.time(), "capabilities": data}
+        self._store(entries)
+
+    def invalidate(self, key: str) -> None:
+        entries = self._load()
+        if entries.pop(key, None) is not None:
+            self._store(entries)
+
+    def _load(self) -> dict[str, Any]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _store(self, entries: dict[str, Any]) -> None:
+        # Write-then-rename so concurrent CLI invocations never read a torn file.
+        # A read-only or missing cache dir just means every run is a cold run.
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".capabilities-", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                    json.dump(entries, fh)
+                os.replace(tmp, self.path)
+            except BaseException:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+                raise
+        except OSError:
+            pass
@@ -0,0 +1 @@
+"""CLI subcommand handlers, imported lazily by ``app_cli`` on dispatch."""
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import argparse
+import sys
+
+from ..exporter import LedgerExporter
+from ..fanin import FanInGatewayClient
+from ..gateway_client import GatewayClient
+
+
+def export_ledger(client: GatewayClient, args: argparse.Namespace) -> None:
+    """Download the ledger into chunk files with a manifest; resumes an interrupted run."""
+    if isinstance(client, FanInGatewayClient):
+        print("export needs a single gateway (indices differ between gateways).", file=sys.stderr)
+        sys.exit(1)
+
+    def on_chunk(entry: dict) -> None:
+        print(
+            f"[{entry['file']}: index {entry['first_index']}-{entry['last_index']}, "
+            f"{entry['events']} events, {entry['bytes']} bytes]",
+            file=sys.stderr,
+            flush=True,
+        )
+
+    try:
+        exporter = LedgerExporter(
+            client,
+            args.directory,
+            fmt=args.format,
+            chunk_events=args.chunk_events,
+            page_size=args.page_size,
+            workers=args.workers,
+            from_index=args.from_index,
+            to_index=args.to_index,
+            stream_id=args.stream_id,
+            lane=args.lane,
+            on_chunk=on_chunk,
+        )
+        manifest = exporter.run()
+    except ValueError as e:
+        print(f"Cannot export: {e}", file=sys.stderr)
+        sys.exit(1)
+    except KeyboardInterrupt:
+        print(f"\n[export interrupted; run it again to resume into {args.directory}]", file=sys.stderr)
+        sys.exit(130)
+
+    chunks = manifest["chunks"]
+    print(
+        f"Exported {exporter.events} events (index {manifest['from_index']}-{manifest['to_index']}) "
+        f"in {len(chunks)} chunks to {args.directory}"
+        + (f" ({exporter.resumed} already present)" if exporter.resumed else "")
+    )
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+from ..context_declarer import ContextDeclarer
+from ..domain_types import Anchors, ContextRef, DomainAction
+from ..gateway_client import GatewayClient
+from ..intent_composer import IntentComposer
+
+
+def send_intent(client: GatewayClient, args: argparse.Namespace) -> None:
+    composer = IntentComposer()
+    anchors = Anchors(thread_id=args.thread_id, turn_id=args.turn_id, parent_turn_id=args.parent_turn_id)
+    action = DomainAction(action_type=args.intent_type, payload={})
+    
+    context = None
+    if args.context_ref:
+        refs = (ContextRef(ref_type="ref", ref_id=args.context_ref, version=None),)
+        context = ContextDeclarer().declare(refs=refs, assembly_rules={})
+        
+    envelope = composer.compose(anchors=anchors, action=action, context_spec=context)
+    
+    # Mandatory correlation ID: generate if not provided
+    cid = args.correlation_id or f"op-{int(time.time())}"
+    
+    ack = client.send_intent(envelope, correlation_id=cid, stream_id=args.stream_id, lane=args.lane)
+    if args.format != "text":
+        from ..output import write_records
+
+        write_records(args.format, [{"record": "ack", "correlation_id": ack.correlation_id}])
+        return
+    print(f"Accepted: correlation_id={ack.correlation_id}")
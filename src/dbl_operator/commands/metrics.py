@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import threading
+
+from ..gateway_client import GatewayClient
+from ..metrics import GatewayMetrics, MetricsServer
+from ..tail_stream import ResumableTail, TailStalled, install_stop_handlers
+from ..turn_tracker import TurnTracker
+
+
+def serve_metrics(client: GatewayClient, args: argparse.Namespace) -> None:
+    """Keep one resumable tail subscription and expose derived metrics on /metrics."""
+    metrics = GatewayMetrics(tracker=TurnTracker(orphan_after_secs=args.orphan_after))
+    try:
+        server = MetricsServer(metrics.registry, host=args.host, port=args.port)
+    except OSError as e:
+        print(f"Cannot bind metrics endpoint {args.host}:{args.port}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    stop_event = threading.Event()
+    install_stop_handlers(stop_event)
+
+    def on_disconnect(exc: BaseException, delay: float) -> None:
+        metrics.reconnects.inc()
+        if isinstance(exc, TailStalled):
+            metrics.stalls.inc()
+        print(f"[connection lost: {exc}, reconnecting in {delay:.1f}s...]", file=sys.stderr, flush=True)
+
+    stream = ResumableTail(
+        client,
+        since=args.since,
+        backlog=args.backlog,
+        stop_event=stop_event,
+        on_disconnect=on_disconnect,
+        on_reconnect=metrics.recovery.observe,
+    )
+
+    server.start()
+    host, port = server.address
+    print(f"[serving metrics on http://{host}:{port}/metrics]", file=sys.stderr, flush=True)
+    event_count = 0
+    try:
+        for event in stream:
+            metrics.feed(event)
+            event_count += 1
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+    print(f"[metrics exporter stopped, {event_count} events processed]", file=sys.stderr, flush=True)
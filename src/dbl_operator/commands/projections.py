@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import argparse
+import functools
+import sys
+from typing import Any, Callable, Sequence
+
+from ..domain_types import Partition
+from ..gateway_client import GatewayClient
+from ..output import write_records
+from ..profiler import get_profiler
+from ..projections.base import Projection
+from ..projections.decision_stats import DecisionStatsProjection
+from ..projections.failures import FailureTaxonomyProjection
+from ..projections.integrity import IntegrityProjection
+from ..projections.latency import LatencyProjection
+from ..projections.partitioned import PartitionedProjection
+from ..projections.policy_map import PolicyMapProjection
+
+
+def _fetch_horizon(client: GatewayClient, partitions: Sequence[Partition], limit: int) -> list[dict[str, Any]]:
+    """Fetch the current horizon, optionally restricted to stream/lane partitions."""
+    if not partitions:
+        return client.fetch_events(limit=limit)
+    if len(partitions) == 1:
+        p = partitions[0]
+        return client.fetch_events(limit=limit, stream_id=p.stream_id, lane=p.lane)
+
+    # Several partitions: one concurrent snapshot each, de-duplicated where selectors overlap
+    by_partition = client.fetch_partitions(partitions, limit)
+    unique: dict[tuple[Any, Any], dict[str, Any]] = {}
+    for events in by_partition.values():
+        for event in events:
+            unique.setdefault((event.get("origin"), event.get("index")), event)
+    return sorted(unique.values(), key=lambda e: e.get("index") if isinstance(e.get("index"), int) else -1)
+
+
+def _run_projection(
+    client: GatewayClient,
+    args: argparse.Namespace,
+    factory: Callable[[], Projection],
+    limit: int = 2000,
+) -> None:
+    """Fetch the current horizon, feed it through a projection and print the result."""
+    profiler = get_profiler()
+    partitions = [Partition.parse(spec) for spec in getattr(args, "partition", None) or []]
+    events = _fetch_horizon(client, partitions, getattr(args, "limit", None) or limit)
+
+    sampler = None
+    rate = getattr(args, "sample", None)
+    if rate is not None and rate < 1.0:
+        from ..sampling import Sampler
+
+        sampler = Sampler(rate, by=getattr(args, "sample_by", "thread"))
+        with profiler.stage("projection.sample", events=len(events)):
+            events = [event for event in events if sampler.keep(event)]
+
+    if getattr(args, "by_partition", False) or len(partitions) > 1:
+        factory = functools.partial(PartitionedProjection, factory)
+
+    workers = getattr(args, "workers", 1)
+    projection: Projection
+    if workers != 1:
+        from ..parallel import MIN_EVENTS_PER_WORKER, run_parallel
+
+        def on_reduced(requested: int, used: int) -> None:
+            print(
+                f"[{len(events)} events: using {used} of {requested} workers "
+                f"(at least {MIN_EVENTS_PER_WORKER} events each)]",
+                file=sys.stderr,
+            )
+
+        projection = run_parallel(factory, events, workers or None, on_reduced=on_reduced)
+    else:
+        projection = factory()
+        with profiler.stage("projection.feed", events=len(events)):
+            for event in events:
+                projection.feed(event)
+    if sampler is not None:
+        projection.sampler = sampler
+    fmt = getattr(args, "format", "text")
+    with profiler.stage("projection.render") as span:
+        if fmt != "text":
+            span.events = write_records(fmt, projection.records())
+            return
+        # Line by line, so large tables are never held as one string
+        for line in projection.iter_lines():
+            span.bytes += len(line) + 1
+            print(line)
+
+
+def integrity_view(client: GatewayClient, args: argparse.Namespace) -> None:
+    # Fetch as much history as reasonable for integrity check
+    # For a robust check, we might want ALL history, but snapshot limit is capped.
+    # We use 2000 as "current horizon".
+    if getattr(args, "only_problems", False):
+        _run_projection(client, args, functools.partial(IntegrityProjection, only_problems=True))
+        return
+    _run_projection(client, args, IntegrityProjection)
+
+
+def latency_view(client: GatewayClient, args: argparse.Namespace) -> None:
+    group_by = list(dict.fromkeys(getattr(args, "group_by", None) or []))
+    _run_projection(client, args, functools.partial(LatencyProjection, group_by=group_by, slowest=args.slowest))
+
+
+def policy_map_view(client: GatewayClient, args: argparse.Namespace) -> None:
+    _run_projection(client, args, PolicyMapProjection)
+
+
+def stats_view(client: GatewayClient, args: argparse.Namespace) -> None:
+    if getattr(args, "approx", False):
+        factory = functools.partial(DecisionStatsProjection, approx=True, capacity=args.top_k)
+        _run_projection(client, args, factory)
+        return
+    _run_projection(client, args, DecisionStatsProjection)
+
+
+def failures_view(client: GatewayClient, args: argparse.Namespace) -> None:
+    _run_projection(client, args, FailureTaxonomyProjection)
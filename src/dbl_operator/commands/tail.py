@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import threading
+
+from ..ansi_colors import detect_color_mode, strip_ansi
+from ..fanin import FanInGatewayClient
+from ..gateway_client import GatewayClient
+from ..profiler import get_profiler
+from ..tail_presenter import render_tail_details, render_tail_line, render_tail_summary, tail_record
+from ..tail_stream import BackfillingTail, BufferedTail, DropSummary, ResumableTail, install_stop_handlers
+
+
+def tail_view(client: GatewayClient, args: argparse.Namespace) -> None:
+    """Stream events from gateway with color-coded output and auto-reconnect."""
+    fmt = getattr(args, "format", "text")
+    # Machine-readable output keeps stdout for records; notices go to stderr
+    notices = sys.stdout if fmt == "text" else sys.stderr
+    mode = detect_color_mode("never" if fmt != "text" else args.color)
+    
+    # One-time warning if colors disabled in auto mode
+    if fmt == "text" and args.color == "auto" and not mode.enabled:
+        print("[colors disabled: piped output or NO_COLOR set]", file=sys.stderr, flush=True)
+    
+    # Compile grep pattern if provided
+    grep_pattern = None
+    if args.grep:
+        try:
+            grep_pattern = re.compile(args.grep, re.IGNORECASE)
+        except re.error as e:
+            print(f"Invalid grep pattern: {e}", file=sys.stderr)
+            sys.exit(1)
+    
+    # Parse --only filter
+    only_kinds: set[str] | None = None
+    if args.only:
+        only_kinds = {k.strip().upper() for k in args.only.split(",")}
+    
+    # Parse --result filter (for DECISION events)
+    result_filter: str | None = None
+    if args.result:
+        result_filter = args.result.strip().upper()
+        if result_filter not in ("ALLOW", "DENY"):
+            print(f"Invalid --result value: {args.result}. Must be ALLOW or DENY.", file=sys.stderr)
+            sys.exit(1)
+    
+    if args.buffer < 1:
+        print(f"Invalid --buffer value: {args.buffer}. Must be at least 1.", file=sys.stderr)
+        sys.exit(1)
+
+    aggregator = None
+    if args.aggregate is not None:
+        from ..tail_aggregate import TailAggregator, parse_aggregate
+
+        if fmt != "text":
+            print("--aggregate only applies to text output.", file=sys.stderr)
+            sys.exit(1)
+        try:
+            interval, adaptive = parse_aggregate(args.aggregate)
+        except ValueError as e:
+            print(f"Invalid --aggregate value: {e}", file=sys.stderr)
+            sys.exit(1)
+        if args.aggregate_above <= 0:
+            print(f"Invalid --aggregate-above value: {args.aggregate_above}. Must be positive.", file=sys.stderr)
+            sys.exit(1)
+        aggregator = TailAggregator(interval, adaptive=adaptive, threshold=args.aggregate_above)
+
+    sampler = None
+    if args.sample is not None and args.sample < 1.0:
+        from ..sampling import Sampler
+
+        sampler = Sampler(args.sample, by=args.sample_by)
+        print(f"[{sampler.describe()}]", file=sys.stderr, flush=True)
+
+    if (args.cursor_file or args.group) and args.on_overflow != "block":
+        # A dropped event would be checkpointed as processed and never replayed
+        option = "--cursor-file" if args.cursor_file else "--group"
+        print(f"{option} needs --on-overflow block; {args.on_overflow} would skip events for good.", file=sys.stderr)
+        sys.exit(1)
+
+    cursor = None
+    since = args.since
+    if args.cursor_file:
+        from ..cursor import TailCursor
+
+        if args.cursor_every < 1 or args.cursor_every_ms < 0:
+            print(
+                "Invalid cursor checkpoint interval: --cursor-every must be at least 1, --cursor-every-ms at least 0.",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+        try:
+            cursor = TailCursor(
+                args.cursor_file,
+                every_events=args.cursor_every,
+                every_secs=args.cursor_every_ms / 1000,
+            )
+        except (OSError, ValueError) as e:
+            print(f"Cannot use cursor file {args.cursor_file}: {e}", file=sys.stderr)
+            sys.exit(1)
+        # An explicit --since wins over the stored position
+        if since is None and isinstance(client, FanInGatewayClient):
+            client.positions.update(cursor.origins)
+            if cursor.origins:
+                print(f"[resuming {len(cursor.origins)} sources from {args.cursor_file}]", file=notices, flush=True)
+        elif since is None and cursor.index is not None:
+            since = cursor.index
+            print(f"[resuming after index {since} from {args.cursor_file}]", file=notices, flush=True)
+
+    group = None
+    if args.group:
+        from ..consumer_group import ConsumerGroup, GroupTail
+
+        if args.cursor_file:
+            print("--group keeps per-partition cursors; it cannot be combined with --cursor-file.", file=sys.stderr)
+            sys.exit(1)
+        if isinstance(client, FanInGatewayClient):
+            print("--group needs a single gateway (indices differ between gateways).", file=sys.stderr)
+            sys.exit(1)
+        if args.cursor_every < 1 or args.cursor_every_ms < 0:
+            print(
+                "Invalid cursor checkpoint interval: --cursor-every must be at least 1, --cursor-every-ms at least 0.",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+
+        def on_rebalance(owned: frozenset[int]) -> None:
+            listed = ",".join(map(str, sorted(owned))) or "none"
+            print(
+                f"[group: {len(group.members)} members, {group.member_id} owns partitions {listed}]",
+                file=notices,
+                flush=True,
+            )
+
+        try:
+            group = ConsumerGroup(
+                args.group,
+                partitions=args.group_partitions,
+                member_id=args.group_member,
+                lease_secs=args.group_lease_secs,
+                checkpoint_events=args.cursor_every,
+                checkpoint_secs=args.cursor_every_ms / 1000,
+                on_rebalance=on_rebalance,
+            )
+            group.join()
+        except (OSError, ValueError) as e:
+            print(f"Cannot join group {args.group}: {e}", file=sys.stderr)
+            sys.exit(1)
+        # Per-partition cursors take the place of --cursor-file
+        cursor = group
+        if since is None and group.resume_index() is not None:
+            since = group.resume_index()
+            print(f"[resuming after index {since} from {args.group}]", file=notices, flush=True)
+
+    # Graceful shutdown flag
+    stop_event = threading.Event()
+    install_stop_handlers(stop_event)
+
+    def on_disconnect(exc: object, delay: float) -> None:
+        print(f"\n[connection lost: {exc}, reconnecting in {delay:.1f}s...]", file=notices, flush=True)
+
+    if isinstance(client, FanInGatewayClient):
+        client.ordered = args.ordered
+        client.reorder_window = args.reorder_window
+        client.on_source_disconnect = lambda origin, exc, delay: on_disconnect(f"{origin}: {exc}", delay)
+
+    profiler = get_profiler()
+    stream = resumable = ResumableTail(
+        client,
+        since=since,
+        backlog=args.backlog,
+        stop_event=stop_event,
+        on_disconnect=on_disconnect,
+    )
+    backfill = None
+    if not args.no_backfill:
+        # Index discontinuities are repaired from /snapshot before emission
+        stream = backfill = BackfillingTail(
+            stream,
+            client,
+            stop_event=stop_event,
+            source_of=client.source if isinstance(client, FanInGatewayClient) else None,
+        )
+    if group is not None:
+        # Only this member's partitions go further down the pipeline
+        stream = grouped = GroupTail(stream, group, client)
+    recorder = None
+    if args.record:
+        from ..recorder import SegmentRecorder
+
+        try:
+            recorder = SegmentRecorder(
+                args.record,
+                max_bytes=int(args.record_rotate_mb * 1024 * 1024),
+                max_secs=args.record_rotate_secs,
+                compression=args.record_compress,
+                fsync_secs=args.record_fsync_secs,
+            )
+        except (OSError, ValueError) as e:
+            print(f"Cannot record to {args.record}: {e}", file=sys.stderr)
+            sys.exit(1)
+        # Everything the gateway streamed is kept, before any display filter
+        stream = recorder.tee(stream)
+    # Socket reads run ahead of filtering and printing, up to --buffer events
+    stream = buffered = BufferedTail(
+        stream,
+        capacity=args.buffer,
+        policy=args.on_overflow,
+        stop_event=stop_event,
+        # Summaries are due on time even when the stream goes quiet
+        heartbeat_secs=aggregator.interval / 4 if aggregator is not None else None,
+    )
+    event_count = 0
+    writer = None
+    if fmt != "text":
+        from ..output import open_writer
+
+        writer = open_writer(fmt, flush=True)
+
+    aggregating = False
+
+    def print_summaries(summaries: list) -> None:
+        nonlocal aggregating
+        for summary in summaries:
+            print(render_tail_summary(summary, mode), flush=True)
+        if aggregator.adaptive and aggregating != aggregator.aggregating:
+            aggregating = aggregator.aggregating
+            if aggregating:
+                notice = f"[aggregating: above {args.aggregate_above:g} events/s, one summary per {aggregator.interval:g}s]"
+            else:
+                notice = "[rate back below threshold, per-event output resumed]"
+            print(notice, file=notices, flush=True)
+
+    def summarized(event: dict) -> bool:
+        """Fold ``event`` into the current interval instead of printing it."""
+        if aggregator.observe(event):
+            return False
+        if aggregator.adaptive and not aggregating:
+            print_summaries([])
+        return True
+
+    # Last event taken; it counts as processed once the next one is taken
+    handled = None
+    try:
+        for event in stream:
+            if aggregator is not None:
+                print_summaries(aggregator.drain())
+            if event is None:
+                continue
+            if isinstance(event, DropSummary):
+                print(f"[overflow: {event.describe()}]", file=notices, flush=True)
+                continue
+            if cursor is not None:
+                if handled is not None:
+                    cursor.advance(handled)
+                handled = event
+
+            # Apply --sample before any per-event work
+            if sampler is not None and not sampler.keep(event):
+                continue
+
+            # Apply --only filter
+            event_kind = str(event.get("kind", "")).upper()
+            if only_kinds and event_kind not in only_kinds:
+                continue
+
+            # Apply --result filter (only for DECISION events)
+            if result_filter and event_kind == "DECISION":
+                payload = event.get("payload") if isinstance(event.get("payload"), dict) else {}
+                event_result = str(payload.get("result", payload.get("decision", ""))).upper()
+                if event_result != result_filter:
+                    continue
+
+            # Counting is all the per-event work a summarized event gets
+            if aggregator is not None and not grep_pattern and summarized(event):
+                event_count += 1
+                continue
+
+            # Render line
+            if writer is None or grep_pattern:
+                with profiler.stage("tail.render", events=1):
+                    line = render_tail_line(event, mode)
+
+            # Apply --grep filter (on uncolored text to avoid ANSI interference)
+            if grep_pattern:
+                plain_line = strip_ansi(line) if mode.enabled else line
+                if not grep_pattern.search(plain_line):
+                    continue
+                if aggregator is not None and summarized(event):
+                    event_count += 1
+                    continue
+
+            if writer is not None:
+                with profiler.stage("tail.render", events=1):
+                    writer.write(tail_record(event) if fmt == "csv" else event)
+                event_count += 1
+                continue
+
+            print(line, flush=True)
+            event_count += 1
+            if args.details:
+                with profiler.stage("tail.render"):
+                    details = render_tail_details(event, mode)
+                for detail_line in details:
+                    print(detail_line, flush=True)
+
+        # The stream ended (or was stopped) between events
+        if handled is not None:
+            cursor.advance(handled)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if writer is not None:
+            writer.close()
+        if aggregator is not None:
+            for summary in aggregator.finish():
+                print(render_tail_summary(summary, mode), flush=True)
+        if recorder is not None:
+            recorder.close()
+        if cursor is not None:
+            cursor.close()
+
+    if sampler is not None:
+        print(
+            f"\n[tail stopped, {event_count} sampled events received, ~{sampler.scale(event_count)} total]",
+            file=notices,
+            flush=True,
+        )
+    else:
+        print(f"\n[tail stopped, {event_count} events received]", file=notices, flush=True)
+    if buffered.dropped or buffered.summarized:
+        print(
+            f"[overflow ({buffered.policy}, buffer {buffered.capacity}): "
+            f"{buffered.dropped + buffered.summarized} events not shown]",
+            file=notices,
+            flush=True,
+        )
+    if recorder is not None:
+        if recorder.error is not None:
+            print(f"[recording failed: {recorder.error}]", file=sys.stderr, flush=True)
+        print(
+            f"[recorded {recorder.events} events to {args.record} ({len(recorder.segments)} segments)]",
+            file=notices,
+            flush=True,
+        )
+        if recorder.blocked:
+            print(f"[recording fell behind: reading paused {recorder.blocked} times for the disk]", file=notices, flush=True)
+    if cursor is not None and cursor.error is not None:
+        print(f"[cursor checkpoint failed: {cursor.error}]", file=sys.stderr, flush=True)
+    if group is not None:
+        print(
+            f"[group {args.group}: {group.rebalances} rebalances, "
+            f"{grouped.caught_up} events caught up, {grouped.skipped} left to other members]",
+            file=notices,
+            flush=True,
+        )
+    elif cursor is not None and cursor.error is None and cursor.index is not None:
+        print(f"[cursor at index {cursor.index} saved to {args.cursor_file}]", file=notices, flush=True)
+    if resumable.stalls:
+        print(f"[{resumable.stalls} stalled subscriptions re-opened]", file=notices, flush=True)
+    if backfill is not None and backfill.gaps_detected:
+        print(
+            f"[index gaps: {backfill.gaps_detected} detected, {backfill.gaps_repaired} repaired, "
+            f"{backfill.events_backfilled} events backfilled]",
+            file=notices,
+            flush=True,
+        )
+        unrepaired = backfill.gaps_detected - backfill.gaps_repaired
+        if cursor is not None and unrepaired:
+            print(
+                f"[cursor moved past {unrepaired} index gaps that could not be backfilled; "
+                f"the events missing there were not processed]",
+                file=sys.stderr,
+                flush=True,
+            )
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import threading
+
+from ..ansi_colors import detect_color_mode
+from ..dashboard import LiveDashboard
+from ..gateway_client import GatewayClient
+from ..tail_stream import ResumableTail, install_stop_handlers
+from ..turn_tracker import TurnTracker
+
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+
+
+def top_view(client: GatewayClient, args: argparse.Namespace) -> None:
+    """Redraw a live dashboard at a bounded frame rate while a reader thread feeds it."""
+    if args.fps <= 0:
+        print(f"Invalid --fps value: {args.fps}. Must be > 0.", file=sys.stderr)
+        sys.exit(1)
+
+    mode = detect_color_mode(args.color)
+    interactive = sys.stdout.isatty()
+    dashboard = LiveDashboard(
+        window_secs=args.window,
+        tracker=TurnTracker(orphan_after_secs=args.orphan_after),
+    )
+    lock = threading.Lock()
+    stop_event = threading.Event()
+    install_stop_handlers(stop_event)
+    status: list[str] = []
+
+    def on_disconnect(exc: BaseException, delay: float) -> None:
+        status[:] = [f"[connection lost: {exc}, reconnecting in {delay:.1f}s...]"]
+
+    stream = ResumableTail(
+        client,
+        since=args.since,
+        backlog=args.backlog,
+        stop_event=stop_event,
+        on_disconnect=on_disconnect,
+    )
+
+    def read() -> None:
+        try:
+            for event in stream:
+                with lock:
+                    dashboard.feed(event)
+                status.clear()
+        finally:
+            # Redraw one last time when the stream ends on its own
+            stop_event.set()
+
+    reader = threading.Thread(target=read, name="top-reader", daemon=True)
+    reader.start()
+
+    frame_interval = 1.0 / args.fps
+    try:
+        while True:
+            stopped = stop_event.wait(timeout=frame_interval)
+            with lock:
+                lines = dashboard.render(mode)
+            frame = "\n".join(lines + status)
+            if interactive:
+                sys.stdout.write(CLEAR_SCREEN + frame + "\n")
+            else:
+                sys.stdout.write(frame + "\n\n")
+            sys.stdout.flush()
+            if stopped:
+                break
+    except KeyboardInterrupt:
+        stop_event.set()
+
+    print(f"[top stopped, {dashboard.total_events} events received]", flush=True)
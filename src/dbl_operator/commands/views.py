@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import Iterator
+
+from ..gateway_client import GatewayClient
+from ..output import open_writer, write_records
+from ..presenters import (
+    audit_view_records,
+    decision_view_records,
+    render_audit_view,
+    render_decision_view,
+    render_thread_view,
+    thread_view_records,
+)
+
+
+def _read_id_lines(path: str) -> Iterator[list[str]]:
+    """Fields of each non-blank, non-comment line of an id file (``-`` = stdin)."""
+    handle = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        for line in handle:
+            line = line.split("#", 1)[0].strip()
+            if line:
+                yield line.replace(",", " ").split()
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+
+def _thread_ids(args: argparse.Namespace) -> list[str]:
+    ids = list(args.thread_id or [])
+    if args.ids_file:
+        ids.extend(fields[0] for fields in _read_id_lines(args.ids_file))
+    if not ids:
+        print("thread-view needs --thread-id or --ids-file", file=sys.stderr)
+        sys.exit(1)
+    return list(dict.fromkeys(ids))
+
+
+def _turn_pairs(args: argparse.Namespace) -> list[tuple[str, str]]:
+    pairs = []
+    if args.turn_id:
+        if not args.thread_id:
+            print("--turn-id needs --thread-id", file=sys.stderr)
+            sys.exit(1)
+        pairs.extend((args.thread_id, turn_id) for turn_id in args.turn_id)
+    if args.ids_file:
+        for fields in _read_id_lines(args.ids_file):
+            if len(fields) != 2:
+                print(f"Invalid line in {args.ids_file}: expected THREAD_ID TURN_ID", file=sys.stderr)
+                sys.exit(1)
+            pairs.append((fields[0], fields[1]))
+    if not pairs:
+        print("decision-view needs --thread-id/--turn-id or --ids-file", file=sys.stderr)
+        sys.exit(1)
+    return list(dict.fromkeys(pairs))
+
+
+def thread_view(client: GatewayClient, args: argparse.Namespace) -> None:
+    thread_ids = _thread_ids(args)
+    if len(thread_ids) > 1:
+        _thread_view_batch(client, args, thread_ids)
+        return
+    thread_id = thread_ids[0]
+    timeline = client.get_timeline(thread_id)
+    if args.format != "text":
+        write_records(args.format, thread_view_records(thread_id, timeline))
+        return
+    print(render_thread_view(thread_id, timeline))
+
+
+def _thread_view_batch(client: GatewayClient, args: argparse.Namespace, thread_ids: list[str]) -> None:
+    # One snapshot answers every thread
+    index = client.ledger_index()
+    if args.format != "text":
+        with open_writer(args.format) as writer:
+            for thread_id in thread_ids:
+                for record in thread_view_records(thread_id, index.timeline(thread_id)):
+                    writer.write(record)
+        return
+    for n, thread_id in enumerate(thread_ids):
+        if n:
+            print()
+        print(render_thread_view(thread_id, index.timeline(thread_id)))
+
+
+def decision_view(client: GatewayClient, args: argparse.Namespace) -> None:
+    pairs = _turn_pairs(args)
+    if len(pairs) > 1:
+        _decision_view_batch(client, args, pairs)
+        return
+    thread_id, turn_id = pairs[0]
+    view = client.get_decision(thread_id, turn_id)
+    if args.format != "text":
+        write_records(args.format, decision_view_records(thread_id, turn_id, view))
+        return
+    print(render_decision_view(view))
+
+
+def _decision_view_batch(client: GatewayClient, args: argparse.Namespace, pairs: list[tuple[str, str]]) -> None:
+    # One snapshot answers every turn
+    index = client.ledger_index()
+    if args.format != "text":
+        with open_writer(args.format) as writer:
+            for thread_id, turn_id in pairs:
+                for record in decision_view_records(thread_id, turn_id, index.decision(thread_id, turn_id)):
+                    writer.write(record)
+        return
+    for n, (thread_id, turn_id) in enumerate(pairs):
+        if n:
+            print()
+        print(f"Thread: {thread_id}  Turn: {turn_id}")
+        print(render_decision_view(index.decision(thread_id, turn_id)))
+
+
+def audit_view(client: GatewayClient, args: argparse.Namespace) -> None:
+    events = client.get_audit(args.thread_id, turn_id=args.turn_id)
+    if args.format != "text":
+        write_records(args.format, audit_view_records(events))
+        return
+    print(render_audit_view(events))
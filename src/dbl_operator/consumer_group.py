@@ -0,0 +1,346 @@
+"""Split one gateway tail across several operator processes (``tail --group``)."""
+from __future__ import annotations
+
+import json
+import math
+import os
+import socket
+import tempfile
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Callable, Iterable, Iterator
+
+from .cursor import TailCursor
+from .gateway_client import GatewayClient
+from .parallel import shard_of
+from .tail_stream import event_index
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+__all__ = ["ConsumerGroup", "GroupTail", "assign"]
+
+GROUP_NAME = "group.json"
+LOCK_NAME = "group.lock"
+
+# Events per /snapshot page when catching up on a partition taken over
+_CATCHUP_PAGE = 1000
+
+
+@contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """Exclusive lock on ``path`` across processes, held for the ``with`` block."""
+    with open(path, "a+b") as fh:
+        _lock(fh)
+        try:
+            yield
+        finally:
+            _unlock(fh)
+
+
+def _lock(fh: IO[bytes]) -> None:
+    if fcntl is not None:
+        fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+        return
+    fh.seek(0)
+    while True:
+        try:
+            msvcrt.locking(fh.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            # LK_LOCK gives up after ~10s; keep waiting like flock does
+            continue
+
+
+def _unlock(fh: IO[bytes]) -> None:
+    if fcntl is not None:
+        fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+        return
+    fh.seek(0)
+    msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _write_json(path: Path, data: dict[str, Any]) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(data, fh)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _read_json(path: Path) -> dict[str, Any] | None:
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _lease_expiry(lease: dict[str, Any]) -> float:
+    """When ``lease`` runs out; a lease without a readable expiry is already expired."""
+    try:
+        expires = float(lease["expires"])
+    except (KeyError, TypeError, ValueError):
+        return 0.0
+    return expires if math.isfinite(expires) else 0.0
+
+
+def assign(members: Iterable[str], partitions: int) -> dict[int, str]:
+    """
+    Owner of every partition by rendezvous hashing.
+
+    Each member computes the same map from the same member list, and a
+    member joining or leaving only moves the partitions it gains or owned.
+    """
+    names = sorted(set(members))
+    if not names:
+        return {}
+    return {p: max(names, key=lambda m: (zlib.crc32(f"{m}/{p}".encode("utf-8")), m)) for p in range(partitions)}
+
+
+class ConsumerGroup:
+    """
+    Membership of one operator process in a consumer group.
+
+    Members share ``directory``: each holds a lease file in ``members/``
+    that it renews every ``lease_secs / 3`` on a heartbeat thread, under
+    an exclusive file lock. Leases that were not renewed for ``lease_secs``
+    belong to dead members and are removed by whoever sees them next.
+    Events are partitioned by a stable hash of ``thread_id`` into
+    ``partitions`` partitions, which are assigned to the live members by
+    rendezvous hashing, so every member derives the same assignment.
+
+    Every partition has a cursor file in ``cursors/``; the owner advances
+    it in batches (see ``TailCursor``) and a member that takes over a
+    partition resumes from it. During a handover both members may process
+    the same events for up to one lease period: delivery is at-least-once.
+    """
+
+    def __init__(
+        self,
+        directory: Path | str,
+        *,
+        partitions: int = 16,
+        member_id: str | None = None,
+        lease_secs: float = 10.0,
+        checkpoint_events: int = 100,
+        checkpoint_secs: float = 1.0,
+        on_rebalance: Callable[[frozenset[int]], None] | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if partitions < 1:
+            raise ValueError("partitions must be at least 1")
+        if lease_secs <= 0:
+            raise ValueError("lease_secs must be positive")
+        self.directory = Path(directory)
+        self.partitions = partitions
+        self.member_id = member_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.lease_secs = lease_secs
+        self.checkpoint_events = checkpoint_events
+        self.checkpoint_secs = checkpoint_secs
+        self.on_rebalance = on_rebalance
+        self.clock = clock
+        self.members: list[str] = []
+        # Replaced, never mutated, so readers need no lock
+        self.owned: frozenset[int] = frozenset()
+        self.rebalances = 0
+        self.error: BaseException | None = None
+        self._cursors: dict[int, TailCursor] = {}
+        self._starts: dict[int, int | None] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        for sub in ("members", "cursors"):
+            (self.directory / sub).mkdir(parents=True, exist_ok=True)
+        self._check_layout()
+
+    def _check_layout(self) -> None:
+        path = self.directory / GROUP_NAME
+        with _file_lock(self.directory / LOCK_NAME):
+            layout = _read_json(path)
+            if layout is None:
+                _write_json(path, {"version": 1, "partitions": self.partitions})
+            elif layout.get("partitions") != self.partitions:
+                raise ValueError(
+                    f"group {self.directory} has {layout.get('partitions')} partitions, not {self.partitions}"
+                )
+
+    @property
+    def _lease_path(self) -> Path:
+        return self.directory / "members" / f"{self.member_id}.json"
+
+    def partition_of(self, event: dict[str, Any]) -> int:
+        return shard_of(str(event.get("thread_id") or event.get("turn_id") or ""), self.partitions)
+
+    def join(self, *, heartbeat: bool = True) -> None:
+        """Register, take the current assignment and (optionally) keep the lease alive."""
+        self.refresh()
+        if heartbeat and self._thread is None:
+            self._thread = threading.Thread(target=self._heartbeat, name="group-heartbeat", daemon=True)
+            self._thread.start()
+
+    def leave(self) -> None:
+        """Checkpoint every owned partition and give up the lease, so others take over at once."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        with self._lock:
+            for cursor in self._cursors.values():
+                cursor.close()
+            self._cursors.clear()
+            self.owned = frozenset()
+        with _file_lock(self.directory / LOCK_NAME):
+            try:
+                self._lease_path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def close(self) -> None:
+        self.leave()
+
+    def refresh(self) -> None:
+        """Renew the lease, drop expired ones and apply the resulting assignment."""
+        now = self.clock()
+        with _file_lock(self.directory / LOCK_NAME):
+            _write_json(self._lease_path, {"member": self.member_id, "pid": os.getpid(), "expires": now + self.lease_secs})
+            members = []
+            for path in (self.directory / "members").glob("*.json"):
+                lease = _read_json(path)
+                if lease is None or _lease_expiry(lease) < now:
+                    path.unlink(missing_ok=True)
+                    continue
+                members.append(str(lease.get("member", path.stem)))
+        owners = assign(members, self.partitions)
+        owned = frozenset(p for p, m in owners.items() if m == self.member_id)
+        self.members = sorted(members)
+        if owned == self.owned:
+            return
+        with self._lock:
+            for p in self.owned - owned:
+                # The new owner resumes from here
+                self._cursors.pop(p).close()
+                self._starts.pop(p, None)
+            for p in owned - self.owned:
+                cursor = TailCursor(
+                    self.directory / "cursors" / f"partition-{p:04d}.json",
+                    every_events=self.checkpoint_events,
+                    every_secs=self.checkpoint_secs,
+                )
+                self._cursors[p] = cursor
+                self._starts[p] = cursor.index
+            had = self.owned
+            self.owned = owned
+        if had:
+            self.rebalances += 1
+        if self.on_rebalance is not None:
+            self.on_rebalance(owned)
+
+    def _heartbeat(self) -> None:
+        while not self._stop.wait(self.lease_secs / 3):
+            try:
+                self.refresh()
+            except Exception as exc:
+                # Retried on the next beat; the lease outlives a few misses
+                self.error = exc
+
+    def start_index(self, partition: int) -> int | None:
+        """The cursor of ``partition`` when this member took it over."""
+        return self._starts.get(partition)
+
+    def resume_index(self) -> int | None:
+        """Where the subscription starts: the oldest cursor among owned partitions."""
+        starts = [s for p in self.owned if (s := self._starts.get(p)) is not None]
+        return min(starts, default=None)
+
+    def advance(self, event: dict[str, Any]) -> None:
+        """Mark ``event`` as processed in its partition's cursor."""
+        with self._lock:
+            cursor = self._cursors.get(self.partition_of(event))
+            if cursor is not None:
+                cursor.advance(event)
+
+
+class GroupTail:
+    """
+    Keep the events of the partitions this member owns.
+
+    ``events`` is the full stream of one gateway in index order. Events of
+    other partitions, and events at or before the cursor a partition was
+    taken over at, are skipped. When a rebalance hands this member a
+    partition whose cursor lags the stream, the missed range is fetched
+    from ``/snapshot`` (at most ``max_catchup`` events) and emitted first.
+    """
+
+    def __init__(
+        self,
+        events: Iterable[dict[str, Any]],
+        group: ConsumerGroup,
+        client: GatewayClient,
+        *,
+        max_catchup: int = 10_000,
+    ) -> None:
+        self.events = events
+        self.group = group
+        self.client = client
+        self.max_catchup = max_catchup
+        self.skipped = 0
+        self.caught_up = 0
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        group = self.group
+        view = group.owned
+        position: int | None = None
+        for event in self.events:
+            owned = group.owned
+            if owned is not view:
+                gained = owned - view
+                view = owned
+                if gained and position is not None:
+                    yield from self._catch_up(gained, position)
+            idx = event_index(event)
+            if idx is not None:
+                position = idx
+            partition = group.partition_of(event)
+            start = group.start_index(partition)
+            if partition not in view or (idx is not None and start is not None and idx <= start):
+                self.skipped += 1
+                continue
+            yield event
+
+    def _catch_up(self, gained: frozenset[int], position: int) -> Iterator[dict[str, Any]]:
+        starts = [s for p in gained if (s := self.group.start_index(p)) is not None and s < position]
+        if not starts:
+            return
+        offset = min(starts) + 1
+        end = min(position, offset + self.max_catchup - 1)
+        while offset <= end:
+            page = self.client.fetch_events(limit=min(_CATCHUP_PAGE, end - offset + 1), offset=offset)
+            if not page:
+                return
+            for event in page:
+                idx = event_index(event)
+                if idx is None or idx > end:
+                    continue
+                partition = self.group.partition_of(event)
+                start = self.group.start_index(partition)
+                if partition in gained and start is not None and idx > start:
+                    self.caught_up += 1
+                    yield event
+            last = event_index(page[-1])
+            if last is None or last < offset:
+                return
+            offset = last + 1
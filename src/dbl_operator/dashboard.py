@@ -0,0 +1,180 @@
+"""Incremental model behind the ``top`` live dashboard."""
+from __future__ import annotations
+
+import heapq
+import time
+from collections import Counter, deque
+from typing import Any
+
+from .ansi_colors import FG_GREEN, FG_RED, FG_YELLOW, ColorMode, style
+from .turn_tracker import TurnTracker
+
+__all__ = ["LiveDashboard"]
+
+KINDS = ("INTENT", "DECISION", "EXECUTION")
+
+
+class _Bucket:
+    __slots__ = ("second", "kinds", "allow", "deny", "reasons")
+
+    def __init__(self, second: int) -> None:
+        self.second = second
+        self.kinds: Counter = Counter()
+        self.allow = 0
+        self.deny = 0
+        self.reasons: Counter = Counter()
+
+
+class LiveDashboard:
+    """
+    Rolling live view over the tail stream.
+
+    ``feed`` does constant work per event: it bumps the current one-second
+    bucket and the window totals, and appends latency samples to fixed-size
+    rings. ``render`` only reads the window totals and sorts at most
+    ``latency_samples`` values, so frame cost does not grow with traffic.
+    """
+
+    def __init__(
+        self,
+        *,
+        window_secs: int = 10,
+        latency_samples: int = 2048,
+        top_reasons: int = 5,
+        tracker: TurnTracker | None = None,
+    ) -> None:
+        self.window_secs = window_secs
+        self.top_reasons = top_reasons
+        self.tracker = tracker or TurnTracker()
+        self._buckets: deque[_Bucket] = deque()
+        self._kinds: Counter = Counter()
+        self._allow = 0
+        self._deny = 0
+        self._reasons: Counter = Counter()
+        self.policy_latency: deque[float] = deque(maxlen=latency_samples)
+        self.exec_latency: deque[float] = deque(maxlen=latency_samples)
+        self.active_policy: tuple[str, str] | None = None
+        self.total_events = 0
+        self.last_index: int | None = None
+        self._started = time.monotonic()
+
+    def feed(self, event: dict[str, Any], now: float | None = None) -> None:
+        now = time.monotonic() if now is None else now
+        bucket = self._current_bucket(now)
+        obs = self.tracker.observe(event)
+
+        self.total_events += 1
+        if isinstance(event.get("index"), int):
+            self.last_index = event["index"]
+        bucket.kinds[obs.kind] += 1
+        self._kinds[obs.kind] += 1
+
+        if obs.decision is not None:
+            payload = event.get("payload") if isinstance(event.get("payload"), dict) else {}
+            self.active_policy = (
+                str(payload.get("policy_id") or "unknown"),
+                str(payload.get("policy_version") or "unknown"),
+            )
+            if obs.decision == "ALLOW":
+                bucket.allow += 1
+                self._allow += 1
+            elif obs.decision == "DENY":
+                bucket.deny += 1
+                self._deny += 1
+            codes = payload.get("reason_codes") or []
+            if not codes and payload.get("reason_code"):
+                codes = [payload["reason_code"]]
+            for code in codes if isinstance(codes, list) else [codes]:
+                bucket.reasons[str(code)] += 1
+                self._reasons[str(code)] += 1
+
+        if obs.intent_to_decision_ms is not None:
+            self.policy_latency.append(obs.intent_to_decision_ms)
+        if obs.decision_to_execution_ms is not None:
+            self.exec_latency.append(obs.decision_to_execution_ms)
+
+    def _current_bucket(self, now: float) -> _Bucket:
+        second = int(now)
+        self._expire(second)
+        if not self._buckets or self._buckets[-1].second != second:
+            self._buckets.append(_Bucket(second))
+        return self._buckets[-1]
+
+    def _expire(self, second: int) -> None:
+        oldest = second - self.window_secs + 1
+        while self._buckets and self._buckets[0].second < oldest:
+            old = self._buckets.popleft()
+            self._kinds.subtract(old.kinds)
+            self._allow -= old.allow
+            self._deny -= old.deny
+            self._reasons.subtract(old.reasons)
+            for code in old.reasons:
+                if self._reasons[code] <= 0:
+                    del self._reasons[code]
+
+    def rates(self, now: float | None = None) -> dict[str, float]:
+        """Events per second by kind over the rolling window."""
+        now = time.monotonic() if now is None else now
+        self._expire(int(now))
+        span = max(1.0, min(float(self.window_secs), now - self._started))
+        return {kind: self._kinds[kind] / span for kind in KINDS}
+
+    def deny_rate(self) -> float:
+        decided = self._allow + self._deny
+        return (self._deny / decided * 100.0) if decided else 0.0
+
+    @staticmethod
+    def _percentiles(samples: deque[float]) -> tuple[float, float, float, int]:
+        data = sorted(samples)
+        if not data:
+            return (0.0, 0.0, 0.0, 0)
+
+        def get_p(p: float) -> float:
+            return data[min(int(len(data) * p), len(data) - 1)]
+
+        return (get_p(0.50), get_p(0.95), get_p(0.99), len(data))
+
+    def render(self, mode: ColorMode, now: float | None = None) -> list[str]:
+        rates = self.rates(now)
+        tracker = self.tracker
+        lines = []
+        policy = f"{self.active_policy[0]}@{self.active_policy[1]}" if self.active_policy else "-"
+        lines.append(style("dbl-operator top", mode=mode, bold=True) + f"  window={self.window_secs}s  policy={policy}")
+        lines.append(f"events={self.total_events}  last_index={self.last_index if self.last_index is not None else '-'}")
+        lines.append("")
+
+        lines.append(f"{'Kind':<12} | {'Events/s':>9}")
+        lines.append("-" * 24)
+        for kind in KINDS:
+            lines.append(f"{kind:<12} | {rates[kind]:9.1f}")
+        lines.append("")
+
+        deny = self.deny_rate()
+        deny_fg = FG_RED if deny >= 50.0 else FG_YELLOW if deny > 0 else FG_GREEN
+        lines.append(
+            f"Decisions: ALLOW={self._allow}  DENY={self._deny}  deny rate="
+            + style(f"{deny:.1f}%", mode=mode, fg=deny_fg, bold=True)
+        )
+        orphan_fg = FG_RED if tracker.orphaned_open else None
+        lines.append(
+            f"Turns: open={tracker.open_turns}  orphaned="
+            + style(str(tracker.orphaned_open), mode=mode, fg=orphan_fg)
+        )
+        lines.append("")
+
+        header = f"{'Latency (ms)':<20} | {'P50':>8} | {'P95':>8} | {'P99':>8} | {'Samples':>7}"
+        lines.append(header)
+        lines.append("-" * len(header))
+        for name, samples in (("Intent -> Decision", self.policy_latency), ("Decision -> Exec", self.exec_latency)):
+            p50, p95, p99, count = self._percentiles(samples)
+            lines.append(f"{name:<20} | {p50:8.1f} | {p95:8.1f} | {p99:8.1f} | {count:7d}")
+        lines.append("")
+
+        lines.append("Top Reason Codes")
+        lines.append("----------------")
+        top = heapq.nlargest(self.top_reasons, self._reasons.items(), key=lambda kv: kv[1])
+        if not top:
+            lines.append("(none in window)")
+        for code, count in top:
+            lines.append(f"{code:<30}: {count}")
+        return lines
@@ -4,6 +4,16 @@ from dataclasses import dataclass
 from typing import Any, Mapping, Sequence
 
 
+def event_index(event: Mapping[str, Any]) -> int | None:
+    """Return the ledger index of an event, accepting ints and digit strings."""
+    idx = event.get("index")
+    if isinstance(idx, int):
+        return idx
+    if isinstance(idx, str) and idx.isdigit():
+        return int(idx)
+    return None
+
+
 @dataclass(frozen=True)
 class Anchors:
     thread_id: str
@@ -67,3 +77,21 @@ class AuditEventViewModel:
     event_digest: str | None
     v_digest: str | None
     payload: Mapping[str, Any]
+
+
+@dataclass(frozen=True)
+class Partition:
+    """A ``stream_id``/``lane`` selector for snapshot queries; ``None`` means any."""
+
+    stream_id: str | None = None
+    lane: str | None = None
+
+    @classmethod
+    def parse(cls, spec: str) -> "Partition":
+        """Parse ``STREAM``, ``STREAM:LANE`` or ``:LANE``."""
+        stream, _, lane = spec.partition(":")
+        return cls(stream_id=stream.strip() or None, lane=lane.strip() or None)
+
+    @property
+    def label(self) -> str:
+        return f"{self.stream_id or '*'}/{self.lane or '*'}"
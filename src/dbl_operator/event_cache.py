@@ -0,0 +1,92 @@
+"""In-process cache of fetched ``/snapshot`` windows, revalidated via ``t_index``."""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Sequence
+
+__all__ = ["EventCache", "EventWindow", "window_key"]
+
+DEFAULT_MAX_WINDOWS = 32
+
+
+def window_key(
+    limit: int,
+    offset: int | None = None,
+    stream_id: str | None = None,
+    lane: str | None = None,
+) -> tuple[Hashable, ...]:
+    """Key a snapshot window by exactly the parameters sent to ``/snapshot``."""
+    return (offset or 0, limit, stream_id, lane)
+
+
+class EventWindow:
+    """
+    Events of one snapshot window and the ledger position they are current to.
+
+    ``high_water`` is the highest ledger index the window has been checked
+    against: every event up to it that belongs in the window is present.
+    Windows are replaced, never mutated, so a reader never sees a half-applied
+    delta.
+    """
+
+    __slots__ = ("events", "high_water")
+
+    def __init__(self, events: Sequence[dict[str, Any]], high_water: int) -> None:
+        self.events = tuple(events)
+        self.high_water = high_water
+
+    def is_full(self, limit: int) -> bool:
+        # The ledger is append-only, so a window that reached its limit can
+        # no longer change.
+        return len(self.events) >= limit
+
+    def extended(self, delta: Sequence[dict[str, Any]], high_water: int, limit: int) -> "EventWindow":
+        """A new window with ``delta`` appended; events already held are skipped."""
+        fresh = [e for e in delta if not isinstance(e.get("index"), int) or e["index"] > self.high_water]
+        return EventWindow((self.events + tuple(fresh))[:limit], max(high_water, self.high_water))
+
+
+class EventCache:
+    """
+    LRU map of snapshot windows for one client, safe to share across threads.
+
+    The cache holds no policy: ``HttpGatewayClient`` decides when a window is
+    served as is, topped up with the tail delta, or fetched again. ``hits``,
+    ``deltas`` and ``misses`` count those outcomes.
+    """
+
+    def __init__(self, max_windows: int = DEFAULT_MAX_WINDOWS) -> None:
+        if max_windows < 1:
+            raise ValueError("max_windows must be at least 1")
+        self.max_windows = max_windows
+        self._windows: OrderedDict[tuple[Hashable, ...], EventWindow] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.deltas = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
+    def get(self, key: tuple[Hashable, ...]) -> EventWindow | None:
+        with self._lock:
+            window = self._windows.get(key)
+            if window is not None:
+                self._windows.move_to_end(key)
+            return window
+
+    def put(self, key: tuple[Hashable, ...], window: EventWindow) -> None:
+        with self._lock:
+            self._windows[key] = window
+            self._windows.move_to_end(key)
+            while len(self._windows) > self.max_windows:
+                self._windows.popitem(last=False)
+
+    def count(self, outcome: str) -> None:
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._windows.clear()
@@ -0,0 +1,279 @@
+"""Offline export of the ledger from ``/snapshot`` into checksummed chunk files."""
+from __future__ import annotations
+
+import csv
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Iterator, Sequence
+
+from .gateway_client import GatewayClient
+from .profiler import get_profiler
+from .tail_presenter import TAIL_COLUMNS, tail_record
+from .tail_stream import event_index
+
+__all__ = ["EXPORT_COLUMNS", "EXPORT_FORMATS", "MANIFEST_NAME", "LedgerExporter", "load_manifest"]
+
+EXPORT_FORMATS = ("ndjson.gz", "csv", "parquet")
+MANIFEST_NAME = "manifest.json"
+# Flat columns of CSV and Parquet chunks; ``payload`` holds the JSON-encoded payload
+EXPORT_COLUMNS = TAIL_COLUMNS + ("payload",)
+
+# Settings a resumed export must share with the manifest it continues
+_LAYOUT_KEYS = ("format", "chunk_events", "from_index", "stream_id", "lane")
+
+
+def load_manifest(directory: Path) -> dict[str, Any] | None:
+    """The manifest of an export directory, or None if there is none."""
+    try:
+        with open(Path(directory) / MANIFEST_NAME, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) and isinstance(data.get("chunks"), list) else None
+
+
+def _flat(event: dict[str, Any]) -> dict[str, Any]:
+    record = tail_record(event)
+    payload = event.get("payload")
+    record["payload"] = json.dumps(payload, separators=(",", ":"), default=str) if payload is not None else None
+    return record
+
+
+def _write_ndjson_gz(path: Path, events: Sequence[dict[str, Any]]) -> None:
+    # mtime=0 keeps the bytes (and checksum) of a re-export identical
+    with open(path, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as fh:
+        for event in events:
+            fh.write((json.dumps(event, ensure_ascii=False, separators=(",", ":"), default=str) + "\n").encode("utf-8"))
+
+
+def _write_csv(path: Path, events: Sequence[dict[str, Any]]) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as fh:
+        writer = csv.DictWriter(fh, fieldnames=EXPORT_COLUMNS, lineterminator="\n")
+        writer.writeheader()
+        for event in events:
+            writer.writerow(_flat(event))
+
+
+def _write_parquet(path: Path, events: Sequence[dict[str, Any]]) -> None:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    records = [_flat(event) for event in events]
+    columns = {
+        c: [r[c] if r[c] is None or c == "index" else str(r[c]) for r in records]
+        for c in EXPORT_COLUMNS
+    }
+    schema = pa.schema([(c, pa.int64() if c == "index" else pa.string()) for c in EXPORT_COLUMNS])
+    pq.write_table(pa.table(columns, schema=schema), path, compression="zstd")
+
+
+_WRITERS: dict[str, Callable[[Path, Sequence[dict[str, Any]]], None]] = {
+    "ndjson.gz": _write_ndjson_gz,
+    "csv": _write_csv,
+    "parquet": _write_parquet,
+}
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _store_json(path: Path, data: dict[str, Any]) -> None:
+    # Write-then-rename: an interrupted export never leaves a torn manifest
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(data, fh, indent=1)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+class LedgerExporter:
+    """
+    Page through ``/snapshot`` and write the ledger as fixed index-range chunks.
+
+    Chunk ``k`` holds the events with index ``from_index + k * chunk_events``
+    up to the next chunk's first index, so its size is bounded and its place
+    in the ledger is known before it is fetched. Chunks are downloaded on
+    ``workers`` threads, each in ``page_size`` windows, written to a
+    temporary file and renamed into place. ``manifest.json`` lists every
+    finished chunk with its index range, event count, byte size and SHA-256
+    and is rewritten as each chunk completes; running the export again
+    skips chunks that are already in the manifest and on disk, and re-fetches
+    a trailing chunk that was cut short by the end of the ledger.
+    """
+
+    def __init__(
+        self,
+        client: GatewayClient,
+        directory: Path | str,
+        *,
+        fmt: str = "ndjson.gz",
+        chunk_events: int = 100_000,
+        page_size: int = 1000,
+        workers: int = 4,
+        from_index: int = 0,
+        to_index: int | None = None,
+        stream_id: str | None = None,
+        lane: str | None = None,
+        on_chunk: Callable[[dict[str, Any]], None] | None = None,
+    ) -> None:
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"format must be one of {', '.join(EXPORT_FORMATS)}, got {fmt!r}")
+        if fmt == "parquet":
+            try:
+                import pyarrow.parquet  # noqa: F401
+            except ImportError:
+                raise ValueError("parquet export needs pyarrow (pip install 'dbl-operator[parquet]')") from None
+        if chunk_events < 1 or page_size < 1 or workers < 1:
+            raise ValueError("chunk_events, page_size and workers must be at least 1")
+        if from_index < 0:
+            raise ValueError("from_index must not be negative")
+        self.client = client
+        self.directory = Path(directory)
+        self.fmt = fmt
+        self.chunk_events = chunk_events
+        self.page_size = page_size
+        self.workers = workers
+        self.from_index = from_index
+        self.to_index = to_index
+        self.stream_id = stream_id
+        self.lane = lane
+        self.on_chunk = on_chunk
+        self.events = 0
+        self.resumed = 0
+
+    def _ranges(self, to_index: int) -> Iterator[tuple[int, int, int]]:
+        seq, first = 1, self.from_index
+        while first <= to_index:
+            yield seq, first, min(first + self.chunk_events - 1, to_index)
+            seq, first = seq + 1, first + self.chunk_events
+
+    def run(self) -> dict[str, Any]:
+        """Export everything up to ``to_index`` (default: the current ``t_index``); returns the manifest."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        to_index = self.to_index
+        if to_index is None:
+            t_index = self.client.get_status().get("t_index")
+            to_index = t_index if isinstance(t_index, int) else -1
+        manifest: dict[str, Any] = {
+            "version": 1,
+            "format": self.fmt,
+            "chunk_events": self.chunk_events,
+            "from_index": self.from_index,
+            "to_index": to_index,
+            "stream_id": self.stream_id,
+            "lane": self.lane,
+            "complete": False,
+            "chunks": [],
+        }
+        previous = load_manifest(self.directory)
+        if previous is not None and any(previous.get(k) != manifest[k] for k in _LAYOUT_KEYS):
+            raise ValueError(f"{self.directory} holds an export with different settings; use an empty directory")
+        done = {c.get("file"): c for c in (previous or {}).get("chunks", []) if isinstance(c, dict)}
+
+        chunks: dict[int, dict[str, Any]] = {}
+        todo = []
+        for seq, first, last in self._ranges(to_index):
+            entry = done.get(self._chunk_name(seq))
+            if (
+                entry is not None
+                and entry.get("last_index") == last
+                and (self.directory / entry["file"]).is_file()
+                and (self.directory / entry["file"]).stat().st_size == entry.get("bytes")
+            ):
+                chunks[seq] = entry
+                self.resumed += 1
+            else:
+                todo.append((seq, first, last))
+
+        manifest["chunks"] = [chunks[s] for s in sorted(chunks)]
+        _store_json(self.directory / MANIFEST_NAME, manifest)
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="export") as pool:
+            futures = [pool.submit(self._export_chunk, *item) for item in todo]
+            try:
+                for future in as_completed(futures):
+                    entry = future.result()
+                    chunks[int(entry["seq"])] = entry
+                    manifest["chunks"] = [chunks[s] for s in sorted(chunks)]
+                    _store_json(self.directory / MANIFEST_NAME, manifest)
+                    if self.on_chunk is not None:
+                        self.on_chunk(entry)
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+        self.events = sum(int(c["events"]) for c in manifest["chunks"])
+        manifest["complete"] = True
+        _store_json(self.directory / MANIFEST_NAME, manifest)
+        return manifest
+
+    def _chunk_name(self, seq: int) -> str:
+        return f"chunk-{seq:06d}.{self.fmt}"
+
+    def _fetch_range(self, first: int, last: int) -> list[dict[str, Any]]:
+        events: list[dict[str, Any]] = []
+        offset = first
+        while offset <= last:
+            page = self.client.fetch_events(
+                limit=min(self.page_size, last - offset + 1), offset=offset, stream_id=self.stream_id, lane=self.lane
+            )
+            for event in page:
+                idx = event_index(event)
+                if idx is not None and first <= idx <= last:
+                    events.append(event)
+            tail = event_index(page[-1]) if page else None
+            # A short page is the end of the ledger (or of the filtered stream)
+            if tail is None or tail < offset or len(page) < min(self.page_size, last - offset + 1):
+                break
+            offset = tail + 1
+        events.sort(key=lambda e: event_index(e) or 0)
+        return events
+
+    def _export_chunk(self, seq: int, first: int, last: int) -> dict[str, Any]:
+        events = self._fetch_range(first, last)
+        name = self._chunk_name(seq)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=f".{name}-", suffix=".tmp")
+        os.close(fd)
+        tmp_path = Path(tmp)
+        try:
+            with get_profiler().stage("export.write", events=len(events)) as stage:
+                _WRITERS[self.fmt](tmp_path, events)
+                size = tmp_path.stat().st_size
+                stage.bytes = size
+            checksum = _sha256(tmp_path)
+            os.replace(tmp_path, self.directory / name)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        indices = [i for i in map(event_index, events) if i is not None]
+        stamps = sorted(str(e["timestamp"]) for e in events if e.get("timestamp"))
+        return {
+            "seq": seq,
+            "file": name,
+            "first_index": first,
+            "last_index": last,
+            "events": len(events),
+            "bytes": size,
+            "sha256": checksum,
+            "min_index": min(indices, default=None),
+            "max_index": max(indices, default=None),
+            "min_timestamp": stamps[0] if stamps else None,
+            "max_timestamp": stamps[-1] if stamps else None,
+        }
@@ -0,0 +1,224 @@
+"""Fan-in over several gateways: one merged tail, per-source resume positions."""
+from __future__ import annotations
+
+import heapq
+import queue
+import threading
+from typing import Any, Callable, Iterator, Sequence
+
+from .domain_types import (
+    AuditEventViewModel,
+    DecisionViewModel,
+    GatewayAck,
+    IntentEnvelope,
+    Partition,
+    TurnSummary,
+)
+from .gateway_client import GatewayClient
+from .ledger_index import LedgerIndex
+from .projections.latency import parse_ts
+from .tail_stream import ResumableTail, event_index
+
+__all__ = ["FanInGatewayClient"]
+
+_POLL_SECS = 0.25
+
+
+class FanInGatewayClient:
+    """
+    Present several gateways as one ``GatewayClient``.
+
+    ``tail`` holds one resumable SSE subscription per source on its own
+    thread, tags every event with ``origin`` (the source base URL) and
+    merges them into a single stream. Each source keeps its own resume
+    index in ``positions``. With ``ordered`` set, events pass through a
+    reorder buffer of at most ``reorder_window`` events and are emitted in
+    timestamp order within it; the buffer drains after ``reorder_delay_secs``
+    without new events.
+
+    Writes go to the first (primary) source. Reads fan out and concatenate.
+    """
+
+    def __init__(
+        self,
+        clients: Sequence[GatewayClient],
+        *,
+        ordered: bool = False,
+        reorder_window: int = 256,
+        reorder_delay_secs: float = 0.5,
+        queue_size: int = 10_000,
+    ) -> None:
+        if not clients:
+            raise ValueError("FanInGatewayClient needs at least one client")
+        self.clients = list(clients)
+        self.origins = [str(getattr(c, "base_url", f"source-{i}")) for i, c in enumerate(self.clients)]
+        self.ordered = ordered
+        self.reorder_window = reorder_window
+        self.reorder_delay_secs = reorder_delay_secs
+        self.queue_size = queue_size
+        self.positions: dict[str, int] = {}
+        # ``since`` of the first subscription; re-entries resume from ``positions``
+        self._opened = False
+        self.on_source_disconnect: Callable[[str, BaseException, float], None] | None = None
+
+    @property
+    def primary(self) -> GatewayClient:
+        return self.clients[0]
+
+    def source(self, origin: str) -> GatewayClient:
+        """The client behind ``origin``, for per-source reads such as backfills."""
+        return self.clients[self.origins.index(origin)]
+
+    def check_capabilities(self) -> None:
+        for origin, client in zip(self.origins, self.clients):
+            try:
+                client.check_capabilities()
+            except Exception as exc:
+                raise RuntimeError(f"{origin}: {exc}") from exc
+
+    def send_intent(
+        self,
+        envelope: IntentEnvelope,
+        correlation_id: str,
+        *,
+        stream_id: str | None = None,
+        lane: str | None = None,
+    ) -> GatewayAck:
+        return self.primary.send_intent(envelope, correlation_id=correlation_id, stream_id=stream_id, lane=lane)
+
+    def get_timeline(self, thread_id: str) -> Sequence[TurnSummary]:
+        return [turn for client in self.clients for turn in client.get_timeline(thread_id)]
+
+    def get_decision(self, thread_id: str, turn_id: str) -> DecisionViewModel | None:
+        for client in self.clients:
+            view = client.get_decision(thread_id, turn_id)
+            if view is not None:
+                return view
+        return None
+
+    def get_audit(self, thread_id: str, turn_id: str | None = None) -> Sequence[AuditEventViewModel]:
+        return [event for client in self.clients for event in client.get_audit(thread_id, turn_id=turn_id)]
+
+    def ledger_index(self, limit: int = 1000) -> LedgerIndex:
+        return LedgerIndex(self.fetch_events(limit=limit))
+
+    def get_status(self) -> dict[str, Any]:
+        return {origin: client.get_status() for origin, client in zip(self.origins, self.clients)}
+
+    def fetch_events(
+        self,
+        limit: int = 1000,
+        *,
+        offset: int | None = None,
+        stream_id: str | None = None,
+        lane: str | None = None,
+    ) -> list[dict[str, Any]]:
+        events: list[dict[str, Any]] = []
+        for origin, client in zip(self.origins, self.clients):
+            window = client.fetch_events(limit=limit, offset=offset, stream_id=stream_id, lane=lane)
+            events.extend({**event, "origin": origin} for event in window)
+        return events
+
+    def fetch_partitions(
+        self,
+        partitions: Sequence[Partition],
+        limit: int = 1000,
+        max_workers: int = 8,
+    ) -> dict[Partition, list[dict[str, Any]]]:
+        merged: dict[Partition, list[dict[str, Any]]] = {p: [] for p in partitions}
+        for origin, client in zip(self.origins, self.clients):
+            for partition, events in client.fetch_partitions(partitions, limit, max_workers).items():
+                merged[partition].extend({**event, "origin": origin} for event in events)
+        return merged
+
+    def tail(
+        self,
+        since: int | None = None,
+        backlog: int | None = None,
+    ) -> Iterator[dict]:
+        """
+        Merged live stream of all sources.
+
+        ``since`` only applies to the first subscription, and only to sources
+        without a recorded position. Indices of different gateways are
+        unrelated, so a re-entry (e.g. from an outer ``ResumableTail``, whose
+        ``since`` is the index of whichever source delivered last) is ignored
+        and every source resumes from its own entry in ``positions``.
+        """
+        if self._opened:
+            since = None
+        self._opened = True
+        stop = threading.Event()
+        merged: queue.Queue[dict[str, Any]] = queue.Queue(maxsize=self.queue_size)
+        for origin, client in zip(self.origins, self.clients):
+            start = self.positions.get(origin, since)
+            thread = threading.Thread(
+                target=self._pump,
+                args=(origin, client, start, backlog, stop, merged),
+                name=f"fanin-{origin}",
+                daemon=True,
+            )
+            thread.start()
+
+        try:
+            source = self._reordered(merged) if self.ordered else self._arrival_order(merged)
+            for event in source:
+                idx = event_index(event)
+                if idx is not None:
+                    self.positions[event["origin"]] = idx
+                yield event
+        finally:
+            stop.set()
+            # Pumps blocked in a read only see ``stop`` once it returns
+            for client in self.clients:
+                abort = getattr(client, "abort_tails", None)
+                if abort is not None:
+                    abort()
+
+    def _pump(
+        self,
+        origin: str,
+        client: GatewayClient,
+        since: int | None,
+        backlog: int | None,
+        stop: threading.Event,
+        merged: queue.Queue,
+    ) -> None:
+        def on_disconnect(exc: BaseException, delay: float) -> None:
+            if self.on_source_disconnect is not None:
+                self.on_source_disconnect(origin, exc, delay)
+
+        stream = ResumableTail(client, since=since, backlog=backlog, stop_event=stop, on_disconnect=on_disconnect)
+        for event in stream:
+            # Tagged copy; the source's own dicts stay untouched
+            event = {**event, "origin": origin}
+            while not stop.is_set():
+                try:
+                    merged.put(event, timeout=_POLL_SECS)
+                    break
+                except queue.Full:
+                    continue
+
+    @staticmethod
+    def _arrival_order(merged: queue.Queue) -> Iterator[dict[str, Any]]:
+        while True:
+            try:
+                yield merged.get(timeout=_POLL_SECS)
+            except queue.Empty:
+                continue
+
+    def _reordered(self, merged: queue.Queue) -> Iterator[dict[str, Any]]:
+        buffer: list[tuple[float, int, dict[str, Any]]] = []
+        seq = 0
+        while True:
+            try:
+                event = merged.get(timeout=self.reorder_delay_secs)
+            except queue.Empty:
+                # Quiet period: nothing older can still be in flight
+                while buffer:
+                    yield heapq.heappop(buffer)[2]
+                continue
+            heapq.heappush(buffer, (parse_ts(str(event.get("timestamp", ""))), seq, event))
+            seq += 1
+            while len(buffer) > self.reorder_window:
+                yield heapq.heappop(buffer)[2]
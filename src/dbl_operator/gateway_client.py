@@ -1,21 +1,32 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, Protocol, Sequence
+from typing import TYPE_CHECKING, Any, Iterable, Protocol, Sequence
 
 from .domain_types import (
     AuditEventViewModel,
     DecisionViewModel,
     GatewayAck,
     IntentEnvelope,
+    Partition,
     TurnSummary,
 )
 
+if TYPE_CHECKING:
+    from .ledger_index import LedgerIndex
+
 
 class GatewayClient(Protocol):
     def check_capabilities(self) -> None: ...
 
-    def send_intent(self, envelope: IntentEnvelope, correlation_id: str) -> GatewayAck: ...
+    def send_intent(
+        self,
+        envelope: IntentEnvelope,
+        correlation_id: str,
+        *,
+        stream_id: str | None = None,
+        lane: str | None = None,
+    ) -> GatewayAck: ...
 
     def get_timeline(self, thread_id: str) -> Sequence[TurnSummary]: ...
 
@@ -23,6 +34,34 @@ class GatewayClient(Protocol):
 
     def get_audit(self, thread_id: str, turn_id: str | None = None) -> Sequence[AuditEventViewModel]: ...
 
+    def ledger_index(self, limit: int = 1000) -> "LedgerIndex":
+        """Fetch one snapshot and index it for batch view queries."""
+        ...
+
+    def get_status(self) -> dict[str, Any]:
+        """Gateway ``/status``; ``t_index`` is the newest ledger index."""
+        ...
+
+    def fetch_events(
+        self,
+        limit: int = 1000,
+        *,
+        offset: int | None = None,
+        stream_id: str | None = None,
+        lane: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """One ``/snapshot`` window of up to ``limit`` events from ``offset``, optionally one stream/lane."""
+        ...
+
+    def fetch_partitions(
+        self,
+        partitions: Sequence[Partition],
+        limit: int = 1000,
+        max_workers: int = 8,
+    ) -> dict[Partition, list[dict[str, Any]]]:
+        """One snapshot per stream/lane partition, fetched concurrently."""
+        ...
+
     def tail(
         self,
         since: int | None = None,
@@ -35,7 +74,14 @@ class FakeGatewayClient:
     def check_capabilities(self) -> None:
         pass
 
-    def send_intent(self, envelope: IntentEnvelope, correlation_id: str) -> GatewayAck:
+    def send_intent(
+        self,
+        envelope: IntentEnvelope,
+        correlation_id: str,
+        *,
+        stream_id: str | None = None,
+        lane: str | None = None,
+    ) -> GatewayAck:
         return GatewayAck(correlation_id=correlation_id)
 
     def get_timeline(self, thread_id: str) -> Sequence[TurnSummary]:
@@ -47,9 +93,35 @@ class FakeGatewayClient:
     def get_audit(self, thread_id: str, turn_id: str | None = None) -> Sequence[AuditEventViewModel]:
         return ()
 
+    def ledger_index(self, limit: int = 1000) -> "LedgerIndex":
+        from .ledger_index import LedgerIndex
+
+        return LedgerIndex(self.fetch_events(limit=limit))
+
+    def get_status(self) -> dict[str, Any]:
+        return {}
+
     def tail(
         self,
         since: int | None = None,
         backlog: int | None = None,
     ) -> Iterable[dict]:
         return iter(())
+
+    def fetch_events(
+        self,
+        limit: int = 1000,
+        *,
+        offset: int | None = None,
+        stream_id: str | None = None,
+        lane: str | None = None,
+    ) -> list[dict[str, Any]]:
+        return []
+
+    def fetch_partitions(
+        self,
+        partitions: Sequence[Partition],
+        limit: int = 1000,
+        max_workers: int = 8,
+    ) -> dict[Partition, list[dict[str, Any]]]:
+        return {p: [] for p in partitions}
@@ -2,8 +2,13 @@ from __future__ import annotations
 
 import json
 import os
+import queue
+import socket
 import sys
-from typing import Any, Iterable, Mapping, Optional, Sequence
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional, Sequence
 
 import httpx
 
@@ -12,9 +17,26 @@ from .domain_types import (
     DecisionViewModel,
     GatewayAck,
     IntentEnvelope,
+    Partition,
     TurnSummary,
 )
+from .capabilities_cache import CapabilitiesCache, cache_key
+from .event_cache import EventCache, EventWindow, window_key
 from .gateway_client import GatewayClient
+from .ledger_index import LedgerIndex
+from .profiler import get_profiler
+from .tail_stream import TailStalled, event_index
+
+# Status codes that suggest the gateway surface moved or changed shape,
+# as opposed to transient or auth failures. They invalidate cached admission.
+INTERFACE_CHANGE_STATUSES = frozenset({404, 405, 406, 410, 415, 422, 501})
+
+# Longest silence (no event and no SSE heartbeat) before a tail subscription
+# is treated as stalled and re-opened
+DEFAULT_STALL_TIMEOUT_SECS = 45.0
+
+# Live events buffered while a tail backlog is still being fetched
+LIVE_BUFFER_EVENTS = 10_000
 
 
 class HttpGatewayClient(GatewayClient):
@@ -23,49 +45,124 @@ class HttpGatewayClient(GatewayClient):
         base_url: str,
         token: Optional[str] = None,
         timeout_secs: float = 15.0,
+        capabilities_cache: CapabilitiesCache | None = None,
+        stream_id: str = "default",
+        lane: str = "default",
+        event_cache: EventCache | None = None,
+        stall_timeout_secs: float | None = DEFAULT_STALL_TIMEOUT_SECS,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.token = token
         self.timeout = timeout_secs
+        self.capabilities_cache = capabilities_cache
+        # Partition that intents are submitted to
+        self.stream_id = stream_id
+        self.lane = lane
+        # Snapshot windows reused across reads while t_index stands still
+        self.event_cache = event_cache
+        # Read deadline for /tail; None (or 0) waits forever
+        self.stall_timeout_secs = stall_timeout_secs or None
         self.headers = {"Content-Type": "application/json"}
         if self.token:
             self.headers["Authorization"] = f"Bearer {self.token}"
+        # Open /tail responses, so another thread can abort them
+        self._tail_responses: set[httpx.Response] = set()
+        self._tail_lock = threading.Lock()
+
+    @contextmanager
+    def _interface_guard(self) -> Iterator[None]:
+        """Drop cached admission when a request fails in an interface-shaped way."""
+        try:
+            yield
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code in INTERFACE_CHANGE_STATUSES:
+                self._invalidate_capabilities()
+            raise
+        except (ValueError, KeyError):
+            # Undecodable body or missing contract field
+            self._invalidate_capabilities()
+            raise
+
+    def _invalidate_capabilities(self) -> None:
+        if self.capabilities_cache is not None:
+            self.capabilities_cache.invalidate(cache_key(self.base_url, self.token))
+
+    def _get_json(self, path: str, params: Mapping[str, Any] | None = None) -> Any:
+        """GET a JSON surface, recording request and decode stages for --profile."""
+        profiler = get_profiler()
+        url = f"{self.base_url}{path}"
+        with self._interface_guard():
+            with profiler.stage("http.request") as span:
+                with httpx.Client(timeout=self.timeout) as client:
+                    resp = client.get(url, params=params, headers=self.headers)
+                    resp.raise_for_status()
+                span.bytes = len(resp.content)
+            with profiler.stage("http.decode") as span:
+                data = resp.json()
+                if isinstance(data, dict) and isinstance(data.get("events"), list):
+                    span.events = len(data["events"])
+        return data
 
     def check_capabilities(self) -> None:
-        url = f"{self.base_url}/capabilities"
-        with httpx.Client(timeout=self.timeout) as client:
-            resp = client.get(url, headers=self.headers)
-            resp.raise_for_status()
-            data = resp.json()
-            
-            # Admission Gate: verify interface version
-            if data.get("interface_version") != 2:
-                raise RuntimeError(f"Gateway interface mismatch. Expected 2, got {data.get('interface_version')}")
-                
-            surfaces_raw = data.get("surfaces")
-            if isinstance(surfaces_raw, dict):
-                enabled = {str(k) for k, v in surfaces_raw.items() if v}
-            elif isinstance(surfaces_raw, list):
-                enabled = set(surfaces_raw)
-            else:
-                enabled = set()
-
-            # Enforce required surfaces defined in the contract
-            # Note: 'capabilities' itself is not listed - if we got here, it works
-            required = {"snapshot", "ingress_intent", "tail"}
-            missing = sorted(required - enabled)
-            if missing:
-                raise RuntimeError(f"Gateway missing required surfaces: {missing}")
-
-    def send_intent(self, envelope: IntentEnvelope, correlation_id: str) -> GatewayAck:
+        """
+        Admission gate: enforce interface version 2 and the required surfaces.
+
+        With a ``capabilities_cache`` a fresh, previously validated response is
+        reused instead of a round trip; it is validated again either way.
+        """
+        cache = self.capabilities_cache
+        key = cache_key(self.base_url, self.token)
+        if cache is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                try:
+                    self._validate_capabilities(cached)
+                    return
+                except RuntimeError:
+                    cache.invalidate(key)
+
+        data = self._get_json("/capabilities")
+        self._validate_capabilities(data)
+        if cache is not None:
+            cache.put(key, data)
+
+    @staticmethod
+    def _validate_capabilities(data: Mapping[str, Any]) -> None:
+        # Admission Gate: verify interface version
+        if data.get("interface_version") != 2:
+            raise RuntimeError(f"Gateway interface mismatch. Expected 2, got {data.get('interface_version')}")
+
+        surfaces_raw = data.get("surfaces")
+        if isinstance(surfaces_raw, dict):
+            enabled = {str(k) for k, v in surfaces_raw.items() if v}
+        elif isinstance(surfaces_raw, list):
+            enabled = set(surfaces_raw)
+        else:
+            enabled = set()
+
+        # Enforce required surfaces defined in the contract
+        # Note: 'capabilities' itself is not listed - if we got here, it works
+        required = {"snapshot", "ingress_intent", "tail"}
+        missing = sorted(required - enabled)
+        if missing:
+            raise RuntimeError(f"Gateway missing required surfaces: {missing}")
+
+    def send_intent(
+        self,
+        envelope: IntentEnvelope,
+        correlation_id: str,
+        *,
+        stream_id: str | None = None,
+        lane: str | None = None,
+    ) -> GatewayAck:
         url = f"{self.base_url}/ingress/intent"
         # Map IntentEnvelope to Gateway's expected shape (v2)
         payload: dict[str, Any] = {
             "interface_version": 2,
             "correlation_id": correlation_id,
             "payload": {
-                "stream_id": "default",
-                "lane": "default",
+                "stream_id": stream_id or self.stream_id,
+                "lane": lane or self.lane,
                 "actor": "operator",
                 "intent_type": envelope.intent_type,
                 "thread_id": envelope.anchors.thread_id,
@@ -77,98 +174,30 @@ class HttpGatewayClient(GatewayClient):
             },
         }
         
-        with httpx.Client(timeout=self.timeout) as client:
-            resp = client.post(url, json=payload, headers=self.headers)
-            resp.raise_for_status()
-            data = resp.json()
+        with self._interface_guard():
+            with get_profiler().stage("http.request"):
+                with httpx.Client(timeout=self.timeout) as client:
+                    resp = client.post(url, json=payload, headers=self.headers)
+                    resp.raise_for_status()
+                    data = resp.json()
             return GatewayAck(correlation_id=data["correlation_id"])
 
     def get_timeline(self, thread_id: str) -> Sequence[TurnSummary]:
-        events = self._fetch_events()
-        # Filter by thread_id and group by turn_id
-        thread_events = [e for e in events if e.get("thread_id") == thread_id]
-        
-        turns_map: dict[str, list[dict[str, Any]]] = {}
-        for e in thread_events:
-            tid = e["turn_id"]
-            if tid not in turns_map:
-                turns_map[tid] = []
-            turns_map[tid].append(e)
-            
-        summaries = []
-        # Sort turns by the index of their first event to preserve order
-        sorted_turn_ids = sorted(turns_map.keys(), key=lambda tid: turns_map[tid][0]["index"])
-        
-        for tid in sorted_turn_ids:
-            events_in_turn = turns_map[tid]
-            first_event = events_in_turn[0]
-            
-            # Find digests in any event of the turn (as fallback if turn object is missing)
-            ctx_digest = None
-            dec_digest = None
-            for e in events_in_turn:
-                p = e.get("payload", {})
-                if not ctx_digest:
-                    ctx_digest = p.get("context_digest")
-                if not dec_digest:
-                    if e.get("kind") == "DECISION":
-                        dec_digest = e.get("digest")
-            
-            summaries.append(TurnSummary(
-                turn_id=tid,
-                parent_turn_id=first_event.get("parent_turn_id"),
-                context_digest=ctx_digest,
-                decision_digest=dec_digest,
-                execution_status=None
-            ))
-        return summaries
+        return self.ledger_index().timeline(thread_id)
 
     def get_decision(self, thread_id: str, turn_id: str) -> DecisionViewModel | None:
-        events = self._fetch_events()
-        # Find DECISION event for the specific turn
-        for e in events:
-            if (e.get("thread_id") == thread_id and 
-                e.get("turn_id") == turn_id and 
-                e.get("kind") == "DECISION"):
-                
-                p = e.get("payload", {})
-                return DecisionViewModel(
-                    policy_identity={
-                        "id": p.get("policy_id"),
-                        "version": p.get("policy_version")
-                    },
-                    result=p.get("decision", "UNKNOWN"),
-                    reasons=p.get("reason_codes", []),
-                    context_digest=p.get("context_digest"),
-                    decision_digest=e.get("digest")
-                )
-        return None
+        return self.ledger_index().decision(thread_id, turn_id)
 
     def get_audit(self, thread_id: str, turn_id: str | None = None) -> Sequence[AuditEventViewModel]:
-        events = self._fetch_events()
-        audit_events = []
-        for e in events:
-            if e.get("thread_id") != thread_id:
-                continue
-            if turn_id is not None and e.get("turn_id") != turn_id:
-                continue
-                
-            audit_events.append(AuditEventViewModel(
-                event_kind=e.get("kind", "UNKNOWN"),
-                # Use the authoritative event digest
-                event_digest=e.get("digest"),
-                v_digest=None,
-                payload=e.get("payload", {})
-            ))
-        return audit_events
+        return self.ledger_index().audit(thread_id, turn_id=turn_id)
+
+    def ledger_index(self, limit: int = 1000) -> LedgerIndex:
+        """One snapshot fetch, indexed for any number of view queries."""
+        return LedgerIndex(self.fetch_events(limit=limit))
 
     def get_status(self) -> dict[str, Any]:
         """Fetch current gateway status containing t_index."""
-        url = f"{self.base_url}/status"
-        with httpx.Client(timeout=self.timeout) as client:
-            resp = client.get(url, headers=self.headers)
-            resp.raise_for_status()
-            return resp.json()
+        return self._get_json("/status")
 
     def tail(
         self,
@@ -178,6 +207,13 @@ class HttpGatewayClient(GatewayClient):
         """
         Stream events from /tail endpoint using SSE.
 
+        With ``backlog`` (and no ``since``) the live subscription is opened
+        concurrently with the backlog fetch, so the first live event is one
+        round trip away instead of three. Live events are buffered while the
+        backlog is emitted, then merged by ``index``: duplicates are dropped
+        and any hole between the backlog and the first live event is fetched
+        from ``/snapshot``.
+
         Args:
             since: Start streaming from index > since
             backlog: Number of recent events to emit on connect
@@ -185,80 +221,299 @@ class HttpGatewayClient(GatewayClient):
         Yields:
             Event dicts from the SSE stream
         """
-        next_since = since
-
-        # Client-side backlog logic:
-        # 1. Get current t_index from /status
-        # 2. Calculate offset for last N events
-        # 3. Fetch specific window via /snapshot
         if backlog and backlog > 0 and since is None:
+            yield from self._tail_with_backlog(backlog)
+            return
+        yield from self._tail_events(since)
+
+    def _tail_with_backlog(self, backlog: int) -> Iterator[dict[str, Any]]:
+        live = _LiveFeed(self)
+        try:
+            last: int | None = None
+            # Client-side backlog logic:
+            # 1. Get current t_index from /status
+            # 2. Calculate offset for last N events
+            # 3. Fetch specific window via /snapshot
             try:
-                status = self.get_status()
-                # print(f"DEBUG: Status response: {status}", file=sys.stderr)
-                t_index = status.get("t_index")
-                
-                # t_index is the index of the last accepted event (int)
-                # If no events, t_index might be -1 or None depending on implementation. 
-                if isinstance(t_index, int) and t_index >= 0:
-                    # Calculate start index: (current_count) - backlog
-                    # count = t_index + 1
-                    # start = max(0, count - backlog)
-                    start_offset = max(0, t_index - backlog + 1)
-                    # print(f"DEBUG: Fetching backlog: offset={start_offset}, limit={backlog}", file=sys.stderr)
-                    
-                    snap_url = f"{self.base_url}/snapshot"
-                    params = {"offset": start_offset, "limit": backlog}
-                    
-                    with httpx.Client(timeout=self.timeout) as client:
-                        resp = client.get(snap_url, params=params, headers=self.headers)
-                        if resp.status_code == 200:
-                            events = resp.json().get("events", [])
-                            # print(f"DEBUG: Found {len(events)} backlog events", file=sys.stderr)
-                            for event in events:
-                                yield event
-                                idx = event.get("index")
-                                if isinstance(idx, int):
-                                    next_since = idx
-                # else:
-                #    print(f"DEBUG: t_index invalid or < 0: {t_index}", file=sys.stderr)
-            except Exception as e:
-                # If status/snapshot fails, fallback to live tail only
-                # print(f"DEBUG: Backfill failed: {e}", file=sys.stderr)
+                t_index = self.get_status().get("t_index")
+                # t_index is the index of the last accepted event (int);
+                # -1 or None while the ledger is empty
+                if t_index is None:
+                    t_index = -1
+                if isinstance(t_index, int):
+                    events: list[dict[str, Any]] = []
+                    if t_index >= 0:
+                        # count = t_index + 1, start = max(0, count - backlog)
+                        start_offset = max(0, t_index - backlog + 1)
+                        events = self._fetch_snapshot(backlog, offset=start_offset)
+                    for event in events:
+                        yield event
+                        idx = event_index(event)
+                        if idx is not None:
+                            t_index = max(t_index, idx)
+                    last = t_index
+            except Exception:
+                # If status/snapshot fails, fall back to live tail only
                 pass
 
+            for event in live:
+                idx = event_index(event)
+                if idx is not None and last is not None:
+                    if idx <= last:
+                        # Already emitted as part of the backlog
+                        continue
+                    if idx > last + 1:
+                        # Accepted after the backlog was read but before the
+                        # subscription was live
+                        for missed in self._fetch_snapshot(idx - last - 1, offset=last + 1):
+                            missed_idx = event_index(missed)
+                            if missed_idx is not None and last < missed_idx < idx:
+                                yield missed
+                                last = missed_idx
+                yield event
+                if idx is not None:
+                    last = idx
+        finally:
+            live.close()
+
+    def _tail_events(
+        self,
+        since: int | None,
+        on_open: Callable[[httpx.Client], None] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Decode one ``/tail`` SSE subscription; ``on_open`` receives the HTTP client."""
         params: dict[str, str] = {}
-        if next_since is not None:
-            params["since"] = str(next_since)
+        if since is not None:
+            params["since"] = str(since)
         
         url = f"{self.base_url}/tail"
         headers = dict(self.headers)
         headers["Accept"] = "text/event-stream"
 
-        # Use no timeout for streaming connection
-        with httpx.Client(timeout=None, headers=headers) as client:
+        profiler = get_profiler()
+
+        # The read deadline is the stall watchdog: SSE comment heartbeats
+        # (": ping") are data on the wire and re-arm it like events do
+        stall = self.stall_timeout_secs
+        timeout = httpx.Timeout(self.timeout, read=stall)
+        with httpx.Client(timeout=timeout, headers=headers) as client:
+            if on_open is not None:
+                on_open(client)
             with client.stream("GET", url, params=params) as resp:
-                resp.raise_for_status()
-                for raw_line in resp.iter_lines():
-                    if not raw_line:
-                        continue
-                    line = raw_line.strip()
-                    if not line.startswith("data:"):
-                        continue
-                    payload = line[5:].strip()
-                    if not payload:
-                        continue
-                    try:
-                        yield json.loads(payload)
-                    except json.JSONDecodeError:
-                        continue
+                with self._interface_guard():
+                    resp.raise_for_status()
+                with self._tail_lock:
+                    self._tail_responses.add(resp)
+                try:
+                    for raw_line in resp.iter_lines():
+                        event = self._decode_sse_line(raw_line, profiler)
+                        if event is not None:
+                            yield event
+                except httpx.ReadTimeout as exc:
+                    raise TailStalled(f"no data or heartbeat for {stall:g}s") from exc
+                finally:
+                    with self._tail_lock:
+                        self._tail_responses.discard(resp)
+
+    def abort_tails(self) -> None:
+        """Shut down every open ``/tail`` connection; readers blocked on them get a connection error."""
+        with self._tail_lock:
+            responses = list(self._tail_responses)
+        for resp in responses:
+            stream = resp.extensions.get("network_stream")
+            sock = stream.get_extra_info("socket") if stream is not None else None
+            if sock is None:
+                continue
+            try:
+                # shutdown, unlike close, wakes a recv blocked in another thread
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _decode_sse_line(raw_line: str, profiler: Any) -> dict[str, Any] | None:
+        if not raw_line:
+            return None
+        line = raw_line.strip()
+        if line.startswith(":"):
+            # Heartbeat comment; receiving it already reset the read deadline
+            with profiler.stage("tail.heartbeat"):
+                return None
+        if not line.startswith("data:"):
+            return None
+        payload = line[5:].strip()
+        if not payload:
+            return None
+        with profiler.stage("tail.decode", nbytes=len(payload)) as span:
+            try:
+                event = json.loads(payload)
+            except json.JSONDecodeError:
+                return None
+            span.events = 1
+        return event
+
+    def fetch_events(
+        self,
+        limit: int = 1000,
+        *,
+        offset: int | None = None,
+        stream_id: str | None = None,
+        lane: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch one snapshot window.
 
-    def _fetch_events(self, limit: int = 1000) -> list[dict[str, Any]]:
+        With an ``event_cache`` a repeated window is revalidated against
+        ``t_index`` from ``/status`` instead of downloaded again: unchanged
+        windows are served from memory, and when the ledger has advanced only
+        the events after the cached position are fetched. Snapshot offsets are
+        ledger indices (starting at 0), so a window that already holds
+        ``limit`` events is final and needs no check at all.
+        """
+        cache = self.event_cache
+        if cache is None:
+            return self._fetch_snapshot(limit, offset=offset, stream_id=stream_id, lane=lane)
+
+        key = window_key(limit, offset, stream_id, lane)
+        window = cache.get(key)
+        profiler = get_profiler()
+        if window is not None and not window.is_full(limit):
+            t_index = self._status_t_index()
+            if t_index is None or t_index < window.high_water:
+                # Status unreadable, or the ledger went backwards (reset or failover)
+                window = None
+            elif t_index > window.high_water:
+                with profiler.stage("cache.delta") as span:
+                    delta = self._fetch_snapshot(
+                        limit - len(window.events),
+                        offset=window.high_water + 1,
+                        stream_id=stream_id,
+                        lane=lane,
+                    )
+                    span.events = len(delta)
+                window = window.extended(delta, max(t_index, _high_water(delta, -1)), limit)
+                cache.put(key, window)
+                cache.count("deltas")
+                return list(window.events)
+
+        if window is not None:
+            with profiler.stage("cache.hit", events=len(window.events)):
+                cache.count("hits")
+                return list(window.events)
+
+        events = self._fetch_snapshot(limit, offset=offset, stream_id=stream_id, lane=lane)
+        cache.put(key, EventWindow(events, _high_water(events, (offset or 0) - 1)))
+        cache.count("misses")
+        return events
+
+    def _fetch_snapshot(
+        self,
+        limit: int,
+        *,
+        offset: int | None = None,
+        stream_id: str | None = None,
+        lane: str | None = None,
+    ) -> list[dict[str, Any]]:
         # Fetching snapshots to derive views, as no direct timeline surface is documented.
-        url = f"{self.base_url}/snapshot"
-        params = {"limit": limit}
-        with httpx.Client(timeout=self.timeout) as client:
-            resp = client.get(url, params=params, headers=self.headers)
-            resp.raise_for_status()
-            data = resp.json()
-            return data.get("events", [])
+        params: dict[str, Any] = {"limit": limit}
+        if offset is not None:
+            params["offset"] = offset
+        if stream_id is not None:
+            params["stream_id"] = stream_id
+        if lane is not None:
+            params["lane"] = lane
+        data = self._get_json("/snapshot", params)
+        return data.get("events", [])
+
+    def _status_t_index(self) -> int | None:
+        """Current ``t_index`` (-1 for an empty ledger), or None if it cannot be read."""
+        try:
+            t_index = self.get_status().get("t_index")
+        except (httpx.HTTPError, ValueError, AttributeError):
+            return None
+        if t_index is None:
+            return -1
+        return t_index if isinstance(t_index, int) else None
+
+    def fetch_partitions(
+        self,
+        partitions: Sequence[Partition],
+        limit: int = 1000,
+        max_workers: int = 8,
+    ) -> dict[Partition, list[dict[str, Any]]]:
+        """Fetch several stream/lane partitions concurrently, one snapshot each."""
+        if not partitions:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(partitions))) as pool:
+            futures = {
+                p: pool.submit(self.fetch_events, limit, stream_id=p.stream_id, lane=p.lane)
+                for p in partitions
+            }
+            return {p: f.result() for p, f in futures.items()}
+
+
+class _LiveFeed:
+    """
+    A live ``/tail`` subscription read on a background thread.
+
+    Events wait in a bounded queue, so a slow consumer still pushes back on
+    the connection once the buffer is full. Errors are re-raised to the
+    consumer; ``close`` tears the connection down.
+    """
+
+    _END = object()
+
+    def __init__(self, gateway: HttpGatewayClient, buffer: int = LIVE_BUFFER_EVENTS) -> None:
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=buffer)
+        self._closed = threading.Event()
+        self._client: httpx.Client | None = None
+        self._thread = threading.Thread(target=self._run, args=(gateway,), name="dbl-tail-live", daemon=True)
+        self._thread.start()
+
+    def _run(self, gateway: HttpGatewayClient) -> None:
+        try:
+            for event in gateway._tail_events(None, on_open=self._opened):
+                if not self._put(event):
+                    return
+        except BaseException as exc:
+            self._put(exc)
+            return
+        self._put(self._END)
+
+    def _opened(self, client: httpx.Client) -> None:
+        self._client = client
+        if self._closed.is_set():
+            client.close()
+
+    def _put(self, item: Any) -> bool:
+        while not self._closed.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        while True:
+            item = self._queue.get()
+            if item is self._END:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+    def close(self) -> None:
+        self._closed.set()
+        client = self._client
+        if client is not None:
+            try:
+                client.close()
+            except Exception:
+                pass
+
 
+def _high_water(events: Sequence[dict[str, Any]], default: int) -> int:
+    """Highest ledger index among ``events``, or ``default`` when none carry one."""
+    indices = [e["index"] for e in events if isinstance(e.get("index"), int)]
+    return max(indices, default=default)
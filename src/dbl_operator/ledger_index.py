@@ -0,0 +1,100 @@
+"""In-memory index over one snapshot of gateway events, for batch view queries."""
+from __future__ import annotations
+
+from typing import Any, Iterable, Sequence
+
+from .domain_types import AuditEventViewModel, DecisionViewModel, TurnSummary, event_index
+
+__all__ = ["LedgerIndex"]
+
+
+def _first_order(events: list[dict[str, Any]]) -> int:
+    # Gateways may send indices as digit strings; -1 when absent
+    idx = event_index(events[0])
+    return -1 if idx is None else idx
+
+
+class LedgerIndex:
+    """
+    Group a snapshot by thread and turn in a single pass.
+
+    Timelines, decisions and audit trails for any number of threads and
+    turns are then answered from the same fetched events, instead of one
+    ``/snapshot`` download per query.
+    """
+
+    def __init__(self, events: Iterable[dict[str, Any]]) -> None:
+        # thread_id -> turn_id -> events in ledger order
+        self.threads: dict[str, dict[str, list[dict[str, Any]]]] = {}
+        # thread_id -> events in ledger order
+        self.thread_events: dict[str, list[dict[str, Any]]] = {}
+        for e in events:
+            thread_id = e.get("thread_id")
+            if thread_id is None:
+                continue
+            turns = self.threads.setdefault(thread_id, {})
+            turns.setdefault(e.get("turn_id"), []).append(e)
+            self.thread_events.setdefault(thread_id, []).append(e)
+
+    def timeline(self, thread_id: str) -> Sequence[TurnSummary]:
+        turns_map = self.threads.get(thread_id, {})
+        summaries = []
+        # Sort turns by the index of their first event to preserve order
+        sorted_turn_ids = sorted(turns_map.keys(), key=lambda tid: _first_order(turns_map[tid]))
+
+        for tid in sorted_turn_ids:
+            events_in_turn = turns_map[tid]
+            first_event = events_in_turn[0]
+
+            # Find digests in any event of the turn (as fallback if turn object is missing)
+            ctx_digest = None
+            dec_digest = None
+            for e in events_in_turn:
+                p = e.get("payload", {})
+                if not ctx_digest:
+                    ctx_digest = p.get("context_digest")
+                if not dec_digest:
+                    if e.get("kind") == "DECISION":
+                        dec_digest = e.get("digest")
+
+            summaries.append(TurnSummary(
+                turn_id=tid,
+                parent_turn_id=first_event.get("parent_turn_id"),
+                context_digest=ctx_digest,
+                decision_digest=dec_digest,
+                execution_status=None
+            ))
+        return summaries
+
+    def decision(self, thread_id: str, turn_id: str) -> DecisionViewModel | None:
+        # First DECISION event of the turn
+        for e in self.threads.get(thread_id, {}).get(turn_id, ()):
+            if e.get("kind") == "DECISION":
+                p = e.get("payload", {})
+                return DecisionViewModel(
+                    policy_identity={
+                        "id": p.get("policy_id"),
+                        "version": p.get("policy_version")
+                    },
+                    result=p.get("decision", "UNKNOWN"),
+                    reasons=p.get("reason_codes", []),
+                    context_digest=p.get("context_digest"),
+                    decision_digest=e.get("digest")
+                )
+        return None
+
+    def audit(self, thread_id: str, turn_id: str | None = None) -> Sequence[AuditEventViewModel]:
+        if turn_id is not None:
+            events = self.threads.get(thread_id, {}).get(turn_id, [])
+        else:
+            events = self.thread_events.get(thread_id, [])
+        return [
+            AuditEventViewModel(
+                event_kind=e.get("kind", "UNKNOWN"),
+                # Use the authoritative event digest
+                event_digest=e.get("digest"),
+                v_digest=None,
+                payload=e.get("payload", {})
+            )
+            for e in events
+        ]
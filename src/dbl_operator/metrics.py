@@ -0,0 +1,299 @@
+"""Prometheus text-format metrics fed incrementally from the tail stream."""
+from __future__ import annotations
+
+import bisect
+import threading
+from abc import ABC, abstractmethod
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterable, Sequence
+
+from .turn_tracker import TurnTracker
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "GatewayMetrics",
+    "Histogram",
+    "MetricsRegistry",
+    "MetricsServer",
+]
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS_SECS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, registry: "MetricsRegistry", name: str, help_text: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(labels)
+        self._registry = registry
+        registry._register(self)
+
+    def _header(self, name: str | None = None) -> list[str]:
+        name = name or self.name
+        return [f"# HELP {name} {self.help}", f"# TYPE {name} {self.kind}"]
+
+    @abstractmethod
+    def samples(self) -> Iterable[str]:
+        pass
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self._values: dict[tuple[str, ...], float] = {}
+        super().__init__(*args, **kwargs)
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._registry.lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+            self._registry.version += 1
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def samples(self) -> Iterable[str]:
+        yield from self._header(f"{self.name}_total")
+        for labels, value in sorted(self._values.items()):
+            yield f"{self.name}_total{_format_labels(self.label_names, labels)} {_format_value(value)}"
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self._values: dict[tuple[str, ...], float] = {}
+        super().__init__(*args, **kwargs)
+
+    def set(self, value: float, *labels: str) -> None:
+        with self._registry.lock:
+            if self._values.get(labels) != value:
+                self._values[labels] = value
+                self._registry.version += 1
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def samples(self) -> Iterable[str]:
+        yield from self._header()
+        for labels, value in sorted(self._values.items()):
+            yield f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}"
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, *args: Any, buckets: Sequence[float] = LATENCY_BUCKETS_SECS, **kwargs: Any) -> None:
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts (+Inf last), sum, count]
+        self._series: dict[tuple[str, ...], list[Any]] = {}
+        super().__init__(*args, **kwargs)
+
+    def observe(self, value: float, *labels: str) -> None:
+        slot = bisect.bisect_left(self.buckets, value)
+        with self._registry.lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][slot] += 1
+            series[1] += value
+            series[2] += 1
+            self._registry.version += 1
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return series[2] if series else 0
+
+    def samples(self) -> Iterable[str]:
+        yield from self._header()
+        bounds = [*self.buckets, float("inf")]
+        for labels, (counts, total, count) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, n in zip(bounds, counts):
+                cumulative += n
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{_format_labels(self.label_names, labels, le)} {cumulative}"
+            label_str = _format_labels(self.label_names, labels)
+            yield f"{self.name}_sum{label_str} {_format_value(total)}"
+            yield f"{self.name}_count{label_str} {count}"
+
+
+class MetricsRegistry:
+    """
+    Holds metrics and renders the text exposition format.
+
+    Rendering is cached per update version, so a scrape costs nothing when
+    nothing changed and never depends on how many events were processed.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.RLock()
+        self.version = 0
+        self._metrics: list[_Metric] = []
+        self._cached: tuple[int, bytes] | None = None
+
+    def _register(self, metric: _Metric) -> None:
+        self._metrics.append(metric)
+
+    def counter(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Counter:
+        return Counter(self, name, help_text, labels)
+
+    def gauge(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Gauge:
+        return Gauge(self, name, help_text, labels)
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS_SECS,
+    ) -> Histogram:
+        return Histogram(self, name, help_text, labels, buckets=buckets)
+
+    def render(self) -> bytes:
+        with self.lock:
+            cached = self._cached
+            if cached is not None and cached[0] == self.version:
+                return cached[1]
+            lines: list[str] = []
+            for metric in self._metrics:
+                lines.extend(metric.samples())
+            body = ("\n".join(lines) + "\n").encode("utf-8")
+            self._cached = (self.version, body)
+            return body
+
+
+class GatewayMetrics:
+    """Operator metrics derived from gateway events, one ``feed`` per event."""
+
+    def __init__(self, registry: MetricsRegistry | None = None, tracker: TurnTracker | None = None) -> None:
+        self.registry = registry or MetricsRegistry()
+        self.tracker = tracker or TurnTracker()
+        r = self.registry
+        self.events = r.counter("dbl_operator_events", "Events received from the gateway tail.", ["kind"])
+        self.decisions = r.counter(
+            "dbl_operator_decisions",
+            "DECISION events by result, intent type and policy.",
+            ["result", "intent_type", "policy_id", "policy_version"],
+        )
+        self.reasons = r.counter("dbl_operator_decision_reasons", "Reason codes carried by DECISION events.", ["reason_code"])
+        self.policy_latency = r.histogram(
+            "dbl_operator_intent_to_decision_seconds", "Latency from INTENT to DECISION per turn."
+        )
+        self.exec_latency = r.histogram(
+            "dbl_operator_decision_to_execution_seconds", "Latency from DECISION to EXECUTION per turn."
+        )
+        self.violations = r.counter(
+            "dbl_operator_integrity_violations", "Turn protocol violations observed on the tail.", ["violation"]
+        )
+        self.gaps = r.counter(
+            "dbl_operator_integrity_gaps", "Turns that stayed incomplete past the orphan threshold."
+        )
+        self.open_turns = r.gauge("dbl_operator_open_turns", "Turns awaiting DECISION or EXECUTION.")
+        self.orphaned_turns = r.gauge("dbl_operator_orphaned_turns", "Open turns older than the orphan threshold.")
+        self.last_index = r.gauge("dbl_operator_tail_last_index", "Index of the last event received.")
+        self.reconnects = r.counter("dbl_operator_tail_reconnects", "Tail subscription reconnects.")
+        self.stalls = r.counter(
+            "dbl_operator_tail_stalls", "Tail subscriptions re-opened after a read deadline without data or heartbeat."
+        )
+        self.recovery = r.histogram(
+            "dbl_operator_tail_recovery_seconds", "Time from losing the tail subscription to the next event."
+        )
+
+    def feed(self, event: dict[str, Any]) -> None:
+        tracker = self.tracker
+        gaps_before = tracker.orphaned_total
+        obs = tracker.observe(event)
+
+        self.events.inc(obs.kind or "UNKNOWN")
+        if obs.decision is not None:
+            payload = event.get("payload") if isinstance(event.get("payload"), dict) else {}
+            self.decisions.inc(
+                obs.decision,
+                str(event.get("intent_type") or "unknown"),
+                str(payload.get("policy_id") or "unknown"),
+                str(payload.get("policy_version") or "unknown"),
+            )
+            codes = payload.get("reason_codes") or []
+            if not codes and payload.get("reason_code"):
+                codes = [payload["reason_code"]]
+            for code in codes if isinstance(codes, list) else [codes]:
+                self.reasons.inc(str(code))
+        if obs.intent_to_decision_ms is not None:
+            self.policy_latency.observe(obs.intent_to_decision_ms / 1000.0)
+        if obs.decision_to_execution_ms is not None:
+            self.exec_latency.observe(obs.decision_to_execution_ms / 1000.0)
+        if obs.violation is not None:
+            self.violations.inc(obs.violation)
+        if tracker.orphaned_total != gaps_before:
+            self.gaps.inc(amount=tracker.orphaned_total - gaps_before)
+
+        self.open_turns.set(tracker.open_turns)
+        self.orphaned_turns.set(tracker.orphaned_open)
+        idx = event.get("index")
+        if isinstance(idx, int):
+            self.last_index.set(idx)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry: MetricsRegistry
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.registry.render()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class MetricsServer:
+    """Serve ``/metrics`` for a registry from a background thread."""
+
+    def __init__(self, registry: MetricsRegistry, host: str = "127.0.0.1", port: int = 9464) -> None:
+        handler = type("MetricsHandler", (_MetricsHandler,), {"registry": registry})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="metrics-http", daemon=True)
+
+    @property
+    def address(self) -> tuple[str, int]:
+        host, port = self._server.server_address[:2]
+        return str(host), int(port)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
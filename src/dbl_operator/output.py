@@ -0,0 +1,116 @@
+"""Streaming machine-readable output (``--format json|ndjson|csv``)."""
+from __future__ import annotations
+
+import csv
+import json
+import sys
+from abc import ABC, abstractmethod
+from typing import Any, Iterable, TextIO
+
+__all__ = ["FORMATS", "RecordWriter", "open_writer", "write_records"]
+
+FORMATS = ("text", "json", "ndjson", "csv")
+
+
+class RecordWriter(ABC):
+    """
+    Writes flat records one at a time, so the first row is out before the
+    last one is computed and nothing is buffered beyond the current record.
+    """
+
+    def __init__(self, stream: TextIO, *, flush: bool = False) -> None:
+        self.stream = stream
+        # Push every record out immediately (live streams)
+        self.flush = flush
+        self.count = 0
+
+    @abstractmethod
+    def write(self, record: dict[str, Any]) -> None:
+        pass
+
+    def close(self) -> None:
+        self.stream.flush()
+
+    def __enter__(self) -> "RecordWriter":
+        return self
+
+    def __exit__(self, *exc: object) -> bool:
+        self.close()
+        return False
+
+
+class NdjsonWriter(RecordWriter):
+    """One JSON object per line."""
+
+    def write(self, record: dict[str, Any]) -> None:
+        self.stream.write(json.dumps(record, default=str) + "\n")
+        self.count += 1
+        if self.flush:
+            self.stream.flush()
+
+
+class JsonArrayWriter(RecordWriter):
+    """A single JSON array, emitted element by element."""
+
+    def write(self, record: dict[str, Any]) -> None:
+        self.stream.write(("[\n  " if self.count == 0 else ",\n  ") + json.dumps(record, default=str))
+        self.count += 1
+        if self.flush:
+            self.stream.flush()
+
+    def close(self) -> None:
+        self.stream.write("[]\n" if self.count == 0 else "\n]\n")
+        super().close()
+
+
+class CsvWriter(RecordWriter):
+    """
+    CSV with a header row. Reports that mix record shapes (e.g. rows and a
+    summary) get a blank line and a fresh header whenever the columns change.
+    Nested values are JSON-encoded.
+    """
+
+    def __init__(self, stream: TextIO, *, flush: bool = False) -> None:
+        super().__init__(stream, flush=flush)
+        self._writer = csv.writer(stream, lineterminator="\n")
+        self._columns: tuple[str, ...] | None = None
+
+    def write(self, record: dict[str, Any]) -> None:
+        columns = tuple(record)
+        if columns != self._columns:
+            if self._columns is not None:
+                self.stream.write("\n")
+            self._writer.writerow(columns)
+            self._columns = columns
+        self._writer.writerow([_csv_value(record[c]) for c in columns])
+        self.count += 1
+        if self.flush:
+            self.stream.flush()
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(value, default=str)
+    return value
+
+
+def open_writer(fmt: str, stream: TextIO | None = None, *, flush: bool = False) -> RecordWriter:
+    """Writer for ``fmt``; ``flush`` pushes every record out (live streams)."""
+    stream = stream or sys.stdout
+    if fmt == "ndjson":
+        return NdjsonWriter(stream, flush=flush)
+    if fmt == "csv":
+        return CsvWriter(stream, flush=flush)
+    if fmt == "json":
+        return JsonArrayWriter(stream, flush=flush)
+    raise ValueError(f"Unsupported output format: {fmt}")
+
+
+def write_records(fmt: str, records: Iterable[dict[str, Any]], stream: TextIO | None = None) -> int:
+    """Stream ``records`` to ``stream`` (stdout) and return how many were written."""
+    with open_writer(fmt, stream) as writer:
+        for record in records:
+            writer.write(record)
+    return writer.count
@@ -0,0 +1,104 @@
+"""Run projections over large ledgers on a process pool and merge the shards."""
+from __future__ import annotations
+
+import multiprocessing
+import os
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Sequence
+
+from .profiler import get_profiler
+from .projections.base import Projection
+
+__all__ = ["run_parallel", "shard_events", "shard_of"]
+
+# Below this many events per worker the pool start-up costs more than it saves
+MIN_EVENTS_PER_WORKER = 500
+
+
+def shard_of(turn_id: str, shards: int) -> int:
+    """Stable shard for a turn; unlike ``hash()`` it is the same in every process."""
+    return zlib.crc32(turn_id.encode("utf-8")) % shards
+
+
+def _shard_positions(events: Sequence[dict[str, Any]], shards: int, by: str) -> list[list[int]]:
+    if by == "range":
+        size = -(-len(events) // shards) if events else 0
+        return [list(range(i * size, min((i + 1) * size, len(events)))) for i in range(shards)]
+    out: list[list[int]] = [[] for _ in range(shards)]
+    for pos, event in enumerate(events):
+        out[shard_of(str(event.get("turn_id")), shards)].append(pos)
+    return out
+
+
+def shard_events(events: Sequence[dict[str, Any]], shards: int, *, by: str = "turn") -> list[list[dict[str, Any]]]:
+    """
+    Split events into ``shards`` lists, keeping ledger order within each.
+
+    ``by="turn"`` keeps all events of a turn in one shard. ``by="range"``
+    cuts the ledger into contiguous runs, for projections that can only
+    merge index-ordered shards.
+    """
+    return [[events[pos] for pos in positions] for positions in _shard_positions(events, shards, by)]
+
+
+def _feed_shard(factory: Callable[[], Projection], events: Sequence[dict[str, Any]]) -> Projection:
+    projection = factory()
+    for event in events:
+        projection.feed(event)
+    return projection
+
+
+def _pool_context() -> multiprocessing.context.BaseContext:
+    # The caller may already run threads (HTTP pools, tail readers); forking
+    # those is unsafe, so workers start from a clean server process instead
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def run_parallel(
+    factory: Callable[[], Projection],
+    events: Sequence[dict[str, Any]],
+    workers: int | None = None,
+    *,
+    min_events_per_worker: int = MIN_EVENTS_PER_WORKER,
+    on_reduced: Callable[[int, int], None] | None = None,
+) -> Projection:
+    """
+    Feed ``events`` through ``factory()`` projections on ``workers`` processes.
+
+    Each worker builds and feeds one projection over its shard; the partial
+    projections are merged in shard order. The result renders identically
+    to a sequential pass. ``factory`` must be picklable (a class or a
+    ``functools.partial`` of one). Each worker gets at least
+    ``min_events_per_worker`` events; when that lowers the worker count,
+    ``on_reduced(requested, used)`` is called. A single worker runs
+    in-process; several need a ``mergeable`` projection (else TypeError).
+    """
+    profiler = get_profiler()
+    requested = workers or os.cpu_count() or 1
+    workers = min(requested, max(1, len(events) // max(1, min_events_per_worker)))
+    if workers < requested and on_reduced is not None:
+        on_reduced(requested, workers)
+    if workers <= 1:
+        with profiler.stage("projection.feed", events=len(events)):
+            return _feed_shard(factory, events)
+
+    template = factory()
+    if not template.mergeable:
+        raise TypeError(f"{type(template).__name__} does not support merge, so it cannot run on several workers")
+    by = template.shard_by
+    with profiler.stage("parallel.shard", events=len(events)):
+        positions = _shard_positions(events, workers, by)
+
+    with profiler.stage("projection.feed", events=len(events)):
+        # Each worker receives only its own shard
+        shards = [[events[pos] for pos in shard] for shard in positions]
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as pool:
+            parts = list(pool.map(_feed_shard, [factory] * workers, shards))
+
+    with profiler.stage("parallel.merge"):
+        result = parts[0]
+        for part in parts[1:]:
+            result.merge(part)
+    return result
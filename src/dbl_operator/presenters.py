@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Any, Iterable, Iterator
 
 from .domain_types import AuditEventViewModel, DecisionViewModel, TurnSummary
 
@@ -37,3 +37,47 @@ def render_audit_view(events: Iterable[AuditEventViewModel]) -> str:
             f"{event.event_kind} digest={event.event_digest} v_digest={event.v_digest} payload={event.payload}"
         )
     return "\n".join(lines)
+
+
+# Machine-readable counterparts (``--format json|ndjson|csv``), one flat record per item
+
+
+def thread_view_records(thread_id: str, turns: Iterable[TurnSummary]) -> Iterator[dict[str, Any]]:
+    for turn in turns:
+        yield {
+            "record": "turn",
+            "thread_id": thread_id,
+            "turn_id": turn.turn_id,
+            "parent_turn_id": turn.parent_turn_id,
+            "context_digest": turn.context_digest,
+            "decision_digest": turn.decision_digest,
+            "execution_status": turn.execution_status,
+        }
+
+
+def decision_view_records(thread_id: str, turn_id: str, view: DecisionViewModel | None) -> Iterator[dict[str, Any]]:
+    if view is None:
+        yield {"record": "decision", "thread_id": thread_id, "turn_id": turn_id, "result": None}
+        return
+    yield {
+        "record": "decision",
+        "thread_id": thread_id,
+        "turn_id": turn_id,
+        "result": view.result,
+        "policy_id": view.policy_identity.get("id"),
+        "policy_version": view.policy_identity.get("version"),
+        "reasons": list(view.reasons),
+        "context_digest": view.context_digest,
+        "decision_digest": view.decision_digest,
+    }
+
+
+def audit_view_records(events: Iterable[AuditEventViewModel]) -> Iterator[dict[str, Any]]:
+    for event in events:
+        yield {
+            "record": "event",
+            "event_kind": event.event_kind,
+            "event_digest": event.event_digest,
+            "v_digest": event.v_digest,
+            "payload": dict(event.payload),
+        }
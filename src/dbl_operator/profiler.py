@@ -0,0 +1,170 @@
+"""Lightweight stage profiler for operator runs (``--profile``)."""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+__all__ = ["Profiler", "StageStats", "get_profiler"]
+
+
+@dataclass
+class StageStats:
+    """Accumulated timings and counters for one pipeline stage."""
+
+    name: str
+    calls: int = 0
+    seconds: float = 0.0
+    events: int = 0
+    bytes: int = 0
+
+    @property
+    def events_per_sec(self) -> float:
+        if self.seconds <= 0.0:
+            return 0.0
+        return self.events / self.seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "stage": self.name,
+            "calls": self.calls,
+            "wall_ms": round(self.seconds * 1000.0, 3),
+            "events": self.events,
+            "bytes": self.bytes,
+            "events_per_sec": round(self.events_per_sec, 1),
+        }
+
+
+class _NullStage:
+    """Shared no-op stage returned while profiling is disabled."""
+
+    __slots__ = ("events", "bytes")
+
+    def __init__(self) -> None:
+        self.events = 0
+        self.bytes = 0
+
+    def __enter__(self) -> "_NullStage":
+        return self
+
+    def __exit__(self, *exc: object) -> bool:
+        return False
+
+
+class _Stage:
+    __slots__ = ("_profiler", "_name", "_start", "events", "bytes")
+
+    def __init__(self, profiler: "Profiler", name: str, events: int, nbytes: int) -> None:
+        self._profiler = profiler
+        self._name = name
+        self._start = 0.0
+        self.events = events
+        self.bytes = nbytes
+
+    def __enter__(self) -> "_Stage":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: object) -> bool:
+        elapsed = time.perf_counter() - self._start
+        self._profiler.record(self._name, elapsed, events=self.events, nbytes=self.bytes)
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class Profiler:
+    """
+    Collects wall time, call counts, bytes and events per named stage.
+
+    Disabled profilers hand out a shared no-op context manager, so
+    instrumented code paths cost one attribute check when ``--profile``
+    is not set.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self._stages: dict[str, StageStats] = {}
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+
+    def enable(self) -> None:
+        self.enabled = True
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stages.clear()
+            self._started = time.perf_counter()
+
+    def stage(self, name: str, *, events: int = 0, nbytes: int = 0) -> _Stage | _NullStage:
+        """
+        Time a block as one call of ``name``.
+
+        The returned object exposes mutable ``events`` and ``bytes``
+        attributes so counts known only inside the block can be attached.
+        """
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name, events, nbytes)
+
+    def record(
+        self,
+        name: str,
+        seconds: float,
+        *,
+        calls: int = 1,
+        events: int = 0,
+        nbytes: int = 0,
+    ) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            stats = self._stages.get(name)
+            if stats is None:
+                stats = self._stages[name] = StageStats(name)
+            stats.calls += calls
+            stats.seconds += seconds
+            stats.events += events
+            stats.bytes += nbytes
+
+    def stages(self) -> list[StageStats]:
+        with self._lock:
+            return sorted(self._stages.values(), key=lambda s: s.seconds, reverse=True)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total_wall_ms": round((time.perf_counter() - self._started) * 1000.0, 3),
+            "stages": [s.to_dict() for s in self.stages()],
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    def render(self) -> str:
+        data = self.to_dict()
+        lines = []
+        lines.append("Stage Profile")
+        lines.append("=============")
+        header = f"{'Stage':<24} | {'Wall ms':>10} | {'Calls':>7} | {'Bytes':>10} | {'Events':>8} | {'Events/s':>10}"
+        lines.append(header)
+        lines.append("-" * len(header))
+        for s in data["stages"]:
+            lines.append(
+                f"{s['stage']:<24} | {s['wall_ms']:10.1f} | {s['calls']:7d} | {s['bytes']:10d} | "
+                f"{s['events']:8d} | {s['events_per_sec']:10.1f}"
+            )
+        lines.append("-" * len(header))
+        lines.append(f"Total wall time: {data['total_wall_ms']:.1f} ms")
+        return "\n".join(lines)
+
+
+_PROFILER = Profiler()
+
+
+def get_profiler() -> Profiler:
+    """Return the process-wide profiler used by the CLI and client."""
+    return _PROFILER
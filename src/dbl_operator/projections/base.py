@@ -1,9 +1,25 @@
 from abc import ABC, abstractmethod
-from typing import Any, Iterable, Sequence
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Sequence
+
+from ..domain_types import event_index
+
+if TYPE_CHECKING:
+    from ..sampling import Sampler
 
 class Projection(ABC):
     """Base class for all discrete projections over the event ledger."""
-    
+
+    # How the parallel runner may split the ledger for this projection:
+    # "turn" (any split, turns kept together) or "range" (contiguous runs)
+    shard_by = "turn"
+
+    # Whether merge() is implemented, so the projection can run on shards
+    mergeable = False
+
+    # Set when the projection was fed a deterministic sample of the ledger;
+    # render() then scales counts back up and says so
+    sampler: "Sampler | None" = None
+
     @abstractmethod
     def feed(self, event: dict[str, Any]) -> None:
         """Process a single event to update internal state."""
@@ -13,3 +29,58 @@ class Projection(ABC):
     def render(self) -> str:
         """Return a human-readable representation of the projection result."""
         pass
+
+    @abstractmethod
+    def records(self) -> Iterator[dict[str, Any]]:
+        """
+        Yield the result as flat records for ``--format json|ndjson|csv``.
+
+        Each record carries a ``record`` field naming its kind (row, summary,
+        ...). Records are generated lazily so writers can stream them.
+        """
+        pass
+
+    def iter_lines(self) -> Iterator[str]:
+        """Text report line by line; large tables override this to stream."""
+        yield self.render()
+
+    def merge(self, other: "Projection") -> None:
+        """
+        Fold the state of ``other`` into this projection.
+
+        ``other`` must be the same projection type and must have been fed a
+        disjoint set of events from the same ledger. Afterwards ``render``
+        returns what a single pass over both event sets would have produced,
+        regardless of how the events were split (turns may span shards).
+        State may be moved rather than copied, so ``other`` should be
+        discarded after the merge. Only projections with ``mergeable`` set
+        implement it.
+        """
+        self._check_mergeable(other)
+
+    def _check_mergeable(self, other: "Projection") -> None:
+        if not self.mergeable:
+            raise TypeError(f"{type(self).__name__} does not support merge")
+        if type(other) is not type(self):
+            raise TypeError(f"Cannot merge {type(other).__name__} into {type(self).__name__}")
+        mine = self.sampler.rate if self.sampler else 1.0
+        theirs = other.sampler.rate if other.sampler else 1.0
+        if mine != theirs:
+            raise ValueError(f"Cannot merge projections sampled at different rates ({mine} != {theirs})")
+
+    def _scaled(self, count: int) -> int:
+        """Estimated unsampled count (unchanged when not sampling)."""
+        return self.sampler.scale(count) if self.sampler else count
+
+    def _sampling_lines(self) -> list[str]:
+        return [self.sampler.describe()] if self.sampler else []
+
+    def _sampling_records(self) -> Iterator[dict[str, Any]]:
+        if self.sampler:
+            yield {"record": "sampling", "rate": self.sampler.rate, "by": self.sampler.by}
+
+
+def event_order(event: dict[str, Any]) -> int:
+    """Ledger index used to order events across shards (-1 when absent)."""
+    idx = event_index(event)
+    return -1 if idx is None else idx
@@ -1,15 +1,43 @@
 from collections import defaultdict, Counter
-from typing import Any
+from typing import Any, Iterator
+from ..sketches import HyperLogLog, SpaceSaving
 from .base import Projection
 
+# Ids counted by the approximate mode: label -> event field
+DISTINCT_FIELDS = (("threads", "thread_id"), ("turns", "turn_id"), ("correlation ids", "correlation_id"))
+
 class DecisionStatsProjection(Projection):
-    def __init__(self):
+    """
+    ALLOW/DENY matrix per policy and intent type, plus top reason codes.
+
+    With ``approx`` set, memory is fixed regardless of ledger size: the
+    matrix, intent types and reason codes are Space-Saving summaries of
+    ``capacity`` entries, and distinct threads, turns and correlation ids
+    are HyperLogLog estimates. The report states the error bounds.
+    """
+
+    mergeable = True
+
+    def __init__(self, approx: bool = False, capacity: int = 64, precision: int = 14):
+        self.approx = approx
         # (policy_id, intent_type) -> Counter(result)
         self.matrix: dict[tuple[str, str], Counter] = defaultdict(Counter)
         # reason_code -> count
         self.reasons: Counter = Counter()
+        if approx:
+            # (policy_id, intent_type, result) -> count
+            self.matrix_sketch = SpaceSaving(capacity)
+            self.intent_sketch = SpaceSaving(capacity)
+            self.reason_sketch = SpaceSaving(capacity)
+            self.distinct = {label: HyperLogLog(precision) for label, _ in DISTINCT_FIELDS}
 
     def feed(self, event: dict[str, Any]) -> None:
+        if self.approx:
+            for label, field in DISTINCT_FIELDS:
+                value = event.get(field)
+                if value:
+                    self.distinct[label].add(str(value))
+
         kind = str(event.get("kind", "")).upper()
         if kind != "DECISION":
             return
@@ -31,34 +59,177 @@ class DecisionStatsProjection(Projection):
         if not codes and res == "ALLOW":
             codes = ["allow_all"] # or implied?
         
+        if self.approx:
+            self.matrix_sketch.add((pid, intent_type, res))
+            self.intent_sketch.add(intent_type)
+            for c in codes:
+                self.reason_sketch.add(str(c))
+            return
+
         self.matrix[(pid, intent_type)][res] += 1
         for c in codes:
             self.reasons[str(c)] += 1
 
+    def merge(self, other: Projection) -> None:
+        self._check_mergeable(other)
+        assert isinstance(other, DecisionStatsProjection)
+        if other.approx != self.approx:
+            raise ValueError("Cannot merge exact and approximate decision statistics")
+        if self.approx:
+            self.matrix_sketch.merge(other.matrix_sketch)
+            self.intent_sketch.merge(other.intent_sketch)
+            self.reason_sketch.merge(other.reason_sketch)
+            for label, sketch in self.distinct.items():
+                sketch.merge(other.distinct[label])
+            return
+        for key, counts in other.matrix.items():
+            self.matrix[key].update(counts)
+        self.reasons.update(other.reasons)
+
     def render(self) -> str:
-        lines = []
-        lines.append("Decision Surface Statistics")
-        lines.append("===========================")
+        return "\n".join(self.iter_lines())
+
+    def iter_lines(self) -> Iterator[str]:
+        if self.approx:
+            yield from self._iter_approx()
+            return
+        yield "Decision Surface Statistics"
+        yield "==========================="
+        yield from self._sampling_lines()
         
         # Matrix
-        lines.append("")
-        lines.append("Decision Matrix (Policy x Intent)")
-        lines.append(f"{'Policy':<20} | {'Intent Type':<20} | {'ALLOW':>6} | {'DENY':>6} | {'Rate %':>6}")
-        lines.append("-" * 80)
+        yield ""
+        yield "Decision Matrix (Policy x Intent)"
+        yield f"{'Policy':<20} | {'Intent Type':<20} | {'ALLOW':>6} | {'DENY':>6} | {'Rate %':>6}"
+        yield "-" * 80
         
         for (pid, itype), counts in sorted(self.matrix.items()):
-            allow = counts["ALLOW"]
-            deny = counts["DENY"]
-            total = allow + deny
-            rate = (allow / total * 100.0) if total > 0 else 0.0
+            total = counts["ALLOW"] + counts["DENY"]
+            rate = (counts["ALLOW"] / total * 100.0) if total > 0 else 0.0
+            allow = self._scaled(counts["ALLOW"])
+            deny = self._scaled(counts["DENY"])
             
-            lines.append(f"{pid:<20} | {itype:<20} | {allow:6d} | {deny:6d} | {rate:6.1f}")
+            yield f"{pid:<20} | {itype:<20} | {allow:6d} | {deny:6d} | {rate:6.1f}"
             
         # Top Reasons
-        lines.append("")
-        lines.append("Top Reason Codes")
-        lines.append("----------------")
-        for code, count in self.reasons.most_common(10):
-            lines.append(f"{code:<30}: {count}")
+        yield ""
+        yield "Top Reason Codes"
+        yield "----------------"
+        # Ties broken by code so the order does not depend on arrival order
+        top = sorted(self.reasons.items(), key=lambda kv: (-kv[1], kv[0]))[:10]
+        for code, count in top:
+            yield f"{code:<30}: {self._scaled(count)}"
+
+    def _iter_approx(self) -> Iterator[str]:
+        yield "Decision Surface Statistics (approximate)"
+        yield "========================================="
+        yield from self._sampling_lines()
+        matrix = self.matrix_sketch
+        yield (
+            f"Decisions: {self._scaled(matrix.total)}  "
+            f"(counts overestimate by at most the +err shown; "
+            f"anything above {self._scaled(round(matrix.error_bound))} is always listed; "
+            f"'<=N' marks a cell not in the summary, rates use guaranteed counts)"
+        )
+
+        yield ""
+        yield "Decision Matrix (Policy x Intent, heaviest cells)"
+        yield f"{'Policy':<20} | {'Intent Type':<20} | {'ALLOW':>6} | {'DENY':>6} | {'Rate %':>6} | {'+err':>5}"
+        yield "-" * 80
+        for pid, itype, allow, deny, rate, err in self._approx_matrix():
+            yield (
+                f"{pid:<20} | {itype:<20} | {self._approx_count(allow):>6} | "
+                f"{self._approx_count(deny):>6} | {rate:6.1f} | {self._scaled(err):5d}"
+            )
+
+        for title, sketch in (("Top Intent Types", self.intent_sketch), ("Top Reason Codes", self.reason_sketch)):
+            yield ""
+            yield title
+            yield "-" * len(title)
+            for item, count, error in sketch.top(10):
+                suffix = f" (+{self._scaled(error)})" if error else ""
+                yield f"{item:<30}: {self._scaled(count)}{suffix}"
+
+        yield ""
+        first = next(iter(self.distinct.values()))
+        title = f"Distinct (HyperLogLog, {first.relative_error * 100:.2f}% std. error)"
+        yield title
+        yield "-" * len(title)
+        for label, sketch in self.distinct.items():
+            yield f"{label:<30}: ~{self._scaled(sketch.estimate())}"
+
+
+    def _approx_matrix(self) -> Iterator[tuple[str, str, tuple[int, int, bool], tuple[int, int, bool], float, int]]:
+        """
+        Matrix rows of the summary: ``(policy, intent, allow, deny, rate, err)``.
+
+        ``allow``/``deny`` are ``(upper, guaranteed, listed)``. A cell missing
+        from the summary was never counted or was evicted; its true count is
+        at most the summary floor, of which nothing is guaranteed. The rate is
+        computed from the guaranteed counts.
+        """
+        matrix = self.matrix_sketch
+        cells = {hh.item: hh for hh in matrix.top()}
+        floor = matrix.min_count
+        for pid, itype in sorted({(pid, itype) for (pid, itype, _) in cells}):
+            bounds = []
+            for result in ("ALLOW", "DENY"):
+                hh = cells.get((pid, itype, result))
+                if hh is None:
+                    bounds.append((floor, 0, False))
+                else:
+                    bounds.append((hh.count, hh.count - hh.error, True))
+            allow, deny = bounds
+            total = allow[1] + deny[1]
+            rate = (allow[1] / total * 100.0) if total > 0 else 0.0
+            err = max(b[0] - b[1] for b in bounds)
+            yield pid, itype, allow, deny, rate, err
+
+    def _approx_count(self, bound: tuple[int, int, bool]) -> str:
+        upper, _, listed = bound
+        if listed or not upper:
+            return str(self._scaled(upper))
+        return f"<={self._scaled(upper)}"
+
+    def records(self) -> Iterator[dict[str, Any]]:
+        yield from self._sampling_records()
+        if self.approx:
+            yield from self._approx_records()
+            return
+        for (pid, itype), counts in sorted(self.matrix.items()):
+            total = counts["ALLOW"] + counts["DENY"]
+            yield {
+                "record": "matrix",
+                "policy_id": pid,
+                "intent_type": itype,
+                "allow": self._scaled(counts["ALLOW"]),
+                "deny": self._scaled(counts["DENY"]),
+                "allow_rate_pct": (counts["ALLOW"] / total * 100.0) if total > 0 else 0.0,
+            }
+        for code, count in sorted(self.reasons.items(), key=lambda kv: (-kv[1], kv[0])):
+            yield {"record": "reason", "reason_code": code, "count": self._scaled(count)}
 
-        return "\n".join(lines)
+    def _approx_records(self) -> Iterator[dict[str, Any]]:
+        for pid, itype, allow, deny, rate, err in self._approx_matrix():
+            yield {
+                "record": "matrix",
+                "policy_id": pid,
+                "intent_type": itype,
+                # None: not in the summary, at most ``*_max``
+                "allow": self._scaled(allow[0]) if allow[2] else None,
+                "allow_max": self._scaled(allow[0]),
+                "deny": self._scaled(deny[0]) if deny[2] else None,
+                "deny_max": self._scaled(deny[0]),
+                "allow_rate_pct": rate,
+                "max_overcount": self._scaled(err),
+            }
+        for record, sketch in (("intent_type", self.intent_sketch), ("reason", self.reason_sketch)):
+            for item, count, error in sketch.top():
+                yield {"record": record, "key": item, "count": self._scaled(count), "max_overcount": self._scaled(error)}
+        for label, sketch in self.distinct.items():
+            yield {
+                "record": "distinct",
+                "key": label,
+                "estimate": self._scaled(sketch.estimate()),
+                "relative_std_error": sketch.relative_error,
+            }
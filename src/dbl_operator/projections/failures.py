@@ -1,8 +1,10 @@
 from collections import defaultdict, Counter
-from typing import Any
-from .base import Projection
+from typing import Any, Iterator
+from .base import Projection, event_order
 
 class FailureTaxonomyProjection(Projection):
+    mergeable = True
+
     def __init__(self):
         self.categories: Counter = Counter()
         self.turns: dict[str, dict] = defaultdict(dict)
@@ -18,59 +20,98 @@ class FailureTaxonomyProjection(Projection):
         if turn_id not in self.turns:
             self.turns[turn_id] = {"state": "OPEN"}
 
+        order = event_order(event)
+
         if kind == "DECISION":
             res = str(payload.get("decision") or payload.get("result") or "").upper()
             if res == "DENY":
                 self.categories["policy_deny"] += 1
-                self.turns[turn_id]["state"] = "DENIED"
+                self._set_state(turn_id, "DENIED", order)
                 # Store reason?
                 reason = str(payload.get("reason_code") or (payload.get("reason_codes", [""])[0]))
                 self.categories[f"deny_reason:{reason}"] += 1
 
         elif kind == "EXECUTION":
-            self.turns[turn_id]["state"] = "EXECUTED"
+            self._set_state(turn_id, "EXECUTED", order)
             # Check for execution error
             err = payload.get("error")
             if err:
                 self.categories["execution_error"] += 1
                 code = err.get("code") if isinstance(err, dict) else str(err)
                 self.categories[f"exec_error:{code}"] += 1
-                self.turns[turn_id]["state"] = "FAILED"
+                self._set_state(turn_id, "FAILED", order)
 
-    def render(self) -> str:
+    def _set_state(self, turn_id: str, state: str, order: int) -> None:
+        # Remember which event set the state so shards can be reconciled
+        self.turns[turn_id]["state"] = state
+        self.turns[turn_id]["order"] = order
+
+    def merge(self, other: Projection) -> None:
+        self._check_mergeable(other)
+        assert isinstance(other, FailureTaxonomyProjection)
+        self.categories.update(other.categories)
+        for turn_id, theirs in other.turns.items():
+            mine = self.turns.get(turn_id)
+            if mine is None:
+                self.turns[turn_id] = theirs
+                continue
+            if theirs["state"] == "OPEN":
+                continue
+            # The later state-changing event (by ledger index) wins, as in a single pass
+            if mine["state"] == "OPEN" or theirs.get("order", -1) >= mine.get("order", -1):
+                mine["state"] = theirs["state"]
+                mine["order"] = theirs.get("order", -1)
+
+    def _final_categories(self) -> tuple[Counter, int]:
         # Check for orphans (turns that are OPEN but stream ended)
+        categories = self.categories.copy()
         for t in self.turns.values():
             if t["state"] == "OPEN":
-                self.categories["orphaned_turn"] += 1
+                categories["orphaned_turn"] += 1
 
         total_failures = (
-            self.categories["policy_deny"] + 
-            self.categories["execution_error"] + 
-            self.categories["orphaned_turn"]
+            categories["policy_deny"] + 
+            categories["execution_error"] + 
+            categories["orphaned_turn"]
         )
+        return categories, total_failures
+
+    def render(self) -> str:
+        return "\n".join(self.iter_lines())
+
+    def iter_lines(self) -> Iterator[str]:
+        categories, total_failures = self._final_categories()
         
-        lines = []
-        lines.append("Failure Shape Taxonomy")
-        lines.append("======================")
-        lines.append(f"Total Observed Failures: {total_failures}")
-        lines.append("")
+        yield "Failure Shape Taxonomy"
+        yield "======================"
+        yield from self._sampling_lines()
+        yield f"Total Observed Failures: {self._scaled(total_failures)}"
+        yield ""
         
-        def print_cat(name, key):
-            count = self.categories[key]
+        for name, key in (
+            ("Policy Denials", "policy_deny"),
+            ("Execution Errors", "execution_error"),
+            ("Orphaned Turns", "orphaned_turn"),
+        ):
+            count = categories[key]
             pct = (count / total_failures * 100) if total_failures > 0 else 0
-            lines.append(f"{name:<20}: {count:>5} ({pct:5.1f}%)")
-
-        print_cat("Policy Denials", "policy_deny")
-        print_cat("Execution Errors", "execution_error")
-        print_cat("Orphaned Turns", "orphaned_turn")
+            yield f"{name:<20}: {self._scaled(count):>5} ({pct:5.1f}%)"
         
-        lines.append("")
-        lines.append("Detailed Breakdown")
-        lines.append("------------------")
+        yield ""
+        yield "Detailed Breakdown"
+        yield "------------------"
         
         # Sort keys
-        sorted_keys = sorted([k for k in self.categories.keys() if ":" in k])
+        sorted_keys = sorted([k for k in categories.keys() if ":" in k])
         for k in sorted_keys:
-            lines.append(f"{k:<30}: {self.categories[k]}")
+            yield f"{k:<30}: {self._scaled(categories[k])}"
 
-        return "\n".join(lines)
+    def records(self) -> Iterator[dict[str, Any]]:
+        categories, total_failures = self._final_categories()
+        yield from self._sampling_records()
+        yield {"record": "total", "category": "all", "count": self._scaled(total_failures), "share_pct": 100.0}
+        for key in ("policy_deny", "execution_error", "orphaned_turn"):
+            pct = (categories[key] / total_failures * 100) if total_failures > 0 else 0.0
+            yield {"record": "category", "category": key, "count": self._scaled(categories[key]), "share_pct": pct}
+        for key in sorted(k for k in categories if ":" in k):
+            yield {"record": "detail", "category": key, "count": self._scaled(categories[key]), "share_pct": None}
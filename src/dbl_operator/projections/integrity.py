@@ -1,6 +1,6 @@
 from collections import defaultdict
-from typing import Any, NamedTuple
-from .base import Projection
+from typing import Any, Iterator, NamedTuple
+from .base import Projection, event_order
 
 class TurnState:
     def __init__(self, turn_id: str):
@@ -8,12 +8,18 @@ class TurnState:
         self.has_intent = False
         self.has_decision = False
         self.decision_result: str | None = None
+        self.decision_order = -1
         self.has_execution = False
-        self.events: list[dict[str, Any]] = []
+        # Only the first event's position is needed (for ordering the report),
+        # so turns do not hold on to their events
+        self.first_index: Any = None
+        self.first_order: int | None = None
 
     def update(self, event: dict[str, Any]):
         kind = str(event.get("kind", "")).upper()
-        self.events.append(event)
+        if self.first_order is None:
+            self.first_index = event.get("index")
+            self.first_order = event_order(event)
         
         if kind == "INTENT":
             self.has_intent = True
@@ -24,15 +30,32 @@ class TurnState:
             # In v0.4.x: payload["decision"] = "ALLOW" / "DENY"
             # Check projection.py: data.get("decision", "DENY")
             self.decision_result = str(payload.get("decision") or payload.get("result") or "UNKNOWN")
+            self.decision_order = event_order(event)
         elif kind == "EXECUTION":
             self.has_execution = True
 
+    def merge(self, other: "TurnState"):
+        """Combine two partial views of the same turn from different shards."""
+        self.has_intent = self.has_intent or other.has_intent
+        self.has_execution = self.has_execution or other.has_execution
+        if other.has_decision and (not self.has_decision or other.decision_order >= self.decision_order):
+            self.decision_result = other.decision_result
+            self.decision_order = other.decision_order
+        self.has_decision = self.has_decision or other.has_decision
+        if other.first_order is not None and (self.first_order is None or other.first_order < self.first_order):
+            self.first_index = other.first_index
+            self.first_order = other.first_order
+
 class IntegrityStatus(NamedTuple):
     status: str  # OK, GAP, VIOLATION
     detail: str
 
 class IntegrityProjection(Projection):
-    def __init__(self):
+    mergeable = True
+
+    def __init__(self, only_problems: bool = False):
+        # Report only GAP/VIOLATION turns (the summary still counts all)
+        self.only_problems = only_problems
         self.turns: dict[str, TurnState] = defaultdict(lambda: TurnState(""))
         # Need to fix lambda to set turn_id correctly? 
         # Easier: explicit creation in feed.
@@ -48,6 +71,16 @@ class IntegrityProjection(Projection):
         
         self.turns[turn_id].update(event)
 
+    def merge(self, other: Projection) -> None:
+        self._check_mergeable(other)
+        assert isinstance(other, IntegrityProjection)
+        for turn_id, theirs in other.turns.items():
+            mine = self.turns.get(turn_id)
+            if mine is None:
+                self.turns[turn_id] = theirs
+            else:
+                mine.merge(theirs)
+
     def evaluate(self, state: TurnState) -> IntegrityStatus:
         if not state.has_intent:
             # Orphaned decision/execution?
@@ -74,29 +107,49 @@ class IntegrityProjection(Projection):
         else:
             return IntegrityStatus("GAP", f"Unknown Decision: {state.decision_result}")
 
-    def render(self) -> str:
-        lines = []
-        lines.append("Turn Integrity Projection")
-        lines.append("=========================")
-        lines.append(f"{'TURN ID':<36} | {'STATUS':<10} | {'DETAIL'}")
-        lines.append("-" * 80)
-        
-        counts = defaultdict(int)
-        
-        # Sort by turn_id usually implies time roughly? Or sort by first event index?
-        # We can sort by turns.values() -> min index?
-        # For now, simple sort by ID or insert order.
-        
-        sorted_turns = sorted(self.turns.values(), key=lambda t: t.events[0].get("index") if t.events else 0)
-
+    def _evaluated(self) -> Iterator[tuple[TurnState, IntegrityStatus]]:
+        # Ordered by the ledger index of each turn's first event
+        sorted_turns = sorted(self.turns.values(), key=lambda t: t.first_order)
         for turn in sorted_turns:
-            res = self.evaluate(turn)
+            yield turn, self.evaluate(turn)
+
+    def iter_lines(self) -> Iterator[str]:
+        yield "Turn Integrity Projection"
+        yield "========================="
+        yield from self._sampling_lines()
+        if self.only_problems:
+            yield "(only turns with status GAP or VIOLATION)"
+        yield f"{'TURN ID':<36} | {'STATUS':<10} | {'DETAIL'}"
+        yield "-" * 80
+
+        counts: dict[str, int] = defaultdict(int)
+        for turn, res in self._evaluated():
             counts[res.status] += 1
-            lines.append(f"{turn.turn_id:<36} | {res.status:<10} | {res.detail}")
+            if self.only_problems and res.status == "OK":
+                continue
+            yield f"{turn.turn_id:<36} | {res.status:<10} | {res.detail}"
 
-        lines.append("-" * 80)
-        lines.append("Summary:")
+        yield "-" * 80
+        yield "Summary:"
         for k, v in counts.items():
-            lines.append(f"  {k}: {v}")
-            
-        return "\n".join(lines)
+            yield f"  {k}: {self._scaled(v)}"
+
+    def render(self) -> str:
+        return "\n".join(self.iter_lines())
+
+    def records(self) -> Iterator[dict[str, Any]]:
+        yield from self._sampling_records()
+        counts: dict[str, int] = defaultdict(int)
+        for turn, res in self._evaluated():
+            counts[res.status] += 1
+            if self.only_problems and res.status == "OK":
+                continue
+            yield {
+                "record": "turn",
+                "turn_id": turn.turn_id,
+                "status": res.status,
+                "detail": res.detail,
+                "first_index": turn.first_index,
+            }
+        for k, v in counts.items():
+            yield {"record": "summary", "status": k, "count": self._scaled(v)}
@@ -1,7 +1,12 @@
+import heapq
 from collections import defaultdict
-from typing import Any, NamedTuple
+from typing import Any, Iterator, NamedTuple, Sequence
 from datetime import datetime
-from .base import Projection
+from ..sketches import QuantileSketch
+from .base import Projection, event_order
+
+# Dimensions a latency breakdown can be grouped by
+GROUP_DIMENSIONS = ("intent_type", "policy", "lane")
 
 def parse_ts(ts_str: str) -> float:
     # Example: 2023-10-27T10:00:00.123456+00:00
@@ -20,9 +25,61 @@ class TurnTimes(NamedTuple):
     decision_ts: float
     execution_ts: float
 
+def _keep_largest(heap: list, item: tuple, keep: int) -> None:
+    """Add ``item`` to the min-heap ``heap`` holding the ``keep`` largest items."""
+    if len(heap) < keep:
+        heapq.heappush(heap, item)
+    elif heap and item > heap[0]:
+        heapq.heapreplace(heap, item)
+
+
+class _GroupStats:
+    """Per-group percentile summaries and the slowest turns, in bounded memory."""
+
+    __slots__ = ("turns", "policy", "execution", "total", "slowest")
+
+    def __init__(self) -> None:
+        self.turns = 0
+        self.policy = QuantileSketch()
+        self.execution = QuantileSketch()
+        self.total = QuantileSketch()
+        # Min-heap of (total_ms, turn_id) holding the N slowest turns
+        self.slowest: list[tuple[float, str]] = []
+
+    def add_slowest(self, total_ms: float, turn_id: str, keep: int) -> None:
+        _keep_largest(self.slowest, (total_ms, turn_id), keep)
+
+
+class _Measurements(NamedTuple):
+    metrics: list[tuple[str, list[float]]]
+    slowest: list[tuple[float, str, float, float]]
+    groups: dict[str, list[tuple[str, _GroupStats]]]
+
+
 class LatencyProjection(Projection):
-    def __init__(self):
+    """
+    Intent -> decision -> execution latency percentiles and slowest turns.
+
+    With ``group_by`` (any of ``intent_type``, ``policy`` and ``lane``) the
+    report adds one breakdown per dimension. Groups use log-bucketed
+    percentile sketches (1% relative accuracy). The ``slowest`` turns,
+    overall and per group, are kept in bounded heaps, so their cost does
+    not grow with a full sort.
+    """
+
+    mergeable = True
+
+    def __init__(self, group_by: Sequence[str] = (), slowest: int = 5):
+        unknown = [dim for dim in group_by if dim not in GROUP_DIMENSIONS]
+        if unknown:
+            raise ValueError(f"Unknown latency dimension(s): {', '.join(unknown)}")
+        self.group_by = tuple(group_by)
+        self.slowest = slowest
         self.turns: dict[str, dict[str, float]] = defaultdict(dict)
+        # turn_id -> phase -> index of the event that set the timestamp
+        self.orders: dict[str, dict[str, int]] = defaultdict(dict)
+        # turn_id -> dimension -> (index of the first event carrying it, value)
+        self.dims: dict[str, dict[str, tuple[int, str]]] = defaultdict(dict)
 
     def feed(self, event: dict[str, Any]) -> None:
         turn_id = str(event.get("turn_id"))
@@ -32,20 +89,63 @@ class LatencyProjection(Projection):
         if not turn_id: 
             return
             
-        if kind == "INTENT":
-            self.turns[turn_id]["intent"] = ts
-        elif kind == "DECISION":
-            self.turns[turn_id]["decision"] = ts
-        elif kind == "EXECUTION":
-            self.turns[turn_id]["execution"] = ts
+        phase = {"INTENT": "intent", "DECISION": "decision", "EXECUTION": "execution"}.get(kind)
+        if phase is None:
+            return
+        order = event_order(event)
+        self.turns[turn_id][phase] = ts
+        self.orders[turn_id][phase] = order
+        if self.group_by:
+            self._note_dims(turn_id, kind, event, order)
 
-    def render(self) -> str:
+    def _note_dims(self, turn_id: str, kind: str, event: dict[str, Any], order: int) -> None:
+        found: dict[str, str] = {}
+        if event.get("intent_type"):
+            found["intent_type"] = str(event["intent_type"])
+        if event.get("lane"):
+            found["lane"] = str(event["lane"])
+        if kind == "DECISION":
+            payload = event.get("payload") if isinstance(event.get("payload"), dict) else {}
+            found["policy"] = f"{payload.get('policy_id', 'unknown')}@{payload.get('policy_version', 'unknown')}"
+        dims = self.dims[turn_id]
+        for dim, value in found.items():
+            # The earliest event by ledger index decides, however events were sharded
+            current = dims.get(dim)
+            if current is None or order < current[0]:
+                dims[dim] = (order, value)
+
+    def merge(self, other: Projection) -> None:
+        self._check_mergeable(other)
+        assert isinstance(other, LatencyProjection)
+        for turn_id, times in other.turns.items():
+            if turn_id in other.dims:
+                dims = self.dims[turn_id]
+                for dim, (order, value) in other.dims[turn_id].items():
+                    if dim not in dims or order < dims[dim][0]:
+                        dims[dim] = (order, value)
+            if turn_id not in self.turns:
+                self.turns[turn_id] = times
+                self.orders[turn_id] = other.orders.get(turn_id, {})
+                continue
+            mine = self.turns[turn_id]
+            mine_orders = self.orders[turn_id]
+            their_orders = other.orders.get(turn_id, {})
+            for phase, ts in times.items():
+                order = their_orders.get(phase, -1)
+                # Last writer by ledger index wins, as in a single pass
+                if phase not in mine or order >= mine_orders.get(phase, -1):
+                    mine[phase] = ts
+                    mine_orders[phase] = order
+
+    def _collect(self) -> "_Measurements":
         # Collect measurements
         policy_latency = []
         exec_latency = []
         total_latency = []
         
-        slowest_turns = []
+        # Min-heap of (total_ms, turn_id, policy_ms, exec_ms) holding the N slowest turns
+        slowest_turns: list[tuple[float, str, float, float]] = []
+        groups: dict[str, dict[str, _GroupStats]] = {dim: {} for dim in self.group_by}
 
         for tid, times in self.turns.items():
             t_int = times.get("intent")
@@ -69,43 +169,132 @@ class LatencyProjection(Projection):
                 total_latency.append(tot_lat)
                 
             if tot_lat:
-                slowest_turns.append((tot_lat, tid, p_lat or 0, e_lat or 0))
+                _keep_largest(slowest_turns, (tot_lat, tid, p_lat or 0, e_lat or 0), self.slowest)
+
+            if self.group_by:
+                dims = self.dims.get(tid, {})
+                for dim in self.group_by:
+                    key = dims[dim][1] if dim in dims else "-"
+                    stats = groups[dim].get(key)
+                    if stats is None:
+                        stats = groups[dim][key] = _GroupStats()
+                    stats.turns += 1
+                    if p_lat is not None:
+                        stats.policy.add(p_lat)
+                    if e_lat is not None:
+                        stats.execution.add(e_lat)
+                    if tot_lat is not None:
+                        stats.total.add(tot_lat)
+                        stats.add_slowest(tot_lat, tid, self.slowest)
 
         # Sort measurements
         policy_latency.sort()
         exec_latency.sort()
         total_latency.sort()
-        slowest_turns.sort(key=lambda x: x[0], reverse=True) # Slowest first
+        slowest_turns.sort(reverse=True)
+        metrics = [
+            ("Intent -> Decision", policy_latency),
+            ("Decision -> Exec", exec_latency),
+            ("Total (E2E)", total_latency),
+        ]
+        ranked = {
+            # Worst tail first, so a regressing group is on top
+            dim: sorted(by_key.items(), key=lambda kv: (-kv[1].total.quantile(0.95), kv[0]))
+            for dim, by_key in groups.items()
+        }
+        return _Measurements(metrics, slowest_turns, ranked)
 
-        def get_p(data, p):
-            if not data: return 0.0
-            idx = int(len(data) * p)
-            return data[min(idx, len(data)-1)]
+    @staticmethod
+    def _percentile(data: list[float], p: float) -> float:
+        if not data: return 0.0
+        idx = int(len(data) * p)
+        return data[min(idx, len(data)-1)]
 
-        lines = []
-        lines.append("Latency Profile (ms)")
-        lines.append("====================")
+    def render(self) -> str:
+        return "\n".join(self.iter_lines())
+
+    def iter_lines(self) -> Iterator[str]:
+        measured = self._collect()
+        get_p = self._percentile
+
+        yield "Latency Profile (ms)"
+        yield "===================="
+        yield from self._sampling_lines()
         
         header = f"{'Metric':<20} | {'P50':>8} | {'P95':>8} | {'P99':>8} | {'Count':>6}"
-        lines.append(header)
-        lines.append("-" * len(header))
+        yield header
+        yield "-" * len(header)
         
         def row(name, data):
             p50 = get_p(data, 0.50)
             p95 = get_p(data, 0.95)
             p99 = get_p(data, 0.99)
-            count = len(data)
+            count = self._scaled(len(data))
             return f"{name:<20} | {p50:8.1f} | {p95:8.1f} | {p99:8.1f} | {count:6d}"
 
-        lines.append(row("Intent -> Decision", policy_latency))
-        lines.append(row("Decision -> Exec", exec_latency))
-        lines.append(row("Total (E2E)", total_latency))
+        for name, data in measured.metrics:
+            yield row(name, data)
         
-        lines.append("")
-        lines.append("Slowest 5 Turns")
-        lines.append("---------------")
-        lines.append(f"{'Turn ID':<36} | {'Total':>8} | {'Policy':>8} | {'Exec':>8}")
-        for t, tid, p, e in slowest_turns[:5]:
-            lines.append(f"{tid:<36} | {t:8.1f} | {p:8.1f} | {e:8.1f}")
-
-        return "\n".join(lines)
+        yield ""
+        title = f"Slowest {self.slowest} Turns"
+        yield title
+        yield "-" * len(title)
+        yield f"{'Turn ID':<36} | {'Total':>8} | {'Policy':>8} | {'Exec':>8}"
+        for t, tid, p, e in measured.slowest:
+            yield f"{tid:<36} | {t:8.1f} | {p:8.1f} | {e:8.1f}"
+
+        for dim, ranked in measured.groups.items():
+            yield from self._iter_groups(dim, ranked)
+
+    def _iter_groups(self, dim: str, ranked: list[tuple[str, _GroupStats]]) -> Iterator[str]:
+        yield ""
+        title = f"By {dim} (ms, ~1% accuracy)"
+        yield title
+        yield "-" * len(title)
+        header = (
+            f"{'Group':<24} | {'Turns':>6} | {'I->D P50':>8} | {'I->D P95':>8} | "
+            f"{'D->E P50':>8} | {'D->E P95':>8} | {'E2E P95':>8} | {'E2E P99':>8}"
+        )
+        yield header
+        yield "-" * len(header)
+        for key, stats in ranked:
+            turns = self._scaled(stats.turns)
+            yield (
+                f"{key:<24} | {turns:6d} | {stats.policy.quantile(0.50):8.1f} | {stats.policy.quantile(0.95):8.1f} | "
+                f"{stats.execution.quantile(0.50):8.1f} | {stats.execution.quantile(0.95):8.1f} | "
+                f"{stats.total.quantile(0.95):8.1f} | {stats.total.quantile(0.99):8.1f}"
+            )
+            if stats.slowest:
+                slowest = ", ".join(f"{tid} ({t:.1f})" for t, tid in sorted(stats.slowest, reverse=True))
+                yield f"{'':<24}   slowest: {slowest}"
+
+    def records(self) -> Iterator[dict[str, Any]]:
+        measured = self._collect()
+        get_p = self._percentile
+        yield from self._sampling_records()
+        for name, data in measured.metrics:
+            yield {
+                "record": "percentiles",
+                "metric": name,
+                "p50_ms": get_p(data, 0.50),
+                "p95_ms": get_p(data, 0.95),
+                "p99_ms": get_p(data, 0.99),
+                "count": self._scaled(len(data)),
+            }
+        for t, tid, p, e in measured.slowest:
+            yield {"record": "slowest", "turn_id": tid, "total_ms": t, "policy_ms": p, "exec_ms": e}
+        for dim, ranked in measured.groups.items():
+            for key, stats in ranked:
+                yield {
+                    "record": "group",
+                    "dimension": dim,
+                    "group": key,
+                    "turns": self._scaled(stats.turns),
+                    "intent_to_decision_p50_ms": stats.policy.quantile(0.50),
+                    "intent_to_decision_p95_ms": stats.policy.quantile(0.95),
+                    "decision_to_exec_p50_ms": stats.execution.quantile(0.50),
+                    "decision_to_exec_p95_ms": stats.execution.quantile(0.95),
+                    "total_p95_ms": stats.total.quantile(0.95),
+                    "total_p99_ms": stats.total.quantile(0.99),
+                    "slowest": [tid for _, tid in sorted(stats.slowest, reverse=True)],
+                }
@@ -0,0 +1,78 @@
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+from .base import Projection
+
+if TYPE_CHECKING:
+    from ..sampling import Sampler
+
+PartitionKey = tuple[str, str]
+
+
+def partition_key(event: dict[str, Any]) -> PartitionKey:
+    """(stream_id, lane) of an event, as recorded by the gateway."""
+    return (str(event.get("stream_id") or "-"), str(event.get("lane") or "-"))
+
+
+class PartitionedProjection(Projection):
+    """Runs one projection per stream/lane partition plus an overall rollup."""
+
+    def __init__(self, factory: Callable[[], Projection]):
+        self.factory = factory
+        self.partitions: dict[PartitionKey, Projection] = {}
+        self.rollup: Projection = factory()
+        self.shard_by = self.rollup.shard_by
+        self.mergeable = self.rollup.mergeable
+        self._sampler: "Sampler | None" = None
+
+    @property
+    def sampler(self) -> "Sampler | None":  # type: ignore[override]
+        return self._sampler
+
+    @sampler.setter
+    def sampler(self, sampler: "Sampler | None") -> None:
+        self._sampler = sampler
+        self.rollup.sampler = sampler
+        for projection in self.partitions.values():
+            projection.sampler = sampler
+
+    def feed(self, event: dict[str, Any]) -> None:
+        key = partition_key(event)
+        projection = self.partitions.get(key)
+        if projection is None:
+            projection = self.partitions[key] = self.factory()
+            projection.sampler = self._sampler
+        projection.feed(event)
+        self.rollup.feed(event)
+
+    def merge(self, other: Projection) -> None:
+        self._check_mergeable(other)
+        assert isinstance(other, PartitionedProjection)
+        for key, theirs in other.partitions.items():
+            mine = self.partitions.get(key)
+            if mine is None:
+                mine = self.partitions[key] = self.factory()
+                mine.sampler = self._sampler
+            mine.merge(theirs)
+        self.rollup.merge(other.rollup)
+
+    def iter_lines(self) -> Iterator[str]:
+        for (stream_id, lane), projection in sorted(self.partitions.items()):
+            title = f"Partition: stream={stream_id} lane={lane}"
+            yield title
+            yield "#" * len(title)
+            yield from projection.iter_lines()
+            yield ""
+
+        title = f"Overall ({len(self.partitions)} partitions)"
+        yield title
+        yield "#" * len(title)
+        yield from self.rollup.iter_lines()
+
+    def render(self) -> str:
+        return "\n".join(self.iter_lines())
+
+    def records(self) -> Iterator[dict[str, Any]]:
+        # The rollup is reported as stream/lane "*"
+        sections = [*sorted(self.partitions.items()), (("*", "*"), self.rollup)]
+        for (stream_id, lane), projection in sections:
+            for record in projection.records():
+                yield {"stream_id": stream_id, "lane": lane, **record}
@@ -1,5 +1,5 @@
 from collections import defaultdict
-from typing import Any, NamedTuple
+from typing import Any, Iterator, NamedTuple
 from datetime import datetime
 from .base import Projection
 
@@ -13,6 +13,9 @@ class PolicySpan(NamedTuple):
     end_index: int
 
 class PolicyMapProjection(Projection):
+    shard_by = "range"
+    mergeable = True
+
     def __init__(self):
         self.spans: list[dict] = []
         self.current_span: dict | None = None
@@ -54,26 +57,74 @@ class PolicyMapProjection(Projection):
             self.current_span["end_index"] = idx
             self.current_span["turn_count"] += 1
 
-    def render(self) -> str:
-        # Finalize last span
+    def _all_spans(self) -> list[dict]:
+        """Closed spans plus the open one, without finalizing it."""
+        spans = [dict(span) for span in self.spans]
         if self.current_span:
-            self.spans.append(self.current_span)
-            self.current_span = None
+            spans.append(dict(self.current_span))
+        return spans
+
+    def merge(self, other: Projection) -> None:
+        """
+        Append a later shard of the ledger.
+
+        Spans are ordered by index, so only contiguous, index-ordered shards
+        can be merged: ``other`` must start at or after the last index seen
+        here. A span that runs across the shard boundary is joined back
+        into one.
+        """
+        self._check_mergeable(other)
+        assert isinstance(other, PolicyMapProjection)
+        mine = self._all_spans()
+        theirs = other._all_spans()
+        if mine and theirs:
+            if theirs[0]["start_index"] < mine[-1]["end_index"]:
+                raise ValueError(
+                    "PolicyMapProjection can only merge index-ordered shards "
+                    f"({theirs[0]['start_index']} < {mine[-1]['end_index']})"
+                )
+            last, first = mine[-1], theirs[0]
+            if last["policy_id"] == first["policy_id"] and last["version"] == first["version"]:
+                last["end_ts"] = first["end_ts"]
+                last["end_index"] = first["end_index"]
+                last["turn_count"] += first["turn_count"]
+                theirs = theirs[1:]
+        merged = mine + theirs
+        self.spans = merged[:-1]
+        self.current_span = merged[-1] if merged else None
+        if other.last_ts:
+            self.last_ts = other.last_ts
 
-        lines = []
-        lines.append("Policy Footprint Timeline")
-        lines.append("=========================")
+    def render(self) -> str:
+        return "\n".join(self.iter_lines())
+
+    def iter_lines(self) -> Iterator[str]:
+        yield "Policy Footprint Timeline"
+        yield "========================="
+        yield from self._sampling_lines()
         
         header = f"{'Start Time':<24} | {'Policy ID':<20} | {'Ver':<8} | {'Turns':>6} | {'Idx Range'}"
-        lines.append(header)
-        lines.append("-" * len(header))
+        yield header
+        yield "-" * len(header)
         
-        for span in self.spans:
+        for span in self._all_spans():
             # Format TS? Keep raw ISO for precision or truncate
             start = span["start_ts"][:19] # YYYY-MM-DDTHH:MM:SS
             # end = span["end_ts"][:19]
             idx_range = f"{span['start_index']} - {span['end_index']}"
             
-            lines.append(f"{start:<24} | {span['policy_id']:<20} | {span['version']:<8} | {span['turn_count']:6d} | {idx_range}")
+            yield f"{start:<24} | {span['policy_id']:<20} | {span['version']:<8} | {self._scaled(span['turn_count']):6d} | {idx_range}"
 
-        return "\n".join(lines)
+    def records(self) -> Iterator[dict[str, Any]]:
+        yield from self._sampling_records()
+        for span in self._all_spans():
+            yield {
+                "record": "span",
+                "policy_id": span["policy_id"],
+                "version": span["version"],
+                "start_ts": span["start_ts"],
+                "end_ts": span["end_ts"],
+                "start_index": span["start_index"],
+                "end_index": span["end_index"],
+                "turn_count": self._scaled(span["turn_count"]),
+            }
@@ -0,0 +1,267 @@
+"""Durable raw capture of the tail stream into rotating segment files (``tail --record``)."""
+from __future__ import annotations
+
+import gzip
+import json
+import lzma
+import os
+import queue
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, Iterator
+
+from .tail_stream import event_index
+
+__all__ = ["COMPRESSIONS", "INDEX_NAME", "SegmentRecorder", "load_index"]
+
+COMPRESSIONS = ("none", "gzip", "xz")
+INDEX_NAME = "index.json"
+
+_SUFFIXES = {"none": ".ndjson", "gzip": ".ndjson.gz", "xz": ".ndjson.xz"}
+# Events written per group commit at most, so the index stays reasonably fresh
+_BATCH_MAX = 4096
+_STOP = object()
+
+
+def load_index(directory: Path) -> list[dict[str, Any]]:
+    """Segment entries of a recording, oldest first; empty if there is none."""
+    try:
+        with open(Path(directory) / INDEX_NAME, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+    except (OSError, ValueError):
+        return []
+    segments = data.get("segments") if isinstance(data, dict) else None
+    return [s for s in segments if isinstance(s, dict)] if isinstance(segments, list) else []
+
+
+class _Segment:
+    """One open segment file and its index entry."""
+
+    def __init__(self, path: Path, compression: str) -> None:
+        self.path = path
+        self.raw: BinaryIO = open(path, "xb")
+        if compression == "gzip":
+            self.fh: BinaryIO = gzip.GzipFile(fileobj=self.raw, mode="wb")
+        elif compression == "xz":
+            self.fh = lzma.LZMAFile(self.raw, "wb")
+        else:
+            self.fh = self.raw
+        self.opened = time.monotonic()
+        self.entry: dict[str, Any] = {
+            "file": path.name,
+            "events": 0,
+            "bytes": 0,
+            "min_index": None,
+            "max_index": None,
+            "min_timestamp": None,
+            "max_timestamp": None,
+            "closed": False,
+        }
+
+    def write(self, event: dict[str, Any], line: bytes) -> None:
+        self.fh.write(line)
+        entry = self.entry
+        entry["events"] += 1
+        entry["bytes"] += len(line)
+        idx = event_index(event)
+        if idx is not None:
+            if entry["min_index"] is None or idx < entry["min_index"]:
+                entry["min_index"] = idx
+            if entry["max_index"] is None or idx > entry["max_index"]:
+                entry["max_index"] = idx
+        ts = event.get("timestamp")
+        if isinstance(ts, str) and ts:
+            if entry["min_timestamp"] is None or ts < entry["min_timestamp"]:
+                entry["min_timestamp"] = ts
+            if entry["max_timestamp"] is None or ts > entry["max_timestamp"]:
+                entry["max_timestamp"] = ts
+
+    def sync(self) -> None:
+        # gzip emits a sync-flush block, so everything up to here is readable;
+        # xz output only becomes readable once the segment is closed
+        self.fh.flush()
+        self.raw.flush()
+        os.fsync(self.raw.fileno())
+
+    def close(self) -> None:
+        if self.fh is not self.raw:
+            self.fh.close()
+        self.raw.flush()
+        os.fsync(self.raw.fileno())
+        self.raw.close()
+        self.entry["closed"] = True
+
+
+class SegmentRecorder:
+    """
+    Append events as compact JSON lines to rotating segment files.
+
+    ``record`` only enqueues, so the caller (the live display) never waits
+    on the disk; a writer thread drains the queue in batches, and a batch is
+    made durable with one ``fsync`` at most every ``fsync_secs`` (group
+    commit). A segment is closed and a new one started once it holds
+    ``max_bytes`` of JSON or is ``max_secs`` old. ``index.json`` lists every
+    segment with its event count and min/max event index and timestamp; it
+    is rewritten atomically at each commit, so a crash loses at most the
+    last ``fsync_secs`` of events.
+
+    At most ``max_pending`` events wait for the writer (``pending``); when
+    the disk falls that far behind, ``record`` blocks until there is room
+    instead of dropping events, and ``blocked`` counts how often it did.
+    A write error stops recording and is kept in ``error``; the stream
+    itself is never interrupted.
+    """
+
+    def __init__(
+        self,
+        directory: Path | str,
+        *,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_secs: float | None = 3600.0,
+        compression: str = "none",
+        fsync_secs: float = 1.0,
+        max_pending: int = 100_000,
+    ) -> None:
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"compression must be one of {', '.join(COMPRESSIONS)}, got {compression!r}")
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_secs = max_secs or None
+        self.compression = compression
+        self.fsync_secs = fsync_secs
+        self.events = 0
+        self.blocked = 0
+        self.error: BaseException | None = None
+        # Earlier recordings in the same directory are continued, not replaced
+        self._segments = load_index(self.directory)
+        self._next_seq = len(self._segments) + 1
+        self._current: _Segment | None = None
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max_pending)
+        self._thread = threading.Thread(target=self._run, name="tail-recorder", daemon=True)
+        self._thread.start()
+
+    @property
+    def segments(self) -> list[dict[str, Any]]:
+        return [dict(s) for s in self._segments]
+
+    @property
+    def pending(self) -> int:
+        """Events queued but not yet written."""
+        return self._queue.qsize()
+
+    def record(self, event: dict[str, Any]) -> None:
+        if self.error is not None:
+            return
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            # The writer keeps draining (and discarding) after an error, so this returns
+            self.blocked += 1
+            self._queue.put(event)
+
+    def tee(self, events: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        """Pass ``events`` through, recording each one on the way."""
+        for event in events:
+            self.record(event)
+            yield event
+
+    def close(self) -> None:
+        """Write out everything queued, close the open segment and wait for the writer."""
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def _run(self) -> None:
+        last_sync = time.monotonic()
+        dirty = False
+        while True:
+            try:
+                # While uncommitted events wait, wake up in time to commit them
+                item = self._queue.get(timeout=self.fsync_secs if dirty else None)
+            except queue.Empty:
+                item = None
+            batch = [] if item is None else [item]
+            while batch and len(batch) < _BATCH_MAX and batch[-1] is not _STOP:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stopping = bool(batch) and batch[-1] is _STOP
+            if stopping:
+                batch.pop()
+            if self.error is None:
+                try:
+                    for event in batch:
+                        self._write(event)
+                    dirty = dirty or bool(batch)
+                    now = time.monotonic()
+                    if stopping:
+                        self._rotate()
+                    elif dirty and now - last_sync >= self.fsync_secs:
+                        self._commit()
+                        dirty = False
+                        last_sync = now
+                except Exception as exc:
+                    self.error = exc
+            if stopping:
+                return
+
+    def _commit(self) -> None:
+        if self._current is not None:
+            self._current.sync()
+        self._store_index()
+
+    def _write(self, event: dict[str, Any]) -> None:
+        segment = self._current
+        if segment is not None and (
+            segment.entry["bytes"] >= self.max_bytes
+            or (self.max_secs is not None and time.monotonic() - segment.opened >= self.max_secs)
+        ):
+            self._rotate()
+            segment = None
+        if segment is None:
+            segment = self._open()
+        line = (json.dumps(event, ensure_ascii=False, separators=(",", ":"), default=str) + "\n").encode("utf-8")
+        segment.write(event, line)
+        self.events += 1
+
+    def _open(self) -> _Segment:
+        while True:
+            path = self.directory / f"segment-{self._next_seq:06d}{_SUFFIXES[self.compression]}"
+            self._next_seq += 1
+            # A crash can leave a segment the index never heard of
+            if not any(self.directory.glob(f"{path.name.split('.', 1)[0]}.*")):
+                break
+        segment = _Segment(path, self.compression)
+        self._segments.append(segment.entry)
+        self._current = segment
+        return segment
+
+    def _rotate(self) -> None:
+        if self._current is not None:
+            self._current.close()
+            self._current = None
+        if self._segments:
+            self._store_index()
+
+    def _store_index(self) -> None:
+        # Write-then-rename so a reader (or a crash) never sees a torn index
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".index-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump({"version": 1, "segments": self._segments}, fh, indent=1)
+                fh.flush()
+                os.fsync(fh.fileno())
+            os.replace(tmp, self.directory / INDEX_NAME)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
@@ -0,0 +1,280 @@
+"""Replay of recorded or exported event files as a read-only gateway."""
+from __future__ import annotations
+
+import gzip
+import itertools
+import json
+import lzma
+import time
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator, Sequence
+
+from .domain_types import (
+    AuditEventViewModel,
+    DecisionViewModel,
+    GatewayAck,
+    IntentEnvelope,
+    Partition,
+    TurnSummary,
+)
+from .exporter import MANIFEST_NAME, load_manifest
+from .ledger_index import LedgerIndex
+from .projections.latency import parse_ts
+from .recorder import INDEX_NAME, load_index
+from .tail_stream import event_index
+
+__all__ = ["ReplayGatewayClient", "iter_recording", "recording_files"]
+
+
+def _since_ts(from_time: str | None) -> float:
+    """Epoch seconds of ``from_time`` (0.0 when unset); rejects what ``parse_ts`` cannot read."""
+    if not from_time:
+        return 0.0
+    since_ts = parse_ts(from_time)
+    if not since_ts:
+        raise ValueError(f"from_time must be an ISO-8601 timestamp, got {from_time!r}")
+    return since_ts
+
+
+def recording_files(path: Path, *, from_index: int | None = None, from_time: str | None = None) -> list[Path]:
+    """
+    Event files of a recording in ledger order.
+
+    ``path`` is a single file or a directory. A directory with an
+    ``index.json`` (``tail --record``) or a ``manifest.json`` (``export``)
+    is read in that order, and segments that end before
+    ``from_index``/``from_time`` are skipped without being opened; other
+    directories contribute their ``*.ndjson*`` and ``*.json`` files sorted
+    by name.
+    """
+    path = Path(path)
+    if path.is_file():
+        return [path]
+    if not path.is_dir():
+        raise FileNotFoundError(f"No recording at {path}")
+    segments = load_index(path)
+    manifest = load_manifest(path) if not segments else None
+    if manifest is not None:
+        if manifest.get("format") != "ndjson.gz":
+            raise ValueError(f"{path} is a {manifest.get('format')} export; only ndjson.gz exports can be replayed")
+        segments = manifest["chunks"]
+    if not segments:
+        return sorted(p for p in path.iterdir() if p.is_file() and _is_event_file(p))
+    since_ts = _since_ts(from_time)
+    files = []
+    for entry in segments:
+        max_index = entry.get("max_index")
+        if from_index is not None and isinstance(max_index, int) and max_index < from_index:
+            continue
+        max_ts = entry.get("max_timestamp")
+        if since_ts and isinstance(max_ts, str) and 0.0 < parse_ts(max_ts) < since_ts:
+            continue
+        files.append(path / str(entry["file"]))
+    return files
+
+
+def _is_event_file(path: Path) -> bool:
+    name = path.name
+    if name.startswith(".") or name in (INDEX_NAME, MANIFEST_NAME):
+        return False
+    return ".ndjson" in name or name.endswith(".json")
+
+
+def _open_text(path: Path) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    if path.suffix == ".xz":
+        return lzma.open(path, "rt", encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def _read_file(path: Path) -> Iterator[dict[str, Any]]:
+    with _open_text(path) as fh:
+        first = fh.read(1)
+        while first and first.isspace():
+            first = fh.read(1)
+        if first == "[":
+            # A JSON array (``--format json`` output)
+            for event in json.loads(first + fh.read()):
+                if isinstance(event, dict):
+                    yield event
+            return
+        try:
+            for line in itertools.chain([first + fh.readline()], fh):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn last line of a segment that is still being written
+                    continue
+                if isinstance(event, dict):
+                    yield event
+        except EOFError:
+            # Compressed segment cut off mid-stream (still open, or a crash)
+            return
+
+
+def iter_recording(
+    path: Path,
+    *,
+    from_index: int | None = None,
+    from_time: str | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Events of a recording in order, starting at ``from_index``/``from_time``."""
+    since_ts = _since_ts(from_time)
+    for file in recording_files(path, from_index=from_index, from_time=from_time):
+        for event in _read_file(file):
+            if from_index is not None:
+                idx = event_index(event)
+                if idx is not None and idx < from_index:
+                    continue
+            if since_ts:
+                ts = parse_ts(str(event.get("timestamp") or ""))
+                if ts and ts < since_ts:
+                    continue
+            yield event
+
+
+class ReplayGatewayClient:
+    """
+    A read-only ``GatewayClient`` over a recording.
+
+    Snapshot reads (views, projections) see the whole recording. ``tail``
+    plays it from the seek position (``from_index``/``from_time``) paced by
+    the event timestamps: ``speed`` 1.0 is real time, 10.0 ten times faster,
+    and ``None`` (or 0) as fast as possible. ``backlog`` events before the
+    seek position are emitted first without pacing. The stream ends with
+    the recording (``finite``), so ``ResumableTail`` does not reconnect.
+    """
+
+    # The tail stream ends for good once the recording is exhausted
+    finite = True
+
+    def __init__(
+        self,
+        path: Path | str,
+        *,
+        speed: float | None = None,
+        from_index: int | None = None,
+        from_time: str | None = None,
+    ) -> None:
+        self.path = Path(path)
+        # Fail early on a missing recording or a seek time that would be ignored
+        recording_files(self.path)
+        _since_ts(from_time)
+        self.speed = speed or None
+        self.from_index = from_index
+        self.from_time = from_time
+        self.base_url = f"replay:{self.path}"
+        self._loaded: list[dict[str, Any]] | None = None
+
+    def _events(self) -> list[dict[str, Any]]:
+        if self._loaded is None:
+            self._loaded = list(iter_recording(self.path))
+        return self._loaded
+
+    def check_capabilities(self) -> None:
+        pass
+
+    def send_intent(
+        self,
+        envelope: IntentEnvelope,
+        correlation_id: str,
+        *,
+        stream_id: str | None = None,
+        lane: str | None = None,
+    ) -> GatewayAck:
+        raise RuntimeError(f"Cannot send intents to a recording ({self.path})")
+
+    def get_timeline(self, thread_id: str) -> Sequence[TurnSummary]:
+        return self.ledger_index().timeline(thread_id)
+
+    def get_decision(self, thread_id: str, turn_id: str) -> DecisionViewModel | None:
+        return self.ledger_index().decision(thread_id, turn_id)
+
+    def get_audit(self, thread_id: str, turn_id: str | None = None) -> Sequence[AuditEventViewModel]:
+        return self.ledger_index().audit(thread_id, turn_id=turn_id)
+
+    def ledger_index(self, limit: int = 1000) -> LedgerIndex:
+        return LedgerIndex(self.fetch_events(limit=limit))
+
+    def get_status(self) -> dict[str, Any]:
+        indices = [i for i in map(event_index, self._events()) if i is not None]
+        return {"t_index": max(indices, default=-1)}
+
+    def fetch_events(
+        self,
+        limit: int = 1000,
+        *,
+        offset: int | None = None,
+        stream_id: str | None = None,
+        lane: str | None = None,
+    ) -> list[dict[str, Any]]:
+        # Same window semantics as /snapshot: ledger index >= offset, then filters
+        out: list[dict[str, Any]] = []
+        for event in self._events():
+            if offset is not None:
+                idx = event_index(event)
+                if idx is not None and idx < offset:
+                    continue
+            if stream_id is not None and event.get("stream_id") != stream_id:
+                continue
+            if lane is not None and event.get("lane") != lane:
+                continue
+            out.append(dict(event))
+            if len(out) >= limit:
+                break
+        return out
+
+    def fetch_partitions(
+        self,
+        partitions: Sequence[Partition],
+        limit: int = 1000,
+        max_workers: int = 8,
+    ) -> dict[Partition, list[dict[str, Any]]]:
+        return {p: self.fetch_events(limit, stream_id=p.stream_id, lane=p.lane) for p in partitions}
+
+    def tail(
+        self,
+        since: int | None = None,
+        backlog: int | None = None,
+    ) -> Iterable[dict]:
+        if since is not None:
+            # Resuming (or --since): everything after ``since``, no backlog
+            events = iter_recording(self.path, from_index=since + 1)
+            return self._paced(events)
+        events = iter_recording(self.path, from_index=self.from_index, from_time=self.from_time)
+        if backlog and backlog > 0 and (self.from_index is not None or self.from_time is not None):
+            return self._with_backlog(events, backlog)
+        return self._paced(events)
+
+    def _with_backlog(self, events: Iterator[dict[str, Any]], backlog: int) -> Iterator[dict[str, Any]]:
+        first = next(events, None)
+        if first is None:
+            return
+        start = event_index(first)
+        if start is not None:
+            earlier = [e for e in self._events() if (i := event_index(e)) is not None and i < start]
+            yield from earlier[-backlog:]
+        yield from self._paced(itertools.chain([first], events))
+
+    def _paced(self, events: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        speed = self.speed
+        if speed is None:
+            yield from events
+            return
+        origin_ts: float | None = None
+        origin_wall = 0.0
+        for event in events:
+            ts = parse_ts(str(event.get("timestamp") or ""))
+            if ts:
+                if origin_ts is None:
+                    origin_ts, origin_wall = ts, time.monotonic()
+                else:
+                    delay = origin_wall + (ts - origin_ts) / speed - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+            yield event
+
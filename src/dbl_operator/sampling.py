@@ -0,0 +1,51 @@
+"""Deterministic, turn-preserving sampling of gateway events."""
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+__all__ = ["SAMPLE_BY", "Sampler"]
+
+SAMPLE_BY = ("thread", "turn")
+
+_HASH_SPACE = float(1 << 64)
+
+
+class Sampler:
+    """
+    Keep a fixed fraction of threads (or turns), chosen by a stable hash.
+
+    The decision depends only on the ``thread_id``/``turn_id`` of an event,
+    so every event of a sampled thread or turn is kept together and the
+    same ids are selected on every run, host and process. Events without
+    a thread id fall back to their turn id.
+    """
+
+    def __init__(self, rate: float, by: str = "thread") -> None:
+        if not 0.0 < rate <= 1.0:
+            raise ValueError(f"sample rate must be in (0, 1], got {rate}")
+        if by not in SAMPLE_BY:
+            raise ValueError(f"sample key must be one of {', '.join(SAMPLE_BY)}, got {by!r}")
+        self.rate = rate
+        self.by = by
+        self._threshold = rate * _HASH_SPACE
+
+    def key(self, event: dict[str, Any]) -> str:
+        if self.by == "thread":
+            value = event.get("thread_id") or event.get("turn_id")
+        else:
+            value = event.get("turn_id")
+        return str(value or "")
+
+    def keep(self, event: dict[str, Any]) -> bool:
+        if self.rate >= 1.0:
+            return True
+        digest = hashlib.blake2b(self.key(event).encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "big") < self._threshold
+
+    def scale(self, count: float) -> int:
+        """Estimate the unsampled total from a count over sampled events."""
+        return int(round(count / self.rate))
+
+    def describe(self) -> str:
+        return f"Sampled: {self.rate * 100:g}% of {self.by}s (counts scaled x{1 / self.rate:.4g})"
@@ -1,7 +1,7 @@
 """Color-coded output renderer for tail command."""
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .ansi_colors import (
     ColorMode,
@@ -14,7 +14,25 @@ from .ansi_colors import (
     style,
 )
 
-__all__ = ["render_tail_line", "render_tail_details"]
+if TYPE_CHECKING:
+    from .tail_aggregate import IntervalSummary
+
+__all__ = ["render_tail_line", "render_tail_details", "render_tail_summary", "tail_record"]
+
+# Columns of ``tail --format csv``
+TAIL_COLUMNS = (
+    "index",
+    "timestamp",
+    "kind",
+    "result",
+    "thread_id",
+    "turn_id",
+    "correlation_id",
+    "intent_type",
+    "stream_id",
+    "lane",
+    "origin",
+)
 
 
 def _event_color(event: dict[str, Any]) -> tuple[int | None, bool, bool]:
@@ -74,9 +92,20 @@ def render_tail_line(event: dict[str, Any], mode: ColorMode) -> str:
             kind = f"DECISION/{result}"
 
     base = f"{idx:>6}  {kind:<15}  t={thread_id}  turn={turn_id}  c={corr}"
+
+    # Fan-in streams carry the source gateway; single-gateway output is unchanged
+    origin = event.get("origin")
+    if origin:
+        base = f"{_origin_label(str(origin)):<21}  {base}"
     return style(base, mode=mode, fg=fg, bold=bold, dim=dim)
 
 
+def _origin_label(origin: str) -> str:
+    """Reduce a base URL to host[:port] for the tail prefix."""
+    label = origin.split("://", 1)[-1]
+    return label.split("/", 1)[0]
+
+
 def _short_digest(digest: str | None, length: int = 16) -> str:
     """Shorten a digest, stripping 'sha256:' prefix."""
     if not digest:
@@ -125,3 +154,38 @@ def render_tail_details(event: dict[str, Any], mode: ColorMode) -> list[str]:
         out.append("       " + style(f"context: {short}...", mode=mode, fg=FG_GRAY, dim=True))
 
     return out
+
+
+def tail_record(event: dict[str, Any]) -> dict[str, Any]:
+    """Flat, fixed-column view of an event for CSV output."""
+    payload = event.get("payload") if isinstance(event.get("payload"), dict) else {}
+    record = {column: event.get(column) for column in TAIL_COLUMNS}
+    if str(event.get("kind", "")).upper() == "DECISION":
+        record["result"] = str(payload.get("result", payload.get("decision", ""))).upper() or None
+    return record
+
+
+def render_tail_summary(summary: "IntervalSummary", mode: ColorMode, top: int = 3) -> str:
+    """
+    Render one ``tail --aggregate`` interval as a single line.
+
+    Shows the event count and rate, counts per kind, ALLOW/DENY and the
+    busiest threads and most frequent reason codes of the interval.
+    """
+    parts = [
+        style(f"[{summary.seconds:.1f}s] {summary.count} events ({summary.rate:.0f}/s)", mode=mode, bold=True),
+        "  ".join(f"{kind} {n}" for kind, n in sorted(summary.kinds.items())),
+    ]
+    if summary.allow or summary.deny:
+        parts.append(
+            style(f"ALLOW {summary.allow}", mode=mode, fg=FG_GREEN)
+            + "  "
+            + style(f"DENY {summary.deny}", mode=mode, fg=FG_RED, bold=bool(summary.deny))
+        )
+    threads = summary.threads.top(top)
+    if threads:
+        parts.append("threads: " + ", ".join(f"{str(h.item)[:12]} {h.count}" for h in threads))
+    reasons = summary.reasons.top(top)
+    if reasons:
+        parts.append(style("reasons: " + ", ".join(f"{h.item} {h.count}" for h in reasons), mode=mode, fg=FG_GRAY))
+    return "  |  ".join(parts)
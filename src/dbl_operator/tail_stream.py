@@ -0,0 +1,456 @@
+"""Resumable consumption of the gateway ``/tail`` stream."""
+from __future__ import annotations
+
+import queue
+import random
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator
+
+import httpx
+
+from .domain_types import event_index
+from .gateway_client import GatewayClient
+from .profiler import get_profiler
+
+__all__ = [
+    "OVERFLOW_POLICIES",
+    "BackfillingTail",
+    "BufferedTail",
+    "DropSummary",
+    "ResumableTail",
+    "TailStalled",
+    "event_index",
+    "install_stop_handlers",
+]
+
+# Errors after which the subscription is re-opened from the last seen index
+RECONNECT_ERRORS: tuple[type[BaseException], ...] = (ConnectionError, OSError, httpx.HTTPError)
+
+_POLL_SECS = 0.25
+
+# What BufferedTail does with an event that finds the buffer full
+OVERFLOW_POLICIES = ("block", "drop-oldest", "summarize")
+# Wakes the consumer when a backfill finishes
+_WAKE = object()
+_END = object()
+
+
+def install_stop_handlers(stop_event: threading.Event) -> None:
+    """Set ``stop_event`` on SIGINT/SIGTERM (and SIGBREAK on Windows)."""
+    import signal
+
+    def handle_signal(signum: int, frame: object) -> None:
+        stop_event.set()
+
+    # Register signal handlers (wrapped for embedded environments)
+    try:
+        signal.signal(signal.SIGINT, handle_signal)
+        signal.signal(signal.SIGTERM, handle_signal)
+        if hasattr(signal, "SIGBREAK"):  # Windows-specific
+            signal.signal(signal.SIGBREAK, handle_signal)  # type: ignore[attr-defined]
+    except (ValueError, OSError):
+        # Signal handling not available in this environment
+        pass
+
+
+class TailStalled(ConnectionError):
+    """The subscription delivered neither data nor a heartbeat within the read deadline."""
+
+
+class ResumableTail:
+    """
+    Iterate ``client.tail`` across disconnects.
+
+    The last seen index is tracked and used as ``since`` when the
+    subscription is re-opened, with jittered exponential backoff between
+    attempts that resets as soon as an event arrives. A stalled subscription
+    (``TailStalled``) is re-opened immediately. ``on_reconnect`` receives the
+    outage duration when the first event after a disconnect arrives.
+    Iteration ends once ``stop_event`` is set, or when the stream of a
+    ``finite`` client (a recording) closes.
+    """
+
+    def __init__(
+        self,
+        client: GatewayClient,
+        *,
+        since: int | None = None,
+        backlog: int | None = None,
+        stop_event: threading.Event | None = None,
+        on_disconnect: Callable[[BaseException, float], None] | None = None,
+        on_reconnect: Callable[[float], None] | None = None,
+        initial_delay: float = 0.5,
+        max_delay: float = 30.0,
+        jitter: float = 0.5,
+    ) -> None:
+        self.client = client
+        self.last_index = since
+        self.backlog = backlog
+        self.stop_event = stop_event or threading.Event()
+        self.on_disconnect = on_disconnect
+        self.on_reconnect = on_reconnect
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        # Fraction of each delay that is randomized, so clients that lost the
+        # same gateway do not reconnect in lockstep
+        self.jitter = jitter
+        self.reconnects = 0
+        self.stalls = 0
+
+    def _jittered(self, delay: float) -> float:
+        return delay * (1.0 - self.jitter * random.random())
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        stop_event = self.stop_event
+        delay = self.initial_delay
+        down_since: float | None = None
+        while not stop_event.is_set():
+            received = False
+            try:
+                for event in self.client.tail(since=self.last_index, backlog=self.backlog):
+                    if stop_event.is_set():
+                        return
+                    idx = event_index(event)
+                    if idx is not None:
+                        self.last_index = idx
+                    # Reset reconnect delay on successful event
+                    delay = self.initial_delay
+                    received = True
+                    if down_since is not None:
+                        if self.on_reconnect is not None:
+                            self.on_reconnect(time.monotonic() - down_since)
+                        down_since = None
+                    yield event
+                # A recording (replay) has nothing more to deliver
+                if getattr(self.client, "finite", False):
+                    return
+                # Stream closed cleanly; back off if it carried nothing so a
+                # gateway that keeps closing immediately is not hammered
+                if not received:
+                    if stop_event.wait(timeout=self._jittered(delay)):
+                        return
+                    delay = min(delay * 2, self.max_delay)
+            except TailStalled as exc:
+                if stop_event.is_set():
+                    return
+                # Half-open connection: nothing to wait for, re-open right away
+                self.stalls += 1
+                self.reconnects += 1
+                if down_since is None:
+                    down_since = time.monotonic()
+                if self.on_disconnect is not None:
+                    self.on_disconnect(exc, 0.0)
+            except RECONNECT_ERRORS as exc:
+                if stop_event.is_set():
+                    return
+                if down_since is None:
+                    down_since = time.monotonic()
+                wait = self._jittered(delay)
+                if self.on_disconnect is not None:
+                    self.on_disconnect(exc, wait)
+                # Use wait with timeout so we can check stop_event
+                if stop_event.wait(timeout=wait):
+                    return
+                delay = min(delay * 2, self.max_delay)
+                self.reconnects += 1
+
+
+class BackfillingTail:
+    """
+    Repair index discontinuities in a live stream from ``/snapshot``.
+
+    ``events`` (usually a ``ResumableTail``) is read on a background thread.
+    When an event's index jumps past ``last + 1`` the missing range is
+    fetched on a small pool while reading continues; events behind a
+    pending backfill are held back and released, with the backfilled events
+    spliced in front of them, as soon as it completes. Re-delivered or
+    already backfilled indices are dropped. Events tagged with an ``origin``
+    (fan-in) are tracked per source and backfilled from ``source_of(origin)``.
+
+    ``gaps_detected``, ``gaps_repaired`` and ``events_backfilled`` count the
+    outcome; a gap larger than ``max_gap`` is counted but not fetched.
+    """
+
+    def __init__(
+        self,
+        events: Iterable[dict[str, Any]],
+        client: GatewayClient,
+        *,
+        stop_event: threading.Event | None = None,
+        max_gap: int = 10_000,
+        workers: int = 4,
+        source_of: Callable[[str], GatewayClient] | None = None,
+    ) -> None:
+        self.events = events
+        self.client = client
+        self.source_of = source_of
+        self.stop_event = stop_event or threading.Event()
+        self.max_gap = max_gap
+        self.workers = workers
+        self.gaps_detected = 0
+        self.gaps_repaired = 0
+        self.events_backfilled = 0
+        self._last: dict[Any, int] = {}
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        inbox: queue.Queue[Any] = queue.Queue(maxsize=10_000)
+        stop = self.stop_event
+        reader = threading.Thread(target=self._read, args=(inbox,), name="tail-backfill-reader", daemon=True)
+        reader.start()
+        # Events in arrival order, each behind the backfill of the gap before it
+        held: deque[tuple[Future[tuple[list[dict[str, Any]], bool]] | None, dict[str, Any]]] = deque()
+        pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="tail-backfill")
+        try:
+            while not stop.is_set():
+                try:
+                    item = inbox.get(timeout=_POLL_SECS)
+                except queue.Empty:
+                    continue
+                if item is _END:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                if item is not _WAKE:
+                    pending = self._admit(item, pool, inbox)
+                    if pending is not None:
+                        held.append(pending)
+                yield from self._release(held)
+            # Stream ended: whatever is still waiting is released in order
+            while held and not stop.is_set():
+                future, event = held.popleft()
+                if future is not None:
+                    yield from self._spliced(future)
+                yield event
+        finally:
+            stop.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _read(self, inbox: queue.Queue) -> None:
+        try:
+            for event in self.events:
+                if not self._put(inbox, event):
+                    return
+        except BaseException as exc:
+            self._put(inbox, exc)
+            return
+        self._put(inbox, _END)
+
+    def _put(self, inbox: queue.Queue, item: Any) -> bool:
+        while not self.stop_event.is_set():
+            try:
+                inbox.put(item, timeout=_POLL_SECS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _admit(
+        self,
+        event: dict[str, Any],
+        pool: ThreadPoolExecutor,
+        inbox: queue.Queue,
+    ) -> tuple[Future[tuple[list[dict[str, Any]], bool]] | None, dict[str, Any]] | None:
+        """Queue ``event`` behind a backfill if it opens a gap; None drops it."""
+        idx = event_index(event)
+        if idx is None:
+            return None, event
+        origin = event.get("origin")
+        last = self._last.get(origin)
+        if last is not None and idx <= last:
+            return None
+        self._last[origin] = idx
+        if last is None or idx == last + 1:
+            return None, event
+        self.gaps_detected += 1
+        if idx - last - 1 > self.max_gap:
+            return None, event
+        future = pool.submit(self._fetch_gap, origin, last, idx)
+        future.add_done_callback(lambda _: self._put(inbox, _WAKE))
+        return future, event
+
+    def _fetch_gap(self, origin: Any, last: int, idx: int) -> tuple[list[dict[str, Any]], bool]:
+        source = self.client
+        if origin is not None and self.source_of is not None:
+            source = self.source_of(origin)
+        with get_profiler().stage("tail.backfill") as span:
+            fetched = source.fetch_events(limit=idx - last - 1, offset=last + 1)
+            span.events = len(fetched)
+        missing = {}
+        for event in fetched:
+            i = event_index(event)
+            if i is not None and last < i < idx:
+                missing[i] = event if origin is None else {**event, "origin": origin}
+        return [missing[i] for i in sorted(missing)], len(missing) == idx - last - 1
+
+    def _release(self, held: deque) -> Iterator[dict[str, Any]]:
+        while held:
+            future, event = held[0]
+            if future is not None and not future.done():
+                return
+            held.popleft()
+            if future is not None:
+                yield from self._spliced(future)
+            yield event
+
+    def _spliced(self, future: Future[tuple[list[dict[str, Any]], bool]]) -> list[dict[str, Any]]:
+        try:
+            events, complete = future.result()
+        except Exception:
+            # A failed backfill leaves the gap open; the live stream goes on
+            return []
+        self.events_backfilled += len(events)
+        self.gaps_repaired += complete
+        return events
+
+
+class DropSummary:
+    """A run of consecutive events that did not fit the buffer, emitted in their place."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.kinds: Counter[str] = Counter()
+        self.first_index: int | None = None
+        self.last_index: int | None = None
+
+    def add(self, event: dict[str, Any]) -> None:
+        self.count += 1
+        self.kinds[str(event.get("kind") or "UNKNOWN")] += 1
+        idx = event_index(event)
+        if idx is not None:
+            if self.first_index is None:
+                self.first_index = idx
+            self.last_index = idx
+
+    def describe(self) -> str:
+        kinds = ", ".join(f"{kind} {n}" for kind, n in sorted(self.kinds.items()))
+        span = ""
+        if self.first_index is not None:
+            span = f", index {self.first_index}..{self.last_index}"
+        return f"{self.count} events skipped ({kinds}){span}"
+
+
+class BufferedTail:
+    """
+    Decouple reading the stream from consuming it.
+
+    ``events`` is read on a background thread into a buffer of at most
+    ``capacity`` events, so a slow consumer (a terminal, a pipe into
+    ``less``) does not stall the socket until the buffer is full. What
+    happens then is the ``policy``:
+
+    - ``block``: the reader waits for room (backpressure reaches the gateway)
+    - ``drop-oldest``: the oldest buffered event is discarded
+    - ``summarize``: events that do not fit are folded into one
+      ``DropSummary`` that is yielded in their place once there is room
+
+    ``dropped`` and ``summarized`` count discarded events; ``max_depth`` is
+    the deepest the buffer got. With ``heartbeat_secs`` the consumer gets
+    ``None`` whenever nothing arrived for that long, so it can do periodic
+    work on a quiet stream.
+    """
+
+    def __init__(
+        self,
+        events: Iterable[dict[str, Any]],
+        *,
+        capacity: int = 10_000,
+        policy: str = "block",
+        stop_event: threading.Event | None = None,
+        heartbeat_secs: float | None = None,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow policy must be one of {', '.join(OVERFLOW_POLICIES)}, got {policy!r}")
+        self.events = events
+        self.capacity = capacity
+        self.policy = policy
+        self.stop_event = stop_event or threading.Event()
+        self.heartbeat_secs = heartbeat_secs
+        self.dropped = 0
+        self.summarized = 0
+        self.max_depth = 0
+        self._buffer: deque[Any] = deque()
+        self._summary: DropSummary | None = None
+        self._cond = threading.Condition()
+        self._done = False
+        self._error: BaseException | None = None
+
+    def __iter__(self) -> Iterator[dict[str, Any] | DropSummary | None]:
+        reader = threading.Thread(target=self._read, name="tail-reader", daemon=True)
+        reader.start()
+        stop = self.stop_event
+        cond = self._cond
+        heartbeat = self.heartbeat_secs
+        try:
+            while True:
+                idle = False
+                with cond:
+                    deadline = None if heartbeat is None else time.monotonic() + heartbeat
+                    while not self._buffer and self._summary is None and not self._done:
+                        if stop.is_set():
+                            return
+                        wait = _POLL_SECS
+                        if deadline is not None:
+                            wait = min(wait, deadline - time.monotonic())
+                            if wait <= 0:
+                                idle = True
+                                break
+                        cond.wait(timeout=wait)
+                    if idle:
+                        item = None
+                    elif self._buffer:
+                        item = self._buffer.popleft()
+                    elif self._summary is not None:
+                        item, self._summary = self._summary, None
+                    elif self._error is not None:
+                        raise self._error
+                    else:
+                        return
+                    cond.notify_all()
+                yield item
+        finally:
+            stop.set()
+            with cond:
+                cond.notify_all()
+
+    def _read(self) -> None:
+        try:
+            for event in self.events:
+                if not self._offer(event):
+                    return
+        except BaseException as exc:
+            self._error = exc
+        with self._cond:
+            self._done = True
+            self._cond.notify_all()
+
+    def _offer(self, event: dict[str, Any]) -> bool:
+        buffer = self._buffer
+        with self._cond:
+            if self._summary is not None and len(buffer) < self.capacity:
+                # Room again: the skipped run goes out before anything newer
+                buffer.append(self._summary)
+                self._summary = None
+            if len(buffer) >= self.capacity:
+                if self.policy == "block":
+                    while len(buffer) >= self.capacity:
+                        if self.stop_event.is_set():
+                            return False
+                        self._cond.wait(timeout=_POLL_SECS)
+                elif self.policy == "drop-oldest":
+                    buffer.popleft()
+                    self.dropped += 1
+                else:
+                    if self._summary is None:
+                        self._summary = DropSummary()
+                    self._summary.add(event)
+                    self.summarized += 1
+                    return not self.stop_event.is_set()
+            buffer.append(event)
+            self.max_depth = max(self.max_depth, len(buffer))
+            self._cond.notify_all()
+        return not self.stop_event.is_set()
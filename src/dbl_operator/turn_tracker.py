@@ -0,0 +1,149 @@
+"""Bounded, incremental per-turn state for live views over the tail stream."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+from .projections.latency import parse_ts
+
+__all__ = ["TurnObservation", "TurnTracker"]
+
+
+class TurnObservation(NamedTuple):
+    """What a single event changed about its turn."""
+
+    kind: str
+    decision: str | None
+    intent_to_decision_ms: float | None
+    decision_to_execution_ms: float | None
+    violation: str | None
+
+
+class _LiveTurn:
+    __slots__ = ("first_ts", "intended", "intent_ts", "decision_ts", "decision", "executed", "orphaned")
+
+    def __init__(self, first_ts: float) -> None:
+        self.first_ts = first_ts
+        self.intended = False
+        # None when the event carried no usable timestamp
+        self.intent_ts: float | None = None
+        self.decision_ts: float | None = None
+        self.decision: str | None = None
+        self.executed = False
+        self.orphaned = False
+
+    @property
+    def complete(self) -> bool:
+        return self.executed or self.decision == "DENY"
+
+
+class TurnTracker:
+    """
+    Follow turns as their INTENT/DECISION/EXECUTION events arrive.
+
+    Mirrors the rules of ``IntegrityProjection`` but keeps at most
+    ``max_turns`` turns (oldest evicted first), so it can run for the
+    lifetime of a live subscription. Incomplete turns older than
+    ``orphan_after_secs`` (by event time) are counted as orphaned until
+    they complete or are evicted. All updates are amortized O(1).
+
+    Only event timestamps are used: an event without a readable one is
+    tracked as usual but yields no latency sample, and a turn it opens
+    ages from the newest event time seen so far.
+    """
+
+    def __init__(self, *, orphan_after_secs: float = 300.0, max_turns: int = 100_000) -> None:
+        self.orphan_after_secs = orphan_after_secs
+        self.max_turns = max_turns
+        self._turns: OrderedDict[str, _LiveTurn] = OrderedDict()
+        # Open turns not yet orphaned, in first-seen order
+        self._pending: OrderedDict[str, _LiveTurn] = OrderedDict()
+        self.orphaned_open = 0
+        self.orphaned_total = 0
+        self.evicted_open = 0
+        self.clock = 0.0
+
+    @property
+    def open_turns(self) -> int:
+        return len(self._pending) + self.orphaned_open
+
+    def observe(self, event: dict[str, Any]) -> TurnObservation:
+        kind = str(event.get("kind", "")).upper()
+        ts = parse_ts(str(event.get("timestamp", ""))) or None
+        if ts is not None:
+            self.clock = max(self.clock, ts)
+
+        turn_id = event.get("turn_id")
+        if not turn_id or kind not in ("INTENT", "DECISION", "EXECUTION"):
+            self.sweep()
+            return TurnObservation(kind, None, None, None, None)
+
+        turn = self._turns.get(turn_id)
+        if turn is None:
+            turn = self._admit(str(turn_id), self.clock if ts is None else ts)
+        was_complete = turn.complete
+
+        decision: str | None = None
+        policy_ms: float | None = None
+        exec_ms: float | None = None
+        violation: str | None = None
+
+        if kind == "INTENT":
+            turn.intended = True
+            turn.intent_ts = ts
+        elif kind == "DECISION":
+            payload = event.get("payload") if isinstance(event.get("payload"), dict) else {}
+            decision = str(payload.get("decision") or payload.get("result") or "UNKNOWN").upper()
+            turn.decision = decision
+            turn.decision_ts = ts
+            if not turn.intended:
+                violation = "decision_without_intent"
+            elif ts is not None and turn.intent_ts is not None:
+                policy_ms = (ts - turn.intent_ts) * 1000.0
+        else:
+            if turn.decision is None:
+                violation = "execution_without_decision"
+            elif turn.decision == "DENY":
+                violation = "execution_after_deny"
+            if ts is not None and turn.decision_ts is not None:
+                exec_ms = (ts - turn.decision_ts) * 1000.0
+            turn.executed = True
+
+        if turn.complete and not was_complete:
+            self._close(str(turn_id), turn)
+        self.sweep()
+        return TurnObservation(kind, decision, policy_ms, exec_ms, violation)
+
+    def sweep(self) -> None:
+        """Mark open turns older than the orphan threshold as orphaned."""
+        cutoff = self.clock - self.orphan_after_secs
+        pending = self._pending
+        while pending:
+            turn_id, turn = next(iter(pending.items()))
+            if turn.first_ts > cutoff:
+                break
+            del pending[turn_id]
+            turn.orphaned = True
+            self.orphaned_open += 1
+            self.orphaned_total += 1
+
+    def _admit(self, turn_id: str, ts: float) -> _LiveTurn:
+        while len(self._turns) >= self.max_turns:
+            old_id, old = self._turns.popitem(last=False)
+            if not old.complete:
+                self.evicted_open += 1
+                if old.orphaned:
+                    self.orphaned_open -= 1
+                else:
+                    self._pending.pop(old_id, None)
+        turn = _LiveTurn(ts)
+        self._turns[turn_id] = turn
+        self._pending[turn_id] = turn
+        return turn
+
+    def _close(self, turn_id: str, turn: _LiveTurn) -> None:
+        if turn.orphaned:
+            turn.orphaned = False
+            self.orphaned_open -= 1
+        else:
+            self._pending.pop(turn_id, None)
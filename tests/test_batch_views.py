@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import argparse
+import json
+from unittest.mock import patch
+
+from dbl_operator.commands.views import decision_view, thread_view
+from dbl_operator.http_gateway_client import HttpGatewayClient
+from dbl_operator.ledger_index import LedgerIndex
+
+EVENTS = [
+    {"index": 1, "thread_id": "a", "turn_id": "1", "kind": "INTENT", "payload": {"context_digest": "c1"}},
+    {"index": 2, "thread_id": "b", "turn_id": "9", "kind": "INTENT", "payload": {}},
+    {"index": 3, "thread_id": "a", "turn_id": "1", "kind": "DECISION", "digest": "d1",
+     "payload": {"decision": "DENY", "policy_id": "p", "policy_version": "2", "reason_codes": ["quota"]}},
+    {"index": 4, "thread_id": "a", "turn_id": "2", "kind": "INTENT", "parent_turn_id": "1", "payload": {}},
+]
+
+
+def test_ledger_index_answers_views() -> None:
+    index = LedgerIndex(EVENTS)
+    timeline = index.timeline("a")
+    assert [t.turn_id for t in timeline] == ["1", "2"]
+    assert (timeline[0].context_digest, timeline[0].decision_digest) == ("c1", "d1")
+    assert timeline[1].parent_turn_id == "1"
+    decision = index.decision("a", "1")
+    assert decision is not None and decision.result == "DENY" and list(decision.reasons) == ["quota"]
+    assert index.decision("a", "2") is None
+    assert [e.event_kind for e in index.audit("a")] == ["INTENT", "DECISION", "INTENT"]
+    assert index.timeline("missing") == []
+
+
+def test_timeline_orders_turns_with_mixed_index_types() -> None:
+    events = [
+        {"index": 5, "thread_id": "a", "turn_id": "late", "kind": "INTENT", "payload": {}},
+        {"index": "3", "thread_id": "a", "turn_id": "middle", "kind": "INTENT", "payload": {}},
+        {"thread_id": "a", "turn_id": "unindexed", "kind": "INTENT", "payload": {}},
+    ]
+    assert [t.turn_id for t in LedgerIndex(events).timeline("a")] == ["unindexed", "middle", "late"]
+
+
+def _client_counting_fetches():
+    client = HttpGatewayClient(base_url="http://localhost:8010")
+    return client, patch.object(client, "fetch_events", return_value=EVENTS)
+
+
+def test_batch_thread_view_uses_one_fetch(capsys) -> None:
+    client, fetch = _client_counting_fetches()
+    with fetch as mock_fetch:
+        thread_view(client, argparse.Namespace(thread_id=["a", "b"], ids_file=None, format="text"))
+    assert mock_fetch.call_count == 1
+    out = capsys.readouterr().out
+    assert "Thread: a" in out and "Thread: b" in out and "turn_id=9" in out
+
+
+def test_batch_decision_view_from_ids_file(tmp_path, capsys) -> None:
+    ids = tmp_path / "turns.txt"
+    ids.write_text("# incident 42\na 1\na,2\nb 9\n", encoding="utf-8")
+    client, fetch = _client_counting_fetches()
+    with fetch as mock_fetch:
+        decision_view(client, argparse.Namespace(thread_id=None, turn_id=None, ids_file=str(ids), format="ndjson"))
+    assert mock_fetch.call_count == 1
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(r["thread_id"], r["turn_id"], r["result"]) for r in records] == [
+        ("a", "1", "DENY"),
+        ("a", "2", None),
+        ("b", "9", None),
+    ]
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+from unittest.mock import patch
+
+from dbl_operator.capabilities_cache import CapabilitiesCache, cache_key
+from dbl_operator.http_gateway_client import HttpGatewayClient
+
+CAPS = {"interface_version": 2, "surfaces": ["snapshot", "ingress_intent", "capabilities", "tail"]}
+
+
+def test_cache_key_fingerprints_token() -> None:
+    key = cache_key("http://gw:8010/", "secret-token")
+    assert key.startswith("http://gw:8010#")
+    assert "secret-token" not in key
+    assert key != cache_key("http://gw:8010", "other-token")
+    assert cache_key("http://gw:8010", None) == "http://gw:8010#anonymous"
+
+
+def test_warm_admission_skips_round_trip(tmp_path) -> None:
+    cache = CapabilitiesCache(tmp_path / "caps.json", ttl_secs=60)
+    client = HttpGatewayClient(base_url="http://localhost:8010", token="t", capabilities_cache=cache)
+    with patch.object(httpx.Client, "get") as mock_get:
+        mock_get.return_value.json.return_value = CAPS
+        client.check_capabilities()
+        client.check_capabilities()
+        assert mock_get.call_count == 1
+
+    # A second process with the same identity is warm as well
+    other = HttpGatewayClient(base_url="http://localhost:8010", token="t", capabilities_cache=cache)
+    with patch.object(httpx.Client, "get") as mock_get:
+        other.check_capabilities()
+        mock_get.assert_not_called()
+
+
+def test_expired_entry_is_refetched(tmp_path) -> None:
+    cache = CapabilitiesCache(tmp_path / "caps.json", ttl_secs=60)
+    cache.put(cache_key("http://localhost:8010", None), CAPS)
+    with patch("dbl_operator.capabilities_cache.time.time", return_value=10**12):
+        assert cache.get(cache_key("http://localhost:8010", None)) is None
+
+
+def test_cached_entry_is_still_validated(tmp_path) -> None:
+    cache = CapabilitiesCache(tmp_path / "caps.json", ttl_secs=60)
+    key = cache_key("http://localhost:8010", None)
+    cache.put(key, {"interface_version": 1, "surfaces": CAPS["surfaces"]})
+    client = HttpGatewayClient(base_url="http://localhost:8010", capabilities_cache=cache)
+    with patch.object(httpx.Client, "get") as mock_get:
+        mock_get.return_value.json.return_value = {"interface_version": 1, "surfaces": []}
+        with pytest.raises(RuntimeError, match="Gateway interface mismatch"):
+            client.check_capabilities()
+    assert cache.get(key) is None
+
+
+def test_interface_shaped_failure_invalidates_cache(tmp_path) -> None:
+    cache = CapabilitiesCache(tmp_path / "caps.json", ttl_secs=60)
+    key = cache_key("http://localhost:8010", None)
+    cache.put(key, CAPS)
+    client = HttpGatewayClient(base_url="http://localhost:8010", capabilities_cache=cache)
+    request = httpx.Request("GET", "http://localhost:8010/snapshot")
+    response = httpx.Response(404, request=request)
+    with patch.object(httpx.Client, "get", return_value=response):
+        with pytest.raises(httpx.HTTPStatusError):
+            client.fetch_events()
+    assert cache.get(key) is None
+
+
+def test_transient_failure_keeps_cache(tmp_path) -> None:
+    cache = CapabilitiesCache(tmp_path / "caps.json", ttl_secs=60)
+    key = cache_key("http://localhost:8010", None)
+    cache.put(key, CAPS)
+    client = HttpGatewayClient(base_url="http://localhost:8010", capabilities_cache=cache)
+    request = httpx.Request("GET", "http://localhost:8010/snapshot")
+    response = httpx.Response(503, request=request)
+    with patch.object(httpx.Client, "get", return_value=response):
+        with pytest.raises(httpx.HTTPStatusError):
+            client.fetch_events()
+    assert cache.get(key) == CAPS
+
+
+def test_zero_ttl_disables_cache(tmp_path) -> None:
+    cache = CapabilitiesCache(tmp_path / "caps.json", ttl_secs=0)
+    cache.put("k", CAPS)
+    assert cache.get("k") is None
+    assert not (tmp_path / "caps.json").exists()
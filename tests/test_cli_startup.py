@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+from dbl_operator.app_cli import COMMANDS, _resolve_command
+
+
+def test_cli_import_defers_subcommand_modules() -> None:
+    code = (
+        "import sys, dbl_operator.app_cli\n"
+        "print('\\n'.join(sorted(sys.modules)))\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    loaded = set(proc.stdout.split())
+    assert "httpx" not in loaded
+    assert "dbl_operator.http_gateway_client" not in loaded
+    assert not any(name.startswith("dbl_operator.projections") for name in loaded)
+    assert not any(name.startswith("dbl_operator.commands.") for name in loaded)
+
+
+def test_every_registered_command_resolves() -> None:
+    for name in COMMANDS:
+        assert callable(_resolve_command(name))
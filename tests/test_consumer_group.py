@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import json
+import multiprocessing
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from dbl_operator.consumer_group import ConsumerGroup, GroupTail, assign
+from dbl_operator.recorder import SegmentRecorder
+from dbl_operator.replay import ReplayGatewayClient
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _events(count: int) -> list[dict]:
+    return [{"index": i, "kind": "INTENT", "thread_id": f"t-{i % 7}", "turn_id": f"turn-{i}"} for i in range(count)]
+
+
+def _recording(directory: Path, events: list[dict]) -> ReplayGatewayClient:
+    recorder = SegmentRecorder(directory)
+    for event in events:
+        recorder.record(event)
+    recorder.close()
+    return ReplayGatewayClient(directory)
+
+
+def test_rendezvous_assignment_moves_only_the_leavers_partitions() -> None:
+    before = assign(["a", "b", "c"], 32)
+    after = assign(["a", "b"], 32)
+    assert set(before.values()) == {"a", "b", "c"}
+    assert all(after[p] == owner for p, owner in before.items() if owner != "c")
+    assert assign([], 4) == {}
+
+
+def test_members_split_partitions_and_rebalance_when_one_dies(tmp_path: Path) -> None:
+    clock = _Clock()
+    a = ConsumerGroup(tmp_path, partitions=8, member_id="a", lease_secs=10, clock=clock)
+    b = ConsumerGroup(tmp_path, partitions=8, member_id="b", lease_secs=10, clock=clock)
+    a.join(heartbeat=False)
+    b.join(heartbeat=False)
+    a.refresh()
+    assert a.owned and b.owned
+    assert a.owned | b.owned == set(range(8)) and not a.owned & b.owned
+
+    # b stops renewing its lease; once it expires a takes everything over
+    clock.now += 5
+    a.refresh()
+    assert a.owned != set(range(8))
+    clock.now += 6
+    a.refresh()
+    assert a.owned == set(range(8)) and a.members == ["a"]
+    assert a.rebalances == 2
+    assert not (tmp_path / "members" / "b.json").exists()
+    a.leave()
+
+
+def test_leaving_hands_partitions_over_at_once(tmp_path: Path) -> None:
+    a = ConsumerGroup(tmp_path, partitions=4, member_id="a")
+    b = ConsumerGroup(tmp_path, partitions=4, member_id="b")
+    a.join(heartbeat=False)
+    b.join(heartbeat=False)
+    b.leave()
+    a.refresh()
+    assert a.owned == set(range(4))
+    a.leave()
+
+
+def test_unreadable_leases_count_as_expired(tmp_path: Path) -> None:
+    a = ConsumerGroup(tmp_path, partitions=4, member_id="a")
+    for name, expires in (("b", "soon"), ("c", None), ("d", float("nan"))):
+        (tmp_path / "members" / f"{name}.json").write_text(json.dumps({"member": name, "expires": expires}))
+    (tmp_path / "members" / "e.json").write_text(json.dumps({"member": "e"}))
+    a.join(heartbeat=False)
+    assert a.members == ["a"] and a.owned == set(range(4))
+    assert [p.stem for p in (tmp_path / "members").glob("*.json")] == ["a"]
+    a.leave()
+
+
+def test_heartbeat_records_unexpected_errors(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    group = ConsumerGroup(tmp_path, partitions=4, member_id="a", lease_secs=0.03)
+
+    def broken() -> None:
+        raise ValueError("bad lease")
+
+    group.join()
+    monkeypatch.setattr(group, "refresh", broken)
+    deadline = time.monotonic() + 5
+    while group.error is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert isinstance(group.error, ValueError)
+    # The heartbeat thread keeps running
+    assert group._thread is not None and group._thread.is_alive()
+    group.leave()
+
+
+def test_partition_count_is_fixed_per_group(tmp_path: Path) -> None:
+    ConsumerGroup(tmp_path, partitions=4)
+    with pytest.raises(ValueError):
+        ConsumerGroup(tmp_path, partitions=8)
+
+
+def test_members_together_see_every_event_once(tmp_path: Path) -> None:
+    events = _events(60)
+    client = _recording(tmp_path / "rec", events)
+    a = ConsumerGroup(tmp_path / "group", partitions=8, member_id="a")
+    b = ConsumerGroup(tmp_path / "group", partitions=8, member_id="b")
+    a.join(heartbeat=False)
+    b.join(heartbeat=False)
+    a.refresh()
+    seen_a = [e["index"] for e in GroupTail(iter(events), a, client)]
+    seen_b = [e["index"] for e in GroupTail(iter(events), b, client)]
+    assert seen_a and seen_b
+    assert sorted(seen_a + seen_b) == list(range(60))
+
+
+def test_takeover_resumes_from_the_partition_cursor(tmp_path: Path) -> None:
+    events = _events(60)
+    client = _recording(tmp_path / "rec", events)
+    group_dir = tmp_path / "group"
+    a = ConsumerGroup(group_dir, partitions=8, member_id="a", checkpoint_events=1000, checkpoint_secs=1000)
+    b = ConsumerGroup(group_dir, partitions=8, member_id="b", checkpoint_events=1000, checkpoint_secs=1000)
+    a.join(heartbeat=False)
+    b.join(heartbeat=False)
+    a.refresh()
+    b_owned = b.owned
+
+    # b processes the first 20 events of its partitions, then leaves
+    for event in GroupTail(iter(events[:20]), b, client):
+        b.advance(event)
+    b.leave()
+
+    tail = GroupTail(iter(events[20:]), a, client)
+    out = []
+    for event in tail:
+        out.append(event)
+        a.advance(event)
+        if len(out) == 5:
+            # a notices the departure while it is at some index > 20
+            a.refresh()
+    assert a.owned == set(range(8))
+    mine = {e["index"] for e in out}
+    # Events of b's partitions between its cursor and the takeover are fetched
+    missed = {e["index"] for e in events[20:] if a.partition_of(e) in b_owned}
+    assert missed <= mine
+    assert tail.caught_up > 0
+    assert len(mine) == len(out) == 40
+    a.leave()
+
+
+def test_tail_command_joins_the_group(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    from dbl_operator import app_cli
+
+    _recording(tmp_path / "rec", _events(30))
+    group_dir = tmp_path / "group"
+    argv = ["dbl-operator", "replay", str(tmp_path / "rec"), "--speed", "0", "--format", "ndjson"]
+    argv += ["--group", str(group_dir), "--group-partitions", "4", "--group-member", "solo"]
+    monkeypatch.setattr(sys, "argv", argv)
+    app_cli.main()
+    out = capsys.readouterr()
+    assert len(out.out.splitlines()) == 30
+    assert "solo owns partitions 0,1,2,3" in out.err
+    cursors = [json.loads(p.read_text())["index"] for p in (group_dir / "cursors").glob("*.json")]
+    assert max(cursors) == 29
+    # The member left the group on exit
+    assert not list((group_dir / "members").glob("*.json"))
+
+
+def _member(directory: str, name: str, members: int, results: multiprocessing.Queue, done: multiprocessing.Event) -> None:
+    group = ConsumerGroup(directory, partitions=16, member_id=name, lease_secs=30)
+    group.join(heartbeat=False)
+    deadline = time.monotonic() + 20
+    while len(group.members) < members and time.monotonic() < deadline:
+        time.sleep(0.02)
+        group.refresh()
+    results.put((name, sorted(group.owned)))
+    done.wait(20)
+    group.leave()
+
+
+def test_assignment_agrees_across_processes(tmp_path: Path) -> None:
+    ctx = multiprocessing.get_context("spawn")
+    results = ctx.Queue()
+    done = ctx.Event()
+    procs = [ctx.Process(target=_member, args=(str(tmp_path), f"m{i}", 3, results, done)) for i in range(3)]
+    for proc in procs:
+        proc.start()
+    try:
+        owned = dict(results.get(timeout=30) for _ in procs)
+    finally:
+        done.set()
+        for proc in procs:
+            proc.join(timeout=30)
+    assert sorted(p for parts in owned.values() for p in parts) == list(range(16))
+    assert owned == {name: sorted(p for p, m in assign(owned, 16).items() if m == name) for name in owned}
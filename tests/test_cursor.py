@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from dbl_operator.cursor import TailCursor
+from dbl_operator.recorder import SegmentRecorder
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _event(index: int, origin: str | None = None) -> dict:
+    event = {"index": index, "kind": "INTENT", "thread_id": "t-1", "timestamp": f"2026-01-01T00:00:{index:02d}Z"}
+    if origin:
+        event["origin"] = origin
+    return event
+
+
+def _stored(path: Path) -> dict:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def test_missing_file_starts_fresh(tmp_path: Path) -> None:
+    cursor = TailCursor(tmp_path / "sub" / "cursor.json")
+    assert (cursor.index, cursor.origins) == (None, {})
+    cursor.close()
+    # Nothing processed, nothing written
+    assert not (tmp_path / "sub" / "cursor.json").exists()
+
+
+def test_checkpoints_are_batched_by_count_and_time(tmp_path: Path) -> None:
+    clock = _Clock()
+    path = tmp_path / "cursor.json"
+    cursor = TailCursor(path, every_events=3, every_secs=1.0, clock=clock)
+    cursor.advance(_event(0))
+    cursor.advance(_event(1))
+    assert not path.exists()
+    cursor.advance(_event(2))
+    assert _stored(path)["index"] == 2
+
+    cursor.advance(_event(3))
+    clock.now = 1.5
+    cursor.advance(_event(4))
+    assert _stored(path)["index"] == 4
+    assert cursor.checkpoints == 2
+
+    cursor.advance(_event(5))
+    cursor.close()
+    assert _stored(path)["index"] == 5
+    assert TailCursor(path).index == 5
+
+
+def test_origins_are_tracked_per_source(tmp_path: Path) -> None:
+    path = tmp_path / "cursor.json"
+    cursor = TailCursor(path)
+    cursor.advance(_event(7, "http://a"))
+    cursor.advance(_event(3, "http://b"))
+    cursor.close()
+    assert TailCursor(path).origins == {"http://a": 7, "http://b": 3}
+
+
+def test_corrupt_file_is_rejected(tmp_path: Path) -> None:
+    path = tmp_path / "cursor.json"
+    path.write_text("{not json", encoding="utf-8")
+    with pytest.raises(ValueError):
+        TailCursor(path)
+
+
+def test_failed_write_is_kept_and_retried(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "cursor.json"
+    cursor = TailCursor(path, every_events=1)
+
+    def broken() -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(cursor, "_store", broken)
+    cursor.advance(_event(0))
+    assert isinstance(cursor.error, OSError)
+    monkeypatch.undo()
+    cursor.close()
+    assert cursor.error is None and _stored(path)["index"] == 0
+
+
+def test_tail_resumes_from_the_cursor_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    from dbl_operator import app_cli
+
+    recording = tmp_path / "rec"
+    recorder = SegmentRecorder(recording)
+    for i in range(6):
+        recorder.record(_event(i))
+    recorder.close()
+    cursor_file = tmp_path / "cursor.json"
+    cursor_file.write_text(json.dumps({"version": 1, "index": 3}), encoding="utf-8")
+
+    argv = ["dbl-operator", "replay", str(recording), "--speed", "0", "--format", "ndjson", "--cursor-file", str(cursor_file)]
+    monkeypatch.setattr(sys, "argv", argv)
+    app_cli.main()
+    out = capsys.readouterr()
+    assert [json.loads(line)["index"] for line in out.out.splitlines()] == [4, 5]
+    assert "resuming after index 3" in out.err
+    assert _stored(cursor_file)["index"] == 5
+
+
+@pytest.mark.parametrize("option", [["--cursor-file", "cursor.json"], ["--group", "group"]])
+def test_checkpointing_rejects_lossy_overflow(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str], option: list[str]
+) -> None:
+    from dbl_operator import app_cli
+
+    recording = tmp_path / "rec"
+    recorder = SegmentRecorder(recording)
+    recorder.record(_event(0))
+    recorder.close()
+    argv = ["dbl-operator", "replay", str(recording), "--on-overflow", "drop-oldest", option[0], str(tmp_path / option[1])]
+    monkeypatch.setattr(sys, "argv", argv)
+    with pytest.raises(SystemExit) as exc:
+        app_cli.main()
+    assert exc.value.code == 1
+    assert "needs --on-overflow block" in capsys.readouterr().err
+
+
+def test_unrepaired_gap_is_reported(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    from dbl_operator import app_cli
+
+    recording = tmp_path / "rec"
+    recorder = SegmentRecorder(recording)
+    # Indices 3 and 4 are in neither the stream nor /snapshot
+    for i in (0, 1, 2, 5, 6):
+        recorder.record(_event(i))
+    recorder.close()
+    cursor_file = tmp_path / "cursor.json"
+    argv = ["dbl-operator", "replay", str(recording), "--speed", "0", "--format", "ndjson", "--cursor-file", str(cursor_file)]
+    monkeypatch.setattr(sys, "argv", argv)
+    app_cli.main()
+    err = capsys.readouterr().err
+    assert "cursor moved past 1 index gaps that could not be backfilled" in err
+    assert _stored(cursor_file)["index"] == 6
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from dbl_operator.ansi_colors import ColorMode
+from dbl_operator.dashboard import LiveDashboard
+
+
+def _decision(index: int, turn: str, result: str, reason: str) -> dict:
+    return {
+        "index": index,
+        "kind": "DECISION",
+        "turn_id": turn,
+        "timestamp": "2026-01-01T00:00:00+00:00",
+        "payload": {"decision": result, "policy_id": "p", "policy_version": "7", "reason_codes": [reason]},
+    }
+
+
+def test_window_expires_old_buckets() -> None:
+    dash = LiveDashboard(window_secs=5)
+    dash._started = 0.0
+    dash.feed(_decision(1, "a", "DENY", "quota"), now=100.0)
+    dash.feed(_decision(2, "b", "ALLOW", "ok"), now=101.0)
+    assert dash.deny_rate() == 50.0
+    assert dash.rates(now=101.5)["DECISION"] == 2 / 5
+
+    # Both buckets fall out of the window
+    assert dash.rates(now=110.0)["DECISION"] == 0.0
+    assert dash.deny_rate() == 0.0
+    assert dash.active_policy == ("p", "7")
+
+
+def test_render_shows_top_reasons_and_policy() -> None:
+    dash = LiveDashboard(window_secs=10, top_reasons=1)
+    for i in range(3):
+        dash.feed(_decision(i, f"t{i}", "DENY", "quota"), now=50.0)
+    dash.feed(_decision(3, "t3", "DENY", "other"), now=50.0)
+    text = "\n".join(dash.render(ColorMode(enabled=False), now=50.5))
+    assert "policy=p@7" in text
+    assert "quota" in text and "other" not in text
+    assert "deny rate=100.0%" in text
+
+
+def test_latency_ring_is_bounded() -> None:
+    dash = LiveDashboard(latency_samples=8)
+    for i in range(100):
+        dash.feed({"index": 2 * i, "kind": "INTENT", "turn_id": f"t{i}", "timestamp": "2026-01-01T00:00:00+00:00"}, now=1.0)
+        dash.feed(
+            {"index": 2 * i + 1, "kind": "DECISION", "turn_id": f"t{i}", "timestamp": "2026-01-01T00:00:01+00:00",
+             "payload": {"decision": "ALLOW"}},
+            now=1.0,
+        )
+    assert len(dash.policy_latency) == 8
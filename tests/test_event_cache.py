@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+import pytest
+
+from dbl_operator.event_cache import EventCache, EventWindow, window_key
+from dbl_operator.http_gateway_client import HttpGatewayClient
+
+
+class _Gateway:
+    """In-memory /status and /snapshot over an append-only ledger."""
+
+    def __init__(self) -> None:
+        self.events: list[dict[str, Any]] = []
+        self.requests: list[tuple[str, dict[str, Any]]] = []
+        self.status_fails = False
+
+    def append(self, thread_id: str, turn_id: str, kind: str, lane: str = "default") -> None:
+        self.events.append({
+            "index": len(self.events),
+            "thread_id": thread_id,
+            "turn_id": turn_id,
+            "kind": kind,
+            "lane": lane,
+            "payload": {},
+        })
+
+    def get_json(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        params = dict(params or {})
+        self.requests.append((path, params))
+        if path == "/status":
+            if self.status_fails:
+                raise httpx.ConnectError("down")
+            return {"t_index": len(self.events) - 1 if self.events else None}
+        offset = params.get("offset", 0)
+        matching = [
+            e for e in self.events[offset:]
+            if params.get("lane") in (None, e["lane"])
+        ]
+        return {"events": matching[: params["limit"]]}
+
+    def snapshots(self) -> list[dict[str, Any]]:
+        return [params for path, params in self.requests if path == "/snapshot"]
+
+
+@pytest.fixture
+def gateway(monkeypatch: pytest.MonkeyPatch) -> _Gateway:
+    gw = _Gateway()
+    monkeypatch.setattr(HttpGatewayClient, "_get_json", lambda self, path, params=None: gw.get_json(path, params))
+    return gw
+
+
+def _client(cache: EventCache | None = None) -> HttpGatewayClient:
+    return HttpGatewayClient("http://gw", event_cache=cache or EventCache())
+
+
+def test_repeat_views_are_served_from_memory(gateway: _Gateway) -> None:
+    gateway.append("t-1", "turn-1", "INTENT")
+    gateway.append("t-1", "turn-1", "DECISION")
+    client = _client()
+
+    client.get_timeline("t-1")
+    client.get_decision("t-1", "turn-1")
+    client.get_audit("t-1")
+
+    assert len(gateway.snapshots()) == 1
+    assert [path for path, _ in gateway.requests] == ["/snapshot", "/status", "/status"]
+    assert (client.event_cache.misses, client.event_cache.hits) == (1, 2)
+
+
+def test_advanced_ledger_fetches_only_the_delta(gateway: _Gateway) -> None:
+    gateway.append("t-1", "turn-1", "INTENT")
+    client = _client()
+    assert client.get_decision("t-1", "turn-1") is None
+
+    gateway.append("t-1", "turn-1", "DECISION")
+    gateway.append("t-1", "turn-1", "EXECUTION")
+    decision = client.get_decision("t-1", "turn-1")
+
+    assert decision is not None
+    assert gateway.snapshots()[-1] == {"limit": 999, "offset": 1}
+    assert [e["index"] for e in client.fetch_events()] == [0, 1, 2]
+    assert client.event_cache.deltas == 1
+
+
+def test_cached_window_matches_a_fresh_fetch(gateway: _Gateway) -> None:
+    client = _client()
+    for i in range(30):
+        gateway.append(f"t-{i % 3}", f"turn-{i // 3}", "INTENT", lane="fast" if i % 2 else "slow")
+        for kwargs in ({"limit": 8}, {"limit": 50}, {"limit": 5, "offset": 10}, {"limit": 50, "lane": "fast"}):
+            assert client.fetch_events(**kwargs) == _client().fetch_events(**kwargs)
+
+
+def test_full_window_needs_no_revalidation(gateway: _Gateway) -> None:
+    for i in range(10):
+        gateway.append("t-1", f"turn-{i}", "INTENT")
+    client = _client()
+    client.fetch_events(limit=5, offset=2)
+    before = len(gateway.requests)
+
+    gateway.append("t-1", "turn-10", "INTENT")
+    assert [e["index"] for e in client.fetch_events(limit=5, offset=2)] == [2, 3, 4, 5, 6]
+    assert len(gateway.requests) == before
+
+
+def test_unreadable_status_or_reset_ledger_refetches(gateway: _Gateway) -> None:
+    gateway.append("t-1", "turn-1", "INTENT")
+    gateway.append("t-1", "turn-2", "INTENT")
+    client = _client()
+    client.fetch_events()
+
+    gateway.status_fails = True
+    client.fetch_events()
+    assert gateway.snapshots()[-1] == {"limit": 1000}
+
+    gateway.status_fails = False
+    gateway.events = gateway.events[:1]
+    assert [e["turn_id"] for e in client.fetch_events()] == ["turn-1"]
+    assert len(gateway.snapshots()) == 3
+
+
+def test_without_cache_every_read_fetches(gateway: _Gateway) -> None:
+    gateway.append("t-1", "turn-1", "INTENT")
+    client = HttpGatewayClient("http://gw")
+    client.get_timeline("t-1")
+    client.get_timeline("t-1")
+    assert [path for path, _ in gateway.requests] == ["/snapshot", "/snapshot"]
+
+
+def test_cache_evicts_least_recently_used_window() -> None:
+    cache = EventCache(max_windows=2)
+    for limit in (1, 2, 3):
+        cache.put(window_key(limit), EventWindow([], -1))
+    assert len(cache) == 2
+    assert cache.get(window_key(1)) is None
+    assert cache.get(window_key(3)) is not None
+
+
+def test_window_key_treats_missing_offset_as_zero() -> None:
+    assert window_key(10) == window_key(10, offset=0)
+    assert window_key(10, lane="fast") != window_key(10)
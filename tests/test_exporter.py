@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import csv
+import gzip
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from dbl_operator.exporter import EXPORT_COLUMNS, LedgerExporter, load_manifest
+from dbl_operator.recorder import SegmentRecorder
+from dbl_operator.replay import ReplayGatewayClient, iter_recording
+
+
+def _events(count: int) -> list[dict]:
+    return [
+        {
+            "index": i,
+            "kind": "DECISION" if i % 2 else "INTENT",
+            "thread_id": f"t-{i % 3}",
+            "turn_id": f"turn-{i // 2}",
+            "stream_id": "s-a" if i % 4 < 2 else "s-b",
+            "timestamp": f"2026-01-01T00:{i // 60:02d}:{i % 60:02d}Z",
+            "payload": {"decision": "ALLOW", "n": i},
+        }
+        for i in range(count)
+    ]
+
+
+class _CountingClient(ReplayGatewayClient):
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+        self.requests = 0
+
+    def fetch_events(self, limit: int = 1000, **kwargs) -> list[dict]:
+        self.requests += 1
+        return super().fetch_events(limit, **kwargs)
+
+
+@pytest.fixture()
+def gateway(tmp_path: Path) -> _CountingClient:
+    # A recording stands in for the gateway: same /status and /snapshot semantics
+    recorder = SegmentRecorder(tmp_path / "ledger")
+    for event in _events(95):
+        recorder.record(event)
+    recorder.close()
+    return _CountingClient(tmp_path / "ledger")
+
+
+def test_chunks_cover_the_ledger_with_checksums(tmp_path: Path, gateway: _CountingClient) -> None:
+    out = tmp_path / "export"
+    manifest = LedgerExporter(gateway, out, chunk_events=20, page_size=7, workers=3).run()
+
+    assert manifest["complete"] and manifest["to_index"] == 94
+    chunks = manifest["chunks"]
+    assert [(c["first_index"], c["last_index"]) for c in chunks] == [(0, 19), (20, 39), (40, 59), (60, 79), (80, 94)]
+    assert [c["events"] for c in chunks] == [20, 20, 20, 20, 15]
+    for chunk in chunks:
+        data = (out / chunk["file"]).read_bytes()
+        assert hashlib.sha256(data).hexdigest() == chunk["sha256"] and len(data) == chunk["bytes"]
+    lines = gzip.decompress((out / chunks[1]["file"]).read_bytes()).decode().splitlines()
+    assert [json.loads(line)["index"] for line in lines] == list(range(20, 40))
+    # Exports replay like recordings
+    assert list(iter_recording(out)) == _events(95)
+    assert [e["index"] for e in iter_recording(out, from_index=90)] == list(range(90, 95))
+
+
+def test_export_resumes_and_extends(tmp_path: Path, gateway: _CountingClient) -> None:
+    out = tmp_path / "export"
+    LedgerExporter(gateway, out, chunk_events=20, to_index=49).run()
+    (out / "chunk-000002.ndjson.gz").unlink()
+    before = gateway.requests
+
+    exporter = LedgerExporter(gateway, out, chunk_events=20)
+    manifest = exporter.run()
+    # Chunk 1 is kept; chunk 2 (missing) and the short chunk 3 are fetched again
+    assert exporter.resumed == 1
+    assert gateway.requests - before == 4
+    assert [c["events"] for c in manifest["chunks"]] == [20, 20, 20, 20, 15]
+    assert exporter.events == 95
+
+    with pytest.raises(ValueError):
+        LedgerExporter(gateway, out, chunk_events=10).run()
+
+
+def test_csv_chunks_with_stream_filter(tmp_path: Path, gateway: _CountingClient) -> None:
+    out = tmp_path / "export"
+    manifest = LedgerExporter(gateway, out, fmt="csv", chunk_events=50, page_size=10, stream_id="s-a").run()
+    with open(out / manifest["chunks"][0]["file"], newline="", encoding="utf-8") as fh:
+        rows = list(csv.DictReader(fh))
+    assert tuple(rows[0]) == EXPORT_COLUMNS
+    assert {r["stream_id"] for r in rows} == {"s-a"}
+    assert [int(r["index"]) for r in rows] == [i for i in range(50) if i % 4 < 2]
+    assert json.loads(rows[1]["payload"]) == {"decision": "ALLOW", "n": 1}
+    assert rows[1]["result"] == "ALLOW"
+    with pytest.raises(ValueError):
+        ReplayGatewayClient(out)
+
+
+def test_parquet_needs_pyarrow(tmp_path: Path, gateway: _CountingClient) -> None:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        with pytest.raises(ValueError, match="pyarrow"):
+            LedgerExporter(gateway, tmp_path, fmt="parquet")
+        return
+    manifest = LedgerExporter(gateway, tmp_path, fmt="parquet", chunk_events=50).run()
+    table = pq.read_table(tmp_path / manifest["chunks"][0]["file"])
+    assert table.column_names == list(EXPORT_COLUMNS) and table.num_rows == 50
+
+
+def test_export_command(
+    tmp_path: Path, gateway: _CountingClient, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    from dbl_operator import app_cli
+
+    out = tmp_path / "export"
+    argv = ["dbl-operator", "--replay", str(gateway.path), "export", str(out), "--chunk-events", "40"]
+    monkeypatch.setattr(sys, "argv", argv)
+    app_cli.main()
+    captured = capsys.readouterr()
+    assert "Exported 95 events (index 0-94) in 3 chunks" in captured.out
+    assert "chunk-000003.ndjson.gz: index 80-94, 15 events" in captured.err
+    assert load_manifest(out)["complete"]
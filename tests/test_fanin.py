@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import itertools
+
+from dbl_operator.fanin import FanInGatewayClient
+
+
+class ScriptedSource:
+    """Stand-in gateway that streams a fixed list of events once."""
+
+    def __init__(self, base_url: str, events: list[dict]) -> None:
+        self.base_url = base_url
+        self.events = events
+        self.since_calls: list[int | None] = []
+
+    def tail(self, since=None, backlog=None):
+        self.since_calls.append(since)
+        for event in self.events:
+            if since is None or event["index"] > since:
+                yield dict(event)
+
+
+def _events(prefix: str, seconds: list[int]) -> list[dict]:
+    return [
+        {"index": i, "kind": "INTENT", "turn_id": f"{prefix}{i}", "timestamp": f"2026-01-01T00:00:{s:02d}+00:00"}
+        for i, s in enumerate(seconds)
+    ]
+
+
+def test_fanin_tags_origin_and_tracks_positions_per_source() -> None:
+    a = ScriptedSource("http://gw-a:8010", _events("a", [0, 2, 4]))
+    b = ScriptedSource("http://gw-b:8010", _events("b", [1, 3]))
+    fanin = FanInGatewayClient([a, b])
+    stream = fanin.tail()
+    received = list(itertools.islice(stream, 5))
+    stream.close()
+
+    assert sorted(e["turn_id"] for e in received) == ["a0", "a1", "a2", "b0", "b1"]
+    assert {e["origin"] for e in received} == {"http://gw-a:8010", "http://gw-b:8010"}
+    assert fanin.positions == {"http://gw-a:8010": 2, "http://gw-b:8010": 1}
+
+
+def test_fanin_ordered_merges_by_timestamp() -> None:
+    a = ScriptedSource("http://gw-a", _events("a", [0, 2, 4]))
+    b = ScriptedSource("http://gw-b", _events("b", [1, 3, 5]))
+    fanin = FanInGatewayClient([a, b], ordered=True, reorder_window=16, reorder_delay_secs=0.2)
+    stream = fanin.tail()
+    received = list(itertools.islice(stream, 6))
+    stream.close()
+
+    assert [e["turn_id"] for e in received] == ["a0", "b0", "a1", "b1", "a2", "b2"]
+
+
+def test_fanin_resumes_each_source_from_its_own_index() -> None:
+    a = ScriptedSource("http://gw-a", _events("a", [0, 1]))
+    b = ScriptedSource("http://gw-b", _events("b", [0]))
+    fanin = FanInGatewayClient([a, b])
+    fanin.positions = {"http://gw-a": 1}
+    stream = fanin.tail(since=None)
+    received = list(itertools.islice(stream, 1))
+    stream.close()
+
+    assert received[0]["turn_id"] == "b0"
+    assert a.since_calls[0] == 1
+    assert b.since_calls[0] is None
+
+
+def test_fanin_ignores_since_on_reentry() -> None:
+    a = ScriptedSource("http://gw-a", _events("a", [0, 1, 2]))
+    b = ScriptedSource("http://gw-b", _events("b", [0, 1, 2, 3]))
+    fanin = FanInGatewayClient([a, b])
+    fanin.positions = {"http://gw-a": 0}
+    first = fanin.tail(since=None)
+    next(first)
+    first.close()
+    # An outer resumer passes gw-a's index; gw-b has no position and must not skip
+    fanin.positions = {"http://gw-a": 2}
+    second = fanin.tail(since=2)
+    received = list(itertools.islice(second, 1))
+    second.close()
+    assert received[0]["turn_id"] == "b0"
+
+
+def test_fanin_tags_copies_of_source_events() -> None:
+    events = _events("a", [0])
+    source = ScriptedSource("http://gw-a", events)
+    source.tail = lambda since=None, backlog=None: iter(events)
+    fanin = FanInGatewayClient([source])
+    stream = fanin.tail()
+    (received,) = itertools.islice(stream, 1)
+    stream.close()
+    assert received["origin"] == "http://gw-a" and "origin" not in events[0]
+
+
+def test_stopping_the_fanin_aborts_blocked_reads() -> None:
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    from dbl_operator.http_gateway_client import HttpGatewayClient
+
+    release = threading.Event()
+
+    class SilentTail(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.end_headers()
+            self.wfile.flush()
+            release.wait(10)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SilentTail)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        silent = HttpGatewayClient(f"http://127.0.0.1:{server.server_port}", stall_timeout_secs=30)
+        fanin = FanInGatewayClient([ScriptedSource("http://gw-a", _events("a", [0])), silent])
+        stream = fanin.tail()
+        next(stream)
+        deadline = time.monotonic() + 5
+        while not silent._tail_responses and time.monotonic() < deadline:
+            time.sleep(0.01)
+        stream.close()
+        pump = next(t for t in threading.enumerate() if t.name == f"fanin-{silent.base_url}")
+        pump.join(timeout=3)
+        assert not pump.is_alive()
+    finally:
+        release.set()
+        server.shutdown()
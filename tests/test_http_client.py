@@ -175,3 +175,14 @@ def test_http_client_get_audit_derivation() -> None:
         audit = client.get_audit("t")
         assert len(audit) == 1
         assert audit[0].event_digest == "d1"
+
+
+def test_build_client_fans_in_over_several_urls() -> None:
+    from dbl_operator.fanin import FanInGatewayClient
+
+    env = {"DBL_GATEWAY_BASE_URL": "http://gw-a:8010, http://gw-b:8010"}
+    with patch.dict(os.environ, env, clear=True), \
+         patch.object(HttpGatewayClient, "check_capabilities"):
+        client = _build_client()
+        assert isinstance(client, FanInGatewayClient)
+        assert client.origins == ["http://gw-a:8010", "http://gw-b:8010"]
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import urllib.request
+
+from dbl_operator.metrics import GatewayMetrics, MetricsRegistry, MetricsServer
+
+
+def _event(index: int, kind: str, turn: str, ts: str, **payload: object) -> dict:
+    return {
+        "index": index,
+        "kind": kind,
+        "thread_id": "t",
+        "turn_id": turn,
+        "intent_type": "chat",
+        "timestamp": ts,
+        "payload": dict(payload),
+    }
+
+
+def test_gateway_metrics_counts_and_latencies() -> None:
+    metrics = GatewayMetrics()
+    for event in [
+        _event(1, "INTENT", "a", "2026-01-01T00:00:00+00:00"),
+        _event(2, "DECISION", "a", "2026-01-01T00:00:00.200000+00:00", decision="ALLOW", policy_id="p", policy_version="1"),
+        _event(3, "EXECUTION", "a", "2026-01-01T00:00:01.200000+00:00"),
+        _event(4, "INTENT", "b", "2026-01-01T00:00:02+00:00"),
+        _event(5, "DECISION", "b", "2026-01-01T00:00:02.010000+00:00", decision="DENY", policy_id="p", policy_version="1", reason_codes=["quota"]),
+        _event(6, "EXECUTION", "b", "2026-01-01T00:00:03+00:00"),
+    ]:
+        metrics.feed(event)
+
+    assert metrics.events.value("INTENT") == 2
+    assert metrics.decisions.value("ALLOW", "chat", "p", "1") == 1
+    assert metrics.decisions.value("DENY", "chat", "p", "1") == 1
+    assert metrics.reasons.value("quota") == 1
+    assert metrics.policy_latency.count() == 2
+    assert metrics.exec_latency.count() == 2
+    assert metrics.violations.value("execution_after_deny") == 1
+    assert metrics.open_turns.value() == 0
+
+    text = metrics.registry.render().decode()
+    assert "# TYPE dbl_operator_events_total counter" in text
+    assert 'dbl_operator_events_total{kind="DECISION"} 2' in text
+    assert 'dbl_operator_intent_to_decision_seconds_bucket{le="0.25"} 2' in text
+    assert 'dbl_operator_intent_to_decision_seconds_bucket{le="+Inf"} 2' in text
+    assert "dbl_operator_intent_to_decision_seconds_count 2" in text
+
+
+def test_incomplete_turns_become_gaps_after_threshold() -> None:
+    metrics = GatewayMetrics()
+    metrics.tracker.orphan_after_secs = 60
+    metrics.feed(_event(1, "INTENT", "a", "2026-01-01T00:00:00+00:00"))
+    assert metrics.open_turns.value() == 1
+    metrics.feed(_event(2, "INTENT", "b", "2026-01-01T00:05:00+00:00"))
+    assert metrics.gaps.value() == 1
+    assert metrics.orphaned_turns.value() == 1
+    assert metrics.open_turns.value() == 2
+
+
+def test_events_without_timestamps_give_no_latency_sample() -> None:
+    metrics = GatewayMetrics()
+    metrics.feed(_event(1, "INTENT", "a", ""))
+    metrics.feed(_event(2, "DECISION", "a", "2026-01-01T00:00:00.200000+00:00", decision="ALLOW"))
+    metrics.feed(_event(3, "EXECUTION", "a", "not a time"))
+    assert metrics.policy_latency.count() == 0
+    assert metrics.exec_latency.count() == 0
+    # The turn itself is still followed: no violations, nothing left open
+    assert metrics.violations.value("decision_without_intent") == 0
+    assert metrics.open_turns.value() == 0
+
+
+def test_render_is_cached_until_an_update() -> None:
+    registry = MetricsRegistry()
+    counter = registry.counter("demo", "Demo counter.")
+    first = registry.render()
+    assert registry.render() is first
+    counter.inc()
+    assert registry.render() is not first
+    assert b"demo_total 1" in registry.render()
+
+
+def test_metrics_server_serves_registry() -> None:
+    registry = MetricsRegistry()
+    registry.gauge("demo_gauge", "Demo gauge.").set(3)
+    server = MetricsServer(registry, port=0)
+    server.start()
+    try:
+        host, port = server.address
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5) as resp:
+            assert resp.status == 200
+            assert b"demo_gauge 3" in resp.read()
+    finally:
+        server.stop()
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import json
+
+import pytest
+
+from dbl_operator.commands.projections import integrity_view, latency_view, stats_view
+from dbl_operator.output import open_writer, write_records
+from dbl_operator.projections.decision_stats import DecisionStatsProjection
+from dbl_operator.projections.failures import FailureTaxonomyProjection
+from dbl_operator.projections.integrity import IntegrityProjection
+from dbl_operator.projections.latency import LatencyProjection
+from dbl_operator.projections.partitioned import PartitionedProjection
+from dbl_operator.projections.policy_map import PolicyMapProjection
+from dbl_operator.tail_presenter import tail_record
+
+EVENTS = [
+    {"index": 1, "turn_id": "t1", "kind": "INTENT", "lane": "a", "timestamp": "2026-01-01T00:00:00+00:00"},
+    {"index": 2, "turn_id": "t1", "kind": "DECISION", "lane": "a", "timestamp": "2026-01-01T00:00:01+00:00",
+     "payload": {"decision": "ALLOW", "policy_id": "p", "policy_version": "1", "reason_codes": ["ok"]}},
+    {"index": 3, "turn_id": "t1", "kind": "EXECUTION", "lane": "a", "timestamp": "2026-01-01T00:00:02+00:00"},
+    {"index": 4, "turn_id": "t2", "kind": "INTENT", "lane": "b", "timestamp": "2026-01-01T00:00:03+00:00"},
+]
+
+
+class _SnapshotClient:
+    def fetch_events(self, limit: int = 1000, **filters):
+        return [dict(e) for e in EVENTS]
+
+
+def _args(**kwargs) -> argparse.Namespace:
+    defaults = {"partition": None, "by_partition": False, "workers": 1, "sample": None, "format": "text"}
+    return argparse.Namespace(**{**defaults, **kwargs})
+
+
+def test_writers_stream_valid_documents() -> None:
+    records = [{"record": "a", "n": 1}, {"record": "a", "n": 2}, {"record": "b", "tags": ["x"]}]
+    out = io.StringIO()
+    write_records("json", records, out)
+    assert json.loads(out.getvalue()) == records
+
+    out = io.StringIO()
+    write_records("ndjson", records, out)
+    assert [json.loads(line) for line in out.getvalue().splitlines()] == records
+
+    out = io.StringIO()
+    write_records("csv", records, out)
+    first, second = out.getvalue().split("\n\n")
+    assert list(csv.reader(io.StringIO(first))) == [["record", "n"], ["a", "1"], ["a", "2"]]
+    assert list(csv.reader(io.StringIO(second))) == [["record", "tags"], ["b", '["x"]']]
+
+    out = io.StringIO()
+    with open_writer("json", out):
+        pass
+    assert json.loads(out.getvalue()) == []
+    with pytest.raises(ValueError):
+        open_writer("xml")
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [
+        IntegrityProjection,
+        LatencyProjection,
+        lambda: LatencyProjection(group_by=("lane",)),
+        PolicyMapProjection,
+        DecisionStatsProjection,
+        lambda: DecisionStatsProjection(approx=True),
+        FailureTaxonomyProjection,
+        lambda: PartitionedProjection(FailureTaxonomyProjection),
+    ],
+)
+def test_every_projection_emits_serializable_records(factory) -> None:
+    projection = factory()
+    for event in EVENTS:
+        projection.feed(event)
+    records = list(projection.records())
+    assert records and all("record" in r for r in records)
+    json.dumps(records)
+    # The report streams line by line rather than as one rendered block
+    lines = list(projection.iter_lines())
+    assert len(lines) > 1 and "\n".join(lines) == projection.render()
+
+
+def test_latency_slowest_applies_without_group_by(capsys) -> None:
+    class _Turns:
+        def fetch_events(self, limit: int = 1000, **filters):
+            events = []
+            for n in range(6):
+                for step, kind in enumerate(("INTENT", "DECISION", "EXECUTION")):
+                    ts = f"2026-01-01T00:00:{n * 5 + step * (n + 1) // 2:02d}+00:00"
+                    events.append({"index": len(events), "kind": kind, "turn_id": f"turn-{n}", "timestamp": ts})
+            return events
+
+    latency_view(_Turns(), _args(group_by=None, slowest=2))
+    out = capsys.readouterr().out
+    assert "Slowest 2 Turns" in out
+    listed = [line.split()[0] for line in out.splitlines() if line.startswith("turn-")]
+    assert listed == ["turn-5", "turn-4"]
+
+
+def test_projection_without_records_cannot_be_created() -> None:
+    from dbl_operator.projections.base import Projection
+
+    class TextOnly(Projection):
+        def feed(self, event: dict) -> None:
+            pass
+
+        def render(self) -> str:
+            return ""
+
+    with pytest.raises(TypeError, match="records"):
+        TextOnly()
+
+
+def test_partitioned_records_are_tagged_with_partition() -> None:
+    projection = PartitionedProjection(DecisionStatsProjection)
+    for event in EVENTS:
+        projection.feed(event)
+    tags = {(r["stream_id"], r["lane"]) for r in projection.records()}
+    assert ("*", "*") in tags and ("-", "a") in tags
+
+
+def test_integrity_only_problems(capsys) -> None:
+    integrity_view(_SnapshotClient(), _args(only_problems=True))
+    out = capsys.readouterr().out
+    assert "t2" in out and "| OK" not in out
+    assert "OK: 1" in out and "GAP: 1" in out
+
+    integrity_view(_SnapshotClient(), _args(only_problems=True, format="ndjson"))
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [r["turn_id"] for r in records if r["record"] == "turn"] == ["t2"]
+    assert {r["status"]: r["count"] for r in records if r["record"] == "summary"} == {"OK": 1, "GAP": 1}
+
+
+def test_stats_csv_output(capsys) -> None:
+    stats_view(_SnapshotClient(), _args(format="csv", approx=False))
+    rows = list(csv.reader(io.StringIO(capsys.readouterr().out.split("\n\n")[0])))
+    assert rows[0][:3] == ["record", "policy_id", "intent_type"]
+    assert rows[1][:5] == ["matrix", "p", "unknown", "1", "0"]
+
+
+def test_tail_record_has_fixed_columns() -> None:
+    record = tail_record(EVENTS[1])
+    assert record["result"] == "ALLOW"
+    assert list(record)[:3] == ["index", "timestamp", "kind"]
+    assert tail_record(EVENTS[0])["result"] is None
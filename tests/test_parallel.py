@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import functools
+import random
+
+import pytest
+
+from dbl_operator.parallel import run_parallel, shard_events, shard_of
+from dbl_operator.projections.decision_stats import DecisionStatsProjection
+from dbl_operator.projections.failures import FailureTaxonomyProjection
+from dbl_operator.projections.integrity import IntegrityProjection
+from dbl_operator.projections.latency import LatencyProjection
+from dbl_operator.projections.partitioned import PartitionedProjection
+from dbl_operator.projections.policy_map import PolicyMapProjection
+
+
+def _events(count: int) -> list[dict]:
+    rng = random.Random(7)
+    events = []
+    for i in range(count):
+        turn = f"turn-{i // 3}"
+        kind = ("INTENT", "DECISION", "EXECUTION")[i % 3]
+        payload = {}
+        if kind == "DECISION":
+            payload = {
+                "decision": rng.choice(["ALLOW", "DENY"]),
+                "policy_id": f"p{i // 300}",
+                "policy_version": "v1",
+                "reason_codes": [rng.choice(["ok", "quota"])],
+            }
+        events.append({
+            "index": i + 1,
+            "turn_id": turn,
+            "kind": kind,
+            "lane": rng.choice(["a", "b"]),
+            "timestamp": f"2026-01-01T00:{(i // 60) % 60:02d}:{i % 60:02d}.{rng.randint(0, 999):03d}Z",
+            "payload": payload,
+        })
+    return events
+
+
+def test_shard_of_is_stable() -> None:
+    assert shard_of("turn-1", 8) == shard_of("turn-1", 8)
+    assert {shard_of(f"turn-{i}", 4) for i in range(100)} == {0, 1, 2, 3}
+
+
+def test_shard_events_keeps_turns_together_and_ranges_contiguous() -> None:
+    events = _events(90)
+    for shard in shard_events(events, 3):
+        turns = {e["turn_id"] for e in shard}
+        assert all(shard_of(t, 3) == shard_of(next(iter(turns)), 3) for t in turns)
+    ranges = shard_events(events, 4, by="range")
+    assert [e for shard in ranges for e in shard] == events
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [
+        IntegrityProjection,
+        LatencyProjection,
+        DecisionStatsProjection,
+        FailureTaxonomyProjection,
+        PolicyMapProjection,
+        functools.partial(PartitionedProjection, LatencyProjection),
+    ],
+)
+def test_parallel_matches_sequential(factory) -> None:
+    events = _events(1200)
+    sequential = factory()
+    for event in events:
+        sequential.feed(event)
+    parallel = run_parallel(factory, events, workers=3, min_events_per_worker=100)
+    assert parallel.render() == sequential.render()
+
+
+def test_small_inputs_run_in_process() -> None:
+    events = _events(30)
+    result = run_parallel(DecisionStatsProjection, events, workers=4)
+    assert sum(sum(c.values()) for c in result.matrix.values()) == 10
+
+
+def test_worker_reduction_is_reported() -> None:
+    reduced = []
+    result = run_parallel(
+        DecisionStatsProjection, _events(1200), workers=8, min_events_per_worker=500, on_reduced=lambda *a: reduced.append(a)
+    )
+    assert reduced == [(8, 2)]
+    assert sum(sum(c.values()) for c in result.matrix.values()) == 400
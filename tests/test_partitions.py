@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import httpx
+from unittest.mock import patch
+
+from dbl_operator.domain_types import Anchors, IntentEnvelope, Partition
+from dbl_operator.http_gateway_client import HttpGatewayClient
+from dbl_operator.projections.decision_stats import DecisionStatsProjection
+from dbl_operator.projections.partitioned import PartitionedProjection
+
+
+def test_partition_parse() -> None:
+    assert Partition.parse("orders") == Partition("orders", None)
+    assert Partition.parse("orders:fast") == Partition("orders", "fast")
+    assert Partition.parse(":fast") == Partition(None, "fast")
+    assert Partition.parse("orders:fast").label == "orders/fast"
+
+
+def test_fetch_events_passes_stream_and_lane() -> None:
+    client = HttpGatewayClient(base_url="http://localhost:8010")
+    with patch.object(httpx.Client, "get") as mock_get:
+        mock_get.return_value.json.return_value = {"events": []}
+        client.fetch_events(limit=50, stream_id="orders", lane="fast")
+        assert mock_get.call_args.kwargs["params"] == {"limit": 50, "stream_id": "orders", "lane": "fast"}
+
+
+def test_fetch_partitions_queries_each_partition() -> None:
+    client = HttpGatewayClient(base_url="http://localhost:8010")
+
+    def fake_get(url, params=None, headers=None):
+        resp = httpx.Response(200, json={"events": [{"index": 1, "lane": params.get("lane")}]})
+        resp.request = httpx.Request("GET", url)
+        return resp
+
+    with patch.object(httpx.Client, "get", side_effect=fake_get):
+        result = client.fetch_partitions([Partition("s", "a"), Partition("s", "b")], limit=10)
+    assert result[Partition("s", "a")][0]["lane"] == "a"
+    assert result[Partition("s", "b")][0]["lane"] == "b"
+
+
+def test_send_intent_uses_client_partition_and_override() -> None:
+    client = HttpGatewayClient(base_url="http://localhost:8010", stream_id="orders", lane="bulk")
+    envelope = IntentEnvelope(anchors=Anchors("t", "1", None), intent_type="x", payload={}, context_spec=None)
+    with patch.object(httpx.Client, "post") as mock_post:
+        mock_post.return_value.json.return_value = {"correlation_id": "c"}
+        client.send_intent(envelope, correlation_id="c")
+        inner = mock_post.call_args.kwargs["json"]["payload"]
+        assert (inner["stream_id"], inner["lane"]) == ("orders", "bulk")
+        client.send_intent(envelope, correlation_id="c", lane="fast")
+        inner = mock_post.call_args.kwargs["json"]["payload"]
+        assert (inner["stream_id"], inner["lane"]) == ("orders", "fast")
+
+
+def test_partitioned_projection_reports_each_partition_and_rollup() -> None:
+    projection = PartitionedProjection(DecisionStatsProjection)
+    for i, lane in enumerate(["fast", "fast", "slow"]):
+        projection.feed({
+            "index": i,
+            "kind": "DECISION",
+            "stream_id": "orders",
+            "lane": lane,
+            "intent_type": "chat",
+            "payload": {"decision": "ALLOW", "policy_id": "p"},
+        })
+    assert set(projection.partitions) == {("orders", "fast"), ("orders", "slow")}
+    assert projection.partitions[("orders", "fast")].matrix[("p", "chat")]["ALLOW"] == 2
+    assert projection.rollup.matrix[("p", "chat")]["ALLOW"] == 3
+    text = projection.render()
+    assert "Partition: stream=orders lane=fast" in text
+    assert "Overall (2 partitions)" in text
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import json
+
+import httpx
+from unittest.mock import patch
+
+from dbl_operator.http_gateway_client import HttpGatewayClient
+from dbl_operator.profiler import Profiler, get_profiler
+
+
+def test_disabled_profiler_records_nothing() -> None:
+    profiler = Profiler()
+    with profiler.stage("http.request") as span:
+        span.bytes = 10
+    assert profiler.stages() == []
+
+
+def test_stage_accumulates_calls_bytes_and_events() -> None:
+    profiler = Profiler(enabled=True)
+    for _ in range(3):
+        with profiler.stage("projection.feed", events=5) as span:
+            span.bytes = 100
+    (stats,) = profiler.stages()
+    assert stats.name == "projection.feed"
+    assert stats.calls == 3
+    assert stats.events == 15
+    assert stats.bytes == 300
+    assert stats.seconds >= 0.0
+
+
+def test_profile_json_is_machine_readable() -> None:
+    profiler = Profiler(enabled=True)
+    profiler.record("http.decode", 0.5, events=1000, nbytes=2048)
+    data = json.loads(profiler.to_json())
+    (stage,) = data["stages"]
+    assert stage == {
+        "stage": "http.decode",
+        "calls": 1,
+        "wall_ms": 500.0,
+        "events": 1000,
+        "bytes": 2048,
+        "events_per_sec": 2000.0,
+    }
+    assert "http.decode" in profiler.render()
+
+
+def test_http_client_requests_are_profiled() -> None:
+    profiler = get_profiler()
+    profiler.enable()
+    try:
+        client = HttpGatewayClient(base_url="http://localhost:8010")
+        with patch.object(httpx.Client, "get") as mock_get:
+            mock_get.return_value.json.return_value = {"events": [{"index": 1}, {"index": 2}]}
+            mock_get.return_value.content = b'{"events": [{"index": 1}, {"index": 2}]}'
+            client.fetch_events()
+        stages = {s.name: s for s in profiler.stages()}
+        assert stages["http.request"].calls == 1
+        assert stages["http.request"].bytes == len(mock_get.return_value.content)
+        assert stages["http.decode"].events == 2
+    finally:
+        profiler.enabled = False
+        profiler.reset()
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import functools
+import random
+
+import pytest
+
+from dbl_operator.parallel import run_parallel
+from dbl_operator.projections.base import Projection
+from dbl_operator.projections.decision_stats import DecisionStatsProjection
+from dbl_operator.projections.failures import FailureTaxonomyProjection
+from dbl_operator.projections.integrity import IntegrityProjection
+from dbl_operator.projections.latency import LatencyProjection
+from dbl_operator.projections.partitioned import PartitionedProjection
+from dbl_operator.projections.policy_map import PolicyMapProjection
+
+
+def _ledger(rng: random.Random, turns: int = 40) -> list[dict]:
+    """Interleaved turns with gaps, denies, errors and policy rollouts."""
+    events: list[dict] = []
+    policy = ("p1", "v1")
+    for t in range(turns):
+        if rng.random() < 0.1:
+            policy = (rng.choice(["p1", "p2"]), rng.choice(["v1", "v2"]))
+        turn_id = f"turn-{t}"
+        second = t * 3
+        lane = rng.choice(["fast", "slow"])
+        kinds = ["INTENT", "DECISION", "EXECUTION"]
+        if rng.random() < 0.2:
+            kinds = kinds[: rng.randint(0, 2)] or ["EXECUTION"]
+        decision = rng.choice(["ALLOW", "ALLOW", "DENY"])
+        for step, kind in enumerate(kinds):
+            payload: dict = {}
+            if kind == "DECISION":
+                payload = {
+                    "decision": decision,
+                    "policy_id": policy[0],
+                    "policy_version": policy[1],
+                    "reason_codes": [rng.choice(["ok", "quota", "scope"])],
+                }
+            elif kind == "EXECUTION" and rng.random() < 0.2:
+                payload = {"error": {"code": rng.choice(["timeout", "crash"])}}
+            events.append({
+                "turn_id": turn_id,
+                "kind": kind,
+                "intent_type": rng.choice(["chat", "tool"]),
+                "stream_id": "orders",
+                "lane": lane,
+                "timestamp": f"2026-01-01T00:{(second + step * rng.randint(1, 2)) // 60:02d}:"
+                f"{(second + step * rng.randint(1, 2)) % 60:02d}.{rng.randint(0, 999):03d}Z",
+                "payload": payload,
+            })
+    # Deliver interleaved, then assign ledger indices in delivery order
+    rng.shuffle(events)
+    events.sort(key=lambda e: e["timestamp"])
+    for i, event in enumerate(events):
+        event["index"] = i + 1
+    return events
+
+
+def _single_pass(factory, events):
+    projection = factory()
+    for event in events:
+        projection.feed(event)
+    return projection
+
+
+def _random_shards(rng: random.Random, events: list[dict], count: int) -> list[list[dict]]:
+    shards: list[list[dict]] = [[] for _ in range(count)]
+    for event in events:
+        shards[rng.randrange(count)].append(event)
+    return shards
+
+
+def _contiguous_shards(rng: random.Random, events: list[dict], count: int) -> list[list[dict]]:
+    cuts = sorted(rng.sample(range(1, len(events)), count - 1))
+    bounds = [0, *cuts, len(events)]
+    return [events[a:b] for a, b in zip(bounds, bounds[1:])]
+
+
+def _merged(factory, shards):
+    parts = [_single_pass(factory, shard) for shard in shards]
+    result = parts[0]
+    for part in parts[1:]:
+        result.merge(part)
+    return result
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [
+        IntegrityProjection,
+        LatencyProjection,
+        DecisionStatsProjection,
+        FailureTaxonomyProjection,
+        lambda: PartitionedProjection(DecisionStatsProjection),
+    ],
+)
+@pytest.mark.parametrize("seed", range(20))
+def test_merge_of_random_shards_matches_single_pass(factory, seed: int) -> None:
+    rng = random.Random(seed)
+    events = _ledger(rng)
+    shards = _random_shards(rng, events, rng.randint(2, 5))
+    assert _merged(factory, shards).render() == _single_pass(factory, events).render()
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_policy_map_merge_of_contiguous_shards_matches_single_pass(seed: int) -> None:
+    rng = random.Random(seed)
+    events = _ledger(rng)
+    shards = _contiguous_shards(rng, events, rng.randint(2, 5))
+    expected = _single_pass(PolicyMapProjection, events).render()
+    assert _merged(PolicyMapProjection, shards).render() == expected
+
+
+def test_policy_map_rejects_out_of_order_shards() -> None:
+    events = _ledger(random.Random(1))
+    early = _single_pass(PolicyMapProjection, events[:10])
+    late = _single_pass(PolicyMapProjection, events[10:])
+    with pytest.raises(ValueError):
+        late.merge(early)
+
+
+def test_render_is_repeatable() -> None:
+    events = _ledger(random.Random(2))
+    for factory in (PolicyMapProjection, FailureTaxonomyProjection):
+        projection = _single_pass(factory, events)
+        assert projection.render() == projection.render()
+
+
+def test_integrity_orders_turns_with_missing_and_string_indices() -> None:
+    shards = [
+        [
+            {"index": "7", "kind": "INTENT", "turn_id": "late"},
+            {"kind": "INTENT", "turn_id": "unindexed"},
+            {"index": "2", "kind": "INTENT", "turn_id": "early"},
+        ],
+        [{"index": 5, "kind": "INTENT", "turn_id": "middle"}],
+    ]
+    merged = _merged(IntegrityProjection, shards)
+    assert [r["turn_id"] for r in merged.records() if r["record"] == "turn"] == ["unindexed", "early", "middle", "late"]
+    assert merged.render() == _single_pass(IntegrityProjection, shards[0] + shards[1]).render()
+
+
+def test_merge_rejects_other_projection_types() -> None:
+    with pytest.raises(TypeError):
+        LatencyProjection().merge(IntegrityProjection())
+
+
+class _Counting(Projection):
+    """A projection without merge support."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def feed(self, event: dict) -> None:
+        self.count += 1
+
+    def render(self) -> str:
+        return str(self.count)
+
+    def records(self):
+        yield {"record": "count", "count": self.count}
+
+
+def test_unmergeable_projection_is_rejected_with_type_error() -> None:
+    with pytest.raises(TypeError, match="_Counting does not support merge"):
+        _Counting().merge(_Counting())
+    with pytest.raises(TypeError, match="does not support merge"):
+        PartitionedProjection(_Counting).merge(PartitionedProjection(_Counting))
+    events = [{"index": i, "turn_id": f"turn-{i}"} for i in range(20)]
+    with pytest.raises(TypeError, match="several workers"):
+        run_parallel(_Counting, events, 2, min_events_per_worker=1)
+    assert run_parallel(_Counting, events, 1).render() == "20"
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_grouped_latency_merge_matches_single_pass(seed: int) -> None:
+    rng = random.Random(seed)
+    events = _ledger(rng)
+    factory = functools.partial(LatencyProjection, group_by=("intent_type", "policy", "lane"))
+    shards = _random_shards(rng, events, rng.randint(2, 5))
+    assert _merged(factory, shards).render() == _single_pass(factory, events).render()
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import gzip
+import json
+import lzma
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from dbl_operator.recorder import SegmentRecorder, load_index
+
+_OPENERS = {"none": open, "gzip": gzip.open, "xz": lzma.open}
+
+
+def _events(start: int, count: int) -> list[dict]:
+    return [
+        {"index": i, "kind": "INTENT", "thread_id": "t-1", "timestamp": f"2026-01-01T00:00:{i:02d}Z", "payload": {"n": i}}
+        for i in range(start, start + count)
+    ]
+
+
+def _read_back(directory: Path, compression: str) -> list[dict]:
+    events = []
+    for entry in load_index(directory):
+        with _OPENERS[compression](directory / entry["file"], "rt", encoding="utf-8") as fh:
+            events.extend(json.loads(line) for line in fh)
+    return events
+
+
+@pytest.mark.parametrize("compression", ["none", "gzip", "xz"])
+def test_segments_rotate_by_size_and_round_trip(tmp_path: Path, compression: str) -> None:
+    recorder = SegmentRecorder(tmp_path, max_bytes=400, compression=compression)
+    events = _events(0, 20)
+    assert list(recorder.tee(events)) == events
+    recorder.close()
+
+    index = load_index(tmp_path)
+    assert len(index) > 1
+    assert all(entry["closed"] for entry in index)
+    assert sum(entry["events"] for entry in index) == 20 == recorder.events
+    assert index[0]["min_index"] == 0 and index[-1]["max_index"] == 19
+    assert index[0]["min_timestamp"] == "2026-01-01T00:00:00Z"
+    # Segments cover consecutive, non-overlapping index ranges
+    for a, b in zip(index, index[1:]):
+        assert b["min_index"] == a["max_index"] + 1
+    assert _read_back(tmp_path, compression) == events
+
+
+def test_recording_continues_an_existing_directory(tmp_path: Path) -> None:
+    first = SegmentRecorder(tmp_path)
+    for event in _events(0, 3):
+        first.record(event)
+    first.close()
+    second = SegmentRecorder(tmp_path)
+    for event in _events(3, 3):
+        second.record(event)
+    second.close()
+
+    assert [entry["file"] for entry in load_index(tmp_path)] == ["segment-000001.ndjson", "segment-000002.ndjson"]
+    assert [e["index"] for e in _read_back(tmp_path, "none")] == list(range(6))
+
+
+def test_group_commit_makes_events_durable_without_close(tmp_path: Path) -> None:
+    recorder = SegmentRecorder(tmp_path, fsync_secs=0.05)
+    for event in _events(0, 5):
+        recorder.record(event)
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline and sum(e["events"] for e in load_index(tmp_path)) < 5:
+        time.sleep(0.02)
+    (entry,) = load_index(tmp_path)
+    assert (entry["events"], entry["closed"]) == (5, False)
+    assert len(_read_back(tmp_path, "none")) == 5
+    recorder.close()
+
+
+def test_segments_rotate_by_age(tmp_path: Path) -> None:
+    recorder = SegmentRecorder(tmp_path, max_secs=0.05)
+    recorder.record(_events(0, 1)[0])
+    time.sleep(0.15)
+    recorder.record(_events(1, 1)[0])
+    recorder.close()
+    assert [entry["events"] for entry in load_index(tmp_path)] == [1, 1]
+
+
+def test_write_errors_stop_recording_but_not_the_stream(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    recorder = SegmentRecorder(tmp_path)
+
+    def broken(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(recorder, "_open", broken)
+    events = _events(0, 3)
+    assert list(recorder.tee(events)) == events
+    recorder.close()
+    assert isinstance(recorder.error, OSError)
+
+
+def test_backlog_is_bounded_and_blocks_instead_of_dropping(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    recorder = SegmentRecorder(tmp_path, max_pending=2)
+    disk = threading.Event()
+    write = recorder._write
+
+    def slow_write(event: dict) -> None:
+        assert disk.wait(timeout=5)
+        write(event)
+
+    monkeypatch.setattr(recorder, "_write", slow_write)
+    events = _events(0, 6)
+    # The writer takes the first event and is then stuck on the disk
+    recorder.record(events[0])
+    deadline = time.monotonic() + 5
+    while recorder.pending and time.monotonic() < deadline:
+        time.sleep(0.01)
+    producer = threading.Thread(target=lambda: [recorder.record(e) for e in events[1:]])
+    producer.start()
+    while not recorder.blocked and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert recorder.blocked == 1 and recorder.pending == 2
+    disk.set()
+    producer.join(timeout=5)
+    recorder.close()
+    assert recorder.pending == 0
+    assert _read_back(tmp_path, "none") == events
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from dbl_operator.recorder import SegmentRecorder, load_index
+from dbl_operator.replay import ReplayGatewayClient, iter_recording, recording_files
+from dbl_operator.tail_stream import ResumableTail
+
+
+def _events(start: int, count: int) -> list[dict]:
+    return [
+        {
+            "index": i,
+            "kind": "INTENT",
+            "thread_id": f"t-{i % 2}",
+            "turn_id": f"turn-{i}",
+            "timestamp": f"2026-01-01T00:00:{i:02d}Z",
+            "payload": {"n": i},
+        }
+        for i in range(start, start + count)
+    ]
+
+
+def _record(directory: Path, events: list[dict], **kwargs) -> None:
+    recorder = SegmentRecorder(directory, **kwargs)
+    for event in events:
+        recorder.record(event)
+    recorder.close()
+
+
+@pytest.mark.parametrize("compression", ["none", "gzip", "xz"])
+def test_recording_round_trips(tmp_path: Path, compression: str) -> None:
+    events = _events(0, 20)
+    _record(tmp_path, events, max_bytes=400, compression=compression)
+    assert list(iter_recording(tmp_path)) == events
+
+
+def test_seek_skips_segments_before_the_position(tmp_path: Path) -> None:
+    _record(tmp_path, _events(0, 20), max_bytes=400)
+    segments = load_index(tmp_path)
+    assert len(segments) > 2
+
+    files = recording_files(tmp_path, from_index=15)
+    assert files[0].name == next(s["file"] for s in segments if s["max_index"] >= 15)
+    assert len(files) < len(segments)
+    assert [e["index"] for e in iter_recording(tmp_path, from_index=15)] == list(range(15, 20))
+    assert [e["index"] for e in iter_recording(tmp_path, from_time="2026-01-01T00:00:12Z")] == list(range(12, 20))
+
+
+def test_plain_files_and_json_arrays(tmp_path: Path) -> None:
+    (tmp_path / "b.json").write_text(json.dumps(_events(3, 2)), encoding="utf-8")
+    lines = "\n".join(json.dumps(e) for e in _events(0, 3)) + '\n{"index": 9, "ki'
+    (tmp_path / "a.ndjson").write_text(lines, encoding="utf-8")
+    # Torn trailing line is ignored, files are read in name order
+    assert [e["index"] for e in iter_recording(tmp_path)] == [0, 1, 2, 3, 4]
+
+
+def test_missing_recording_fails_early(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        ReplayGatewayClient(tmp_path / "nope")
+
+
+def test_unparseable_from_time_is_rejected(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    from dbl_operator import app_cli
+
+    _record(tmp_path, _events(0, 3))
+    with pytest.raises(ValueError, match="ISO-8601"):
+        ReplayGatewayClient(tmp_path, from_time="yesterday")
+    monkeypatch.setattr(sys, "argv", ["dbl-operator", "replay", str(tmp_path), "--from-time", "2026-13-01"])
+    with pytest.raises(SystemExit) as exc:
+        app_cli.main()
+    assert exc.value.code == 1
+    assert "'2026-13-01'" in capsys.readouterr().err
+
+
+def test_views_and_snapshots_read_the_whole_recording(tmp_path: Path) -> None:
+    _record(tmp_path, _events(0, 10))
+    client = ReplayGatewayClient(tmp_path, from_index=8)
+    assert client.get_status() == {"t_index": 9}
+    assert [e["index"] for e in client.fetch_events(limit=3, offset=4)] == [4, 5, 6]
+    assert len(client.get_audit("t-0")) == 5
+    with pytest.raises(RuntimeError):
+        client.send_intent(None, "c-1")  # type: ignore[arg-type]
+
+
+def test_tail_plays_from_the_seek_position_after_a_backlog(tmp_path: Path) -> None:
+    _record(tmp_path, _events(0, 10))
+    client = ReplayGatewayClient(tmp_path, from_index=6)
+    assert [e["index"] for e in client.tail(backlog=2)] == [4, 5, 6, 7, 8, 9]
+    # Resuming continues after the last index seen
+    assert [e["index"] for e in client.tail(since=7)] == [8, 9]
+
+
+def test_speed_paces_by_event_timestamps(tmp_path: Path) -> None:
+    _record(tmp_path, _events(0, 3))
+    start = time.monotonic()
+    assert len(list(ReplayGatewayClient(tmp_path, speed=10.0).tail())) == 3
+    # Two seconds of recording at 10x
+    assert 0.15 <= time.monotonic() - start < 1.5
+
+    start = time.monotonic()
+    assert len(list(ReplayGatewayClient(tmp_path, speed=0).tail())) == 3
+    assert time.monotonic() - start < 0.15
+
+
+def test_resumable_tail_ends_with_the_recording(tmp_path: Path) -> None:
+    _record(tmp_path, _events(0, 5))
+    tail = ResumableTail(ReplayGatewayClient(tmp_path), stop_event=threading.Event())
+    assert [e["index"] for e in tail] == [0, 1, 2, 3, 4]
+    assert tail.reconnects == 0
+
+
+def test_replay_command_runs_the_tail_pipeline(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    from dbl_operator import app_cli
+
+    _record(tmp_path, _events(0, 6))
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["dbl-operator", "replay", str(tmp_path), "--speed", "0", "--from-index", "2", "--format", "ndjson"],
+    )
+    app_cli.main()
+    out = capsys.readouterr()
+    assert [json.loads(line)["index"] for line in out.out.splitlines()] == [2, 3, 4, 5]
+    assert "4 events received" in out.err
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import argparse
+
+import pytest
+
+from dbl_operator.app_cli import _sample_rate
+from dbl_operator.projections.decision_stats import DecisionStatsProjection
+from dbl_operator.projections.partitioned import PartitionedProjection
+from dbl_operator.sampling import Sampler
+
+
+def _events(threads: int) -> list[dict]:
+    events = []
+    for t in range(threads):
+        for kind in ("INTENT", "DECISION", "EXECUTION"):
+            events.append({
+                "thread_id": f"thread-{t}",
+                "turn_id": f"turn-{t}",
+                "kind": kind,
+                "lane": "a",
+                "payload": {"decision": "ALLOW", "policy_id": "p", "reason_codes": ["ok"]},
+            })
+    return events
+
+
+def test_sampling_is_deterministic_and_keeps_threads_together() -> None:
+    events = _events(2000)
+    kept = [e for e in events if Sampler(0.1).keep(e)]
+    assert kept == [e for e in events if Sampler(0.1).keep(e)]
+    per_thread: dict[str, int] = {}
+    for event in kept:
+        per_thread[event["thread_id"]] = per_thread.get(event["thread_id"], 0) + 1
+    assert set(per_thread.values()) == {3}
+    assert 150 < len(per_thread) < 250
+
+
+def test_sample_by_thread_falls_back_to_turn_and_rejects_bad_rates() -> None:
+    sampler = Sampler(0.5, by="thread")
+    assert sampler.key({"turn_id": "t1"}) == "t1"
+    assert Sampler(1.0).keep({})
+    with pytest.raises(ValueError):
+        Sampler(0.0)
+    with pytest.raises(ValueError):
+        Sampler(0.5, by="lane")
+
+
+def test_sampled_projection_scales_counts_and_says_so() -> None:
+    projection = PartitionedProjection(DecisionStatsProjection)
+    for event in _events(3):
+        projection.feed(event)
+    projection.sampler = Sampler(0.25)
+    output = projection.render()
+    assert "Sampled: 25% of threads (counts scaled x4)" in output
+    assert "ok                            : 12" in output
+
+
+def test_merge_rejects_different_sample_rates() -> None:
+    a, b = DecisionStatsProjection(), DecisionStatsProjection()
+    a.sampler = Sampler(0.5)
+    with pytest.raises(ValueError):
+        a.merge(b)
+
+
+def test_cli_sample_rate_validation() -> None:
+    assert _sample_rate("0.25") == 0.25
+    for bad in ("0", "1.5", "x"):
+        with pytest.raises(argparse.ArgumentTypeError):
+            _sample_rate(bad)
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import random
+from collections import Counter
+
+from dbl_operator.projections.decision_stats import DecisionStatsProjection
+from dbl_operator.sketches import HyperLogLog, QuantileSketch, SpaceSaving
+
+
+def _zipf_stream(rng: random.Random, n: int, universe: int) -> list[str]:
+    weights = [1.0 / (rank + 1) for rank in range(universe)]
+    return [f"code-{i}" for i in rng.choices(range(universe), weights=weights, k=n)]
+
+
+def test_space_saving_bounds_hold() -> None:
+    stream = _zipf_stream(random.Random(3), 20_000, 5_000)
+    sketch = SpaceSaving(50)
+    for item in stream:
+        sketch.add(item)
+    truth = Counter(stream)
+    assert len(sketch) == 50
+    for item, count, error in sketch.top():
+        assert count - error <= truth[item] <= count
+    # Everything above total/capacity must be present
+    present = {hit.item for hit in sketch.top()}
+    assert {item for item, c in truth.items() if c > sketch.error_bound} <= present
+    assert sketch.top(1)[0].item == "code-0"
+
+
+def test_space_saving_merge_keeps_bounds() -> None:
+    rng = random.Random(4)
+    a_stream, b_stream = _zipf_stream(rng, 10_000, 2_000), _zipf_stream(rng, 10_000, 2_000)
+    a, b = SpaceSaving(40), SpaceSaving(40)
+    for item in a_stream:
+        a.add(item)
+    for item in b_stream:
+        b.add(item)
+    a.merge(b)
+    truth = Counter(a_stream) + Counter(b_stream)
+    assert a.total == 20_000
+    for item, count, error in a.top():
+        assert count - error <= truth[item] <= count
+
+
+def test_hyperloglog_estimate_within_error() -> None:
+    for n in (100, 50_000):
+        sketch = HyperLogLog(12)
+        for i in range(n):
+            sketch.add(f"thread-{i}")
+        sketch.add("thread-0")
+        assert abs(sketch.estimate() - n) <= 4 * sketch.relative_error * n + 2
+
+
+def test_hyperloglog_merge_is_union() -> None:
+    a, b = HyperLogLog(10), HyperLogLog(10)
+    for i in range(3000):
+        (a if i % 2 else b).add(str(i))
+        if i < 1000:
+            a.add(str(i))
+    a.merge(b)
+    assert abs(a.estimate() - 3000) < 3000 * 0.15
+
+
+def test_approximate_stats_render_with_bounds() -> None:
+    projection = DecisionStatsProjection(approx=True, capacity=8)
+    rng = random.Random(5)
+    for i in range(2000):
+        projection.feed({
+            "kind": "DECISION",
+            "thread_id": f"thread-{i % 300}",
+            "turn_id": f"turn-{i}",
+            "intent_type": rng.choice(["chat", "tool"]),
+            "payload": {
+                "decision": rng.choice(["ALLOW", "DENY"]),
+                "policy_id": "p1",
+                "reason_codes": [f"r-{rng.randint(0, 50)}"],
+            },
+        })
+    output = projection.render()
+    assert "Decisions: 2000" in output
+    assert "Distinct (HyperLogLog" in output
+    assert len(projection.reason_sketch) == 8
+    threads = int(output.split("threads")[1].split("~")[1].split()[0])
+    assert abs(threads - 300) < 30
+
+
+def test_quantile_sketch_relative_accuracy_and_merge() -> None:
+    rng = random.Random(6)
+    values = [rng.lognormvariate(5, 1.5) for _ in range(5000)]
+    whole, a, b = QuantileSketch(), QuantileSketch(), QuantileSketch()
+    for i, value in enumerate(values):
+        whole.add(value)
+        (a if i % 3 else b).add(value)
+    a.merge(b)
+    exact = sorted(values)
+    for q in (0.5, 0.95, 0.99):
+        truth = exact[int(len(exact) * q)]
+        assert abs(whole.quantile(q) - truth) <= 0.01 * truth + 1e-9
+        assert a.quantile(q) == whole.quantile(q)
+    assert QuantileSketch().quantile(0.5) == 0.0
+
+
+def test_approximate_matrix_does_not_invent_missing_cells() -> None:
+    projection = DecisionStatsProjection(approx=True, capacity=2)
+    decisions = [("p1", "chat", "ALLOW")] * 5 + [("p2", "tool", "DENY")] * 3 + [("p3", "tool", "DENY")]
+    for pid, itype, result in decisions:
+        projection.feed({"kind": "DECISION", "intent_type": itype, "payload": {"decision": result, "policy_id": pid}})
+    rows = {(r["policy_id"], r["intent_type"]): r for r in projection.records() if r.get("record") == "matrix"}
+    p1 = rows[("p1", "chat")]
+    # p1 was only ever allowed: its DENY cell is not listed, and the rate is exact
+    assert (p1["allow"], p1["deny"], p1["allow_rate_pct"]) == (5, None, 100.0)
+    assert p1["deny_max"] == projection.matrix_sketch.min_count
+    line = next(line for line in projection.render().splitlines() if line.startswith("p1 "))
+    assert f"<={p1['deny_max']}" in line and "100.0" in line
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import pytest
+
+from dbl_operator.ansi_colors import ColorMode
+from dbl_operator.tail_aggregate import TailAggregator, parse_aggregate
+from dbl_operator.tail_presenter import render_tail_summary
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _event(kind: str = "INTENT", thread_id: str = "t-1", result: str | None = None, reason: str | None = None) -> dict:
+    payload: dict = {}
+    if result:
+        payload["decision"] = result
+    if reason:
+        payload["reason_codes"] = [reason]
+    return {"kind": kind, "thread_id": thread_id, "payload": payload}
+
+
+def test_parse_aggregate() -> None:
+    assert parse_aggregate("auto") == (1.0, True)
+    assert parse_aggregate("5s") == (5.0, False)
+    assert parse_aggregate("0.5") == (0.5, False)
+    for bad in ("fast", "0s", "-1s"):
+        with pytest.raises(ValueError):
+            parse_aggregate(bad)
+
+
+def test_auto_mode_switches_on_bursts_and_back_when_calm() -> None:
+    clock = _Clock()
+    agg = TailAggregator(1.0, adaptive=True, threshold=10, clock=clock)
+
+    clock.now = 0.1
+    assert all(agg.observe(_event()) for _ in range(5))
+    clock.now = 0.5
+    printed = [agg.observe(_event()) for _ in range(20)]
+    # The line budget of one interval is printed, the rest of the burst is counted
+    assert printed.count(True) == 5 and agg.aggregating
+
+    clock.now = 1.0
+    (summary,) = agg.drain()
+    # Counting began with the switch at 0.5s, so the rate covers only that half
+    assert (summary.count, summary.seconds, summary.rate) == (15, 0.5, 30.0)
+    assert agg.aggregating
+
+    clock.now = 1.5
+    assert not agg.observe(_event())
+    clock.now = 2.0
+    assert [s.count for s in agg.drain()] == [1]
+    assert not agg.aggregating
+    clock.now = 2.1
+    assert agg.observe(_event())
+
+
+def test_idle_gap_resumes_per_event_output() -> None:
+    clock = _Clock()
+    agg = TailAggregator(1.0, threshold=1, clock=clock)
+    for _ in range(5):
+        agg.observe(_event())
+    assert agg.aggregating
+    clock.now = 10.0
+    assert agg.observe(_event())
+    assert [s.count for s in agg.drain()] == [4]
+
+
+def test_fixed_interval_summarizes_every_event() -> None:
+    clock = _Clock()
+    agg = TailAggregator(5.0, adaptive=False, clock=clock)
+    events = (
+        [_event("INTENT", "t-1")] * 3
+        + [_event("DECISION", "t-2", "DENY", "quota")] * 2
+        + [_event("DECISION", "t-1", "ALLOW", "ok"), _event("EXECUTION", "t-3")]
+    )
+    assert not any(agg.observe(e) for e in events)
+    assert agg.drain() == []
+    clock.now = 2.0
+    (summary,) = agg.finish()
+    assert summary.kinds == {"INTENT": 3, "DECISION": 3, "EXECUTION": 1}
+    assert (summary.allow, summary.deny) == (1, 2)
+    line = render_tail_summary(summary, ColorMode(enabled=False), top=2)
+    assert line == (
+        "[2.0s] 7 events (4/s)  |  DECISION 3  EXECUTION 1  INTENT 3  |  ALLOW 1  DENY 2  |  "
+        "threads: t-1 4, t-2 2  |  reasons: quota 2, ok 1"
+    )
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import itertools
+import threading
+from typing import Any
+
+import pytest
+
+from dbl_operator.http_gateway_client import HttpGatewayClient
+
+
+class _Gateway:
+    """Ledger of ``size`` events with a scripted live stream."""
+
+    def __init__(self, size: int, live: list[int], *, fail_live: bool = False) -> None:
+        self.size = size
+        self.live = live
+        self.fail_live = fail_live
+        self.subscribed = threading.Event()
+        self.snapshots: list[dict[str, Any]] = []
+        self.closed = threading.Event()
+
+    def event(self, idx: int) -> dict[str, Any]:
+        return {"index": idx, "kind": "INTENT", "turn_id": f"turn-{idx}"}
+
+    def get_json(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        if path == "/status":
+            return {"t_index": self.size - 1}
+        # The backlog only completes once the live subscription is open,
+        # which proves both were in flight at the same time
+        assert self.subscribed.wait(timeout=5)
+        self.snapshots.append(dict(params or {}))
+        offset, limit = params["offset"], params["limit"]
+        return {"events": [self.event(i) for i in range(offset, min(offset + limit, max(self.live, default=0) + 1))]}
+
+    def tail_events(self, since, on_open=None):
+        assert since is None
+        if on_open is not None:
+            # Stands in for the HTTP client the feed closes on hang-up
+            on_open(self)
+        self.subscribed.set()
+        for idx in self.live:
+            yield self.event(idx)
+        if self.fail_live:
+            raise ConnectionError("reset by peer")
+        # Stay subscribed like a real stream until the consumer hangs up
+        self.closed.wait(timeout=5)
+
+    def close(self) -> None:
+        self.closed.set()
+
+
+@pytest.fixture
+def patch_gateway(monkeypatch: pytest.MonkeyPatch):
+    def install(gateway: _Gateway) -> HttpGatewayClient:
+        monkeypatch.setattr(HttpGatewayClient, "_get_json", lambda self, path, params=None: gateway.get_json(path, params))
+        monkeypatch.setattr(HttpGatewayClient, "_tail_events", lambda self, since, on_open=None: gateway.tail_events(since, on_open))
+        return HttpGatewayClient("http://gw")
+    return install
+
+
+def _indices(client: HttpGatewayClient, count: int, backlog: int = 3) -> list[int]:
+    stream = client.tail(backlog=backlog)
+    seen = [event["index"] for event in itertools.islice(stream, count)]
+    stream.close()
+    return seen
+
+
+def test_live_events_overlapping_the_backlog_are_deduplicated(patch_gateway) -> None:
+    gateway = _Gateway(size=10, live=[8, 9, 10, 11])
+    client = patch_gateway(gateway)
+    assert _indices(client, 5) == [7, 8, 9, 10, 11]
+    assert gateway.snapshots == [{"limit": 3, "offset": 7}]
+
+
+def test_gap_between_backlog_and_live_stream_is_fetched(patch_gateway) -> None:
+    gateway = _Gateway(size=10, live=[12, 13])
+    client = patch_gateway(gateway)
+    assert _indices(client, 7) == [7, 8, 9, 10, 11, 12, 13]
+    assert gateway.snapshots[-1] == {"limit": 2, "offset": 10}
+
+
+def test_closing_the_stream_closes_the_live_subscription(patch_gateway) -> None:
+    gateway = _Gateway(size=10, live=[10])
+    client = patch_gateway(gateway)
+    assert _indices(client, 4) == [7, 8, 9, 10]
+    assert gateway.closed.wait(timeout=5)
+
+
+def test_live_errors_reach_the_consumer(patch_gateway) -> None:
+    gateway = _Gateway(size=10, live=[10], fail_live=True)
+    client = patch_gateway(gateway)
+    stream = client.tail(backlog=3)
+    assert [next(stream)["index"] for _ in range(4)] == [7, 8, 9, 10]
+    with pytest.raises(ConnectionError):
+        next(stream)
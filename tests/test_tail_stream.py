@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import contextlib
+import threading
+
+import httpx
+import pytest
+
+from dbl_operator.http_gateway_client import HttpGatewayClient
+from dbl_operator.tail_stream import BackfillingTail, BufferedTail, DropSummary, ResumableTail, TailStalled
+
+
+class FlakyTailClient:
+    """Stand-in gateway: drops the first connection after two events."""
+
+    def __init__(self) -> None:
+        self.calls: list[int | None] = []
+
+    def tail(self, since: int | None = None, backlog: int | None = None):
+        self.calls.append(since)
+        start = 0 if since is None else since + 1
+        for idx in range(start, 5):
+            if len(self.calls) == 1 and idx == 2:
+                raise ConnectionError("reset by peer")
+            yield {"index": idx, "kind": "INTENT"}
+
+
+def test_resumable_tail_resumes_after_last_index() -> None:
+    client = FlakyTailClient()
+    stop = threading.Event()
+    disconnects = []
+    stream = ResumableTail(
+        client,
+        stop_event=stop,
+        initial_delay=0.0,
+        on_disconnect=lambda exc, delay: disconnects.append(str(exc)),
+    )
+    seen = []
+    for event in stream:
+        seen.append(event["index"])
+        if event["index"] == 4:
+            stop.set()
+    assert seen == [0, 1, 2, 3, 4]
+    assert client.calls == [None, 1]
+    assert disconnects == ["reset by peer"]
+    assert stream.reconnects == 1
+
+
+def test_empty_stream_backs_off_instead_of_spinning() -> None:
+    class EmptyClient:
+        calls = 0
+
+        def tail(self, since=None, backlog=None):
+            EmptyClient.calls += 1
+            return iter(())
+
+    stop = threading.Event()
+    timer = threading.Timer(0.3, stop.set)
+    timer.start()
+    assert list(ResumableTail(EmptyClient(), stop_event=stop, initial_delay=0.05)) == []
+    timer.join()
+    assert EmptyClient.calls < 10
+
+
+class _LedgerClient:
+    """Snapshot reads over indices 0..99; records every backfill request."""
+
+    def __init__(self, missing: set[int] = frozenset()) -> None:
+        self.missing = missing
+        self.fetches: list[tuple[int, int]] = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def fetch_events(self, limit: int = 1000, *, offset: int | None = None, **filters):
+        self.fetches.append((offset, limit))
+        assert self.release.wait(timeout=5)
+        return [{"index": i, "kind": "INTENT"} for i in range(offset, offset + limit) if i not in self.missing]
+
+
+def _backfilled(indices, client, **kwargs):
+    stream = BackfillingTail(({"index": i, "kind": "INTENT"} for i in indices), client, **kwargs)
+    return [event["index"] for event in stream], stream
+
+
+def test_backfill_splices_missing_ranges_in_order() -> None:
+    client = _LedgerClient()
+    seen, stream = _backfilled([0, 1, 4, 5, 9, 8, 10], client)
+    assert seen == [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    assert sorted(client.fetches) == [(2, 2), (6, 3)]
+    assert (stream.gaps_detected, stream.gaps_repaired, stream.events_backfilled) == (2, 2, 5)
+
+
+def test_backfill_keeps_reading_while_a_gap_is_fetched() -> None:
+    client = _LedgerClient()
+    client.release.clear()
+    read = []
+
+    def live():
+        for i in (0, 3, 4, 5):
+            read.append(i)
+            yield {"index": i}
+        # Only lets the backfill finish once later live events were consumed
+        client.release.set()
+
+    stream = BackfillingTail(live(), client)
+    assert [e["index"] for e in stream] == [0, 1, 2, 3, 4, 5]
+    assert read == [0, 3, 4, 5]
+
+
+def test_unrecoverable_gap_is_counted_but_not_repaired() -> None:
+    client = _LedgerClient(missing={2})
+    seen, stream = _backfilled([0, 1, 4, 200], client, max_gap=50)
+    assert seen == [0, 1, 3, 4, 200]
+    assert (stream.gaps_detected, stream.gaps_repaired) == (2, 0)
+    assert client.fetches == [(2, 2)]
+
+
+def test_backfill_tracks_fan_in_sources_separately() -> None:
+    sources = {"a": _LedgerClient(), "b": _LedgerClient()}
+    events = [{"index": 0, "origin": "a"}, {"index": 5, "origin": "b"}, {"index": 2, "origin": "a"}]
+    stream = BackfillingTail(iter(events), _LedgerClient(), source_of=sources.__getitem__)
+    assert [(e["origin"], e["index"]) for e in stream] == [("a", 0), ("b", 5), ("a", 1), ("a", 2)]
+    assert sources["a"].fetches == [(1, 1)] and sources["b"].fetches == []
+
+
+def test_stalled_subscription_reconnects_immediately() -> None:
+    class StallingClient:
+        calls: list[int | None] = []
+
+        def tail(self, since=None, backlog=None):
+            self.calls.append(since)
+            if len(self.calls) == 1:
+                yield {"index": 0}
+                raise TailStalled("no data or heartbeat for 45s")
+            yield {"index": 1}
+
+    stop = threading.Event()
+    delays: list[float] = []
+    recoveries: list[float] = []
+    stream = ResumableTail(
+        StallingClient(),
+        stop_event=stop,
+        # A regular disconnect would wait a minute; a stall must not
+        initial_delay=60.0,
+        on_disconnect=lambda exc, delay: delays.append(delay),
+        on_reconnect=recoveries.append,
+    )
+    seen = []
+    for event in stream:
+        seen.append(event["index"])
+        if event["index"] == 1:
+            stop.set()
+    assert seen == [0, 1]
+    assert StallingClient.calls == [None, 0]
+    assert delays == [0.0]
+    assert (stream.stalls, stream.reconnects) == (1, 1)
+    assert len(recoveries) == 1 and 0.0 <= recoveries[0] < 5.0
+
+
+def test_backoff_delays_are_jittered_below_the_ceiling() -> None:
+    stream = ResumableTail(FlakyTailClient(), jitter=0.5)
+    delays = {stream._jittered(8.0) for _ in range(50)}
+    assert all(4.0 <= d <= 8.0 for d in delays)
+    assert len(delays) > 1
+    assert ResumableTail(FlakyTailClient(), jitter=0.0)._jittered(8.0) == 8.0
+
+
+def test_http_tail_turns_a_read_deadline_into_a_stall(monkeypatch) -> None:
+    class Response:
+        def raise_for_status(self) -> None:
+            pass
+
+        def iter_lines(self):
+            yield ": ping"
+            yield 'data: {"index": 7}'
+            yield ": ping"
+            raise httpx.ReadTimeout("timed out")
+
+    monkeypatch.setattr(httpx.Client, "stream", lambda self, *a, **kw: contextlib.nullcontext(Response()))
+    client = HttpGatewayClient("http://gw", stall_timeout_secs=12.0)
+    deadlines = []
+    stream = client._tail_events(None, on_open=lambda http: deadlines.append(http.timeout.read))
+    assert next(stream) == {"index": 7}
+    with pytest.raises(TailStalled, match="12s"):
+        next(stream)
+    assert deadlines == [12.0]
+
+
+def _paused_producer(count: int):
+    """Yields event 0, waits until the consumer took it, then bursts the rest."""
+    took_first = threading.Event()
+    finished = threading.Event()
+
+    def events():
+        yield {"index": 0, "kind": "INTENT"}
+        assert took_first.wait(timeout=5)
+        for i in range(1, count):
+            yield {"index": i, "kind": "DECISION" if i % 2 else "INTENT"}
+        finished.set()
+
+    return events(), took_first, finished
+
+
+def _drain_after_burst(policy: str, capacity: int = 3):
+    events, took_first, finished = _paused_producer(10)
+    stream = BufferedTail(events, capacity=capacity, policy=policy)
+    it = iter(stream)
+    items = [next(it)]
+    took_first.set()
+    if policy != "block":
+        # A slow consumer: nothing is taken until the burst is over
+        assert finished.wait(timeout=5)
+    items.extend(it)
+    return items, stream
+
+
+def test_buffered_tail_block_policy_is_lossless() -> None:
+    items, stream = _drain_after_burst("block")
+    assert [e["index"] for e in items] == list(range(10))
+    assert (stream.dropped, stream.summarized) == (0, 0)
+    assert stream.max_depth <= 3
+
+
+def test_buffered_tail_drop_oldest_keeps_the_newest_events() -> None:
+    items, stream = _drain_after_burst("drop-oldest")
+    assert [e["index"] for e in items] == [0, 7, 8, 9]
+    assert stream.dropped == 6
+
+
+def test_buffered_tail_summarize_replaces_the_overflow_in_place() -> None:
+    items, stream = _drain_after_burst("summarize")
+    assert [e["index"] for e in items[:4]] == [0, 1, 2, 3]
+    summary = items[4]
+    assert isinstance(summary, DropSummary) and len(items) == 5
+    assert (summary.count, summary.first_index, summary.last_index) == (6, 4, 9)
+    assert summary.describe() == "6 events skipped (DECISION 3, INTENT 3), index 4..9"
+    assert stream.summarized == 6
+
+
+def test_buffered_tail_reraises_reader_errors_after_buffered_events() -> None:
+    def events():
+        yield {"index": 0}
+        raise ConnectionError("reset by peer")
+
+    it = iter(BufferedTail(events()))
+    assert next(it) == {"index": 0}
+    with pytest.raises(ConnectionError):
+        next(it)
+
+
+def test_buffered_tail_rejects_unknown_policy() -> None:
+    with pytest.raises(ValueError):
+        BufferedTail(iter(()), policy="drop-newest")